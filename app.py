@@ -1,495 +1,507 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
-from flask_socketio import SocketIO, emit
-from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from voice_chatbot import Raizel
-import pandas as pd
-import json
-import os
-import base64
-import tempfile
-from werkzeug.security import generate_password_hash, check_password_hash
-from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import speech_recognition as sr
-
-# Load environment variables
-load_dotenv()
-
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'default_secret_key')
-socketio = SocketIO(app, cors_allowed_origins="*")
-
-# Initialize Flask-Login
-login_manager = LoginManager()
-login_manager.init_app(app)
-login_manager.login_view = 'login'
-
-# User class for Flask-Login
-class User(UserMixin):
-    def __init__(self, id, registration_number):
-        self.id = id
-        self.registration_number = registration_number
-
-# User loader for Flask-Login
-@login_manager.user_loader
-def load_user(user_id):
-    try:
-        student_data = pd.read_csv('Students_Academic_Records.csv')
-        student = student_data[student_data['Registration_Number'] == user_id]
-        if not student.empty:
-            return User(
-                id=student.iloc[0]['Registration_Number'],
-                registration_number=student.iloc[0]['Registration_Number']
-            )
-        return None
-    except Exception as e:
-        print(f"Error loading user: {str(e)}")
-        return None
-
-# Initialize the chatbot
-raizel = Raizel()
-
-# Load student data
-def load_student_data():
-    try:
-        student_data = pd.read_csv('Students_Academic_Records.csv')
-        return student_data
-    except Exception as e:
-        print(f"Error loading student data: {str(e)}")
-        return None
-
-# Load tasks data
-def load_tasks_data():
-    try:
-        tasks_data = pd.read_csv('Academic_Calendar.csv')
-        return tasks_data
-    except Exception as e:
-        print(f"Error loading tasks data: {str(e)}")
-        return None
-
-# Load marks data
-def load_marks_data():
-    try:
-        marks_data = pd.read_csv('SubjectWise_Marks.csv')
-        return marks_data
-    except Exception as e:
-        print(f"Error loading marks data: {str(e)}")
-        return None
-
-# Load course details
-def load_course_details():
-    try:
-        course_data = pd.read_csv('Student_Course_Details.csv')
-        return course_data
-    except Exception as e:
-        print(f"Error loading course data: {str(e)}")
-        return None
-
-# Routes
-@app.route('/')
-def index():
-    if current_user.is_authenticated:
-        try:
-            # Load data for the current user
-            student_data = load_student_data()
-            tasks_data = load_tasks_data()
-            marks_data = load_marks_data()
-            course_data = load_course_details()
-            
-            # Get student profile
-            student_profile = student_data[student_data['Registration_Number'] == current_user.registration_number].iloc[0]
-            
-            # Get upcoming tasks (next 5)
-            upcoming_tasks = tasks_data.head(5).to_dict('records')
-            
-            # Get academic data (marks)
-            academic_data = []
-            if marks_data is not None:
-                student_marks = marks_data[marks_data['Registration_Number'] == current_user.registration_number]
-                if not student_marks.empty:
-                    # Get the latest semester's marks
-                    latest_semester = student_marks['Semester'].max()
-                    latest_marks = student_marks[student_marks['Semester'] == latest_semester]
-                    
-                    for _, row in latest_marks.iterrows():
-                        academic_data.append({
-                            'name': row['Subject'],
-                            'grade': row['Marks'],
-                            'status': 'Pass' if row['Marks'] >= 60 else 'Fail'
-                        })
-            
-            # Get course details
-            course_details = []
-            if course_data is not None:
-                student_courses = course_data[course_data['Registration_Number'] == current_user.registration_number]
-                if not student_courses.empty:
-                    for _, row in student_courses.iterrows():
-                        course_details.append({
-                            'department': row['Department'],
-                            'enrollment_year': row['Enrollment_Year'],
-                            'expected_graduation': row['Expected_Graduation']
-                        })
-            
-            return render_template('index.html', 
-                                  user=student_profile['Name'],
-                                  academic_data=academic_data,
-                                  tasks=upcoming_tasks,
-                                  course_details=course_details)
-        except Exception as e:
-            print(f"Error loading dashboard data: {str(e)}")
-            flash(f"Error loading dashboard data: {str(e)}")
-            return render_template('index.html', 
-                                  user=current_user.registration_number,
-                                  academic_data=[],
-                                  tasks=[],
-                                  course_details=[])
-    return redirect(url_for('login'))
-
-@app.route('/login', methods=['GET', 'POST'])
-def login():
-    if current_user.is_authenticated:
-        return redirect(url_for('index'))
-    
-    if request.method == 'POST':
-        registration_number = request.form.get('registration_number')
-        
-        try:
-            student_data = load_student_data()
-            if student_data is None:
-                flash('Error loading student data. Please try again later.')
-                return redirect(url_for('login'))
-            
-            student = student_data[student_data['Registration_Number'] == registration_number]
-            if student.empty:
-                flash('Invalid registration number.')
-                return redirect(url_for('login'))
-            
-            user = User(
-                id=student.iloc[0]['Registration_Number'],
-                registration_number=student.iloc[0]['Registration_Number']
-            )
-            login_user(user)
-            return redirect(url_for('index'))
-            
-        except Exception as e:
-            print(f"Login error: {str(e)}")
-            flash('An error occurred. Please try again later.')
-            return redirect(url_for('login'))
-    
-    return render_template('login.html')
-
-@app.route('/logout')
-@login_required
-def logout():
-    logout_user()
-    return redirect(url_for('login'))
-
-@app.route('/api/chat', methods=['POST'])
-@login_required
-def chat():
-    data = request.json
-    message = data.get('message', '')
-    
-    # Get response from chatbot
-    response = raizel.get_response(message)
-    
-    # If the response contains data-related keywords, fetch and format the data
-    if any(keyword in message.lower() for keyword in ['marks', 'grades', 'performance', 'courses', 'subjects']):
-        marks_data = load_marks_data()
-        course_data = load_course_details()
-        
-        if marks_data is not None and course_data is not None:
-            student_marks = marks_data[marks_data['Registration_Number'] == current_user.registration_number]
-            student_courses = course_data[course_data['Registration_Number'] == current_user.registration_number]
-            
-            if not student_marks.empty:
-                marks_info = student_marks.to_dict('records')
-                response += f"\n\nYour marks:\n{json.dumps(marks_info, indent=2)}"
-            
-            if not student_courses.empty:
-                courses_info = student_courses.to_dict('records')
-                response += f"\n\nYour courses:\n{json.dumps(courses_info, indent=2)}"
-    
-    return jsonify({'response': response})
-
-@app.route('/api/dashboard')
-@login_required
-def get_dashboard_data():
-    try:
-        print(f"Loading dashboard data for user: {current_user.registration_number}")
-        
-        # Load all required data
-        student_data = load_student_data()
-        tasks_data = load_tasks_data()
-        marks_data = load_marks_data()
-        course_data = load_course_details()
-        
-        # Check if data was loaded successfully
-        if student_data is None:
-            print("Error: Failed to load student data")
-            return jsonify({'error': 'Failed to load student data'})
-            
-        if tasks_data is None:
-            print("Error: Failed to load tasks data")
-            return jsonify({'error': 'Failed to load tasks data'})
-        
-        # Get student profile for the current user
-        student_profile = student_data[student_data['Registration_Number'] == current_user.registration_number]
-        
-        if student_profile.empty:
-            print(f"Error: No profile found for user {current_user.registration_number}")
-            return jsonify({'error': 'User profile not found'})
-            
-        student_profile = student_profile.iloc[0].to_dict()
-        print(f"Found student profile: {student_profile['Name']}")
-        
-        # Get upcoming tasks
-        upcoming_tasks = tasks_data.head(5).to_dict('records')
-        print(f"Loaded {len(upcoming_tasks)} upcoming tasks")
-        
-        # Get marks and courses
-        student_marks = []
-        student_courses = []
-        
-        if marks_data is not None:
-            student_marks = marks_data[marks_data['Registration_Number'] == current_user.registration_number].to_dict('records')
-            print(f"Loaded {len(student_marks)} marks records")
-        
-        if course_data is not None:
-            student_courses = course_data[course_data['Registration_Number'] == current_user.registration_number].to_dict('records')
-            print(f"Loaded {len(student_courses)} course records")
-        
-        # Get skills and projects (assuming these are in the student profile)
-        skills = student_profile.get('Skills', '').split(',') if 'Skills' in student_profile else []
-        projects = student_profile.get('Projects', '').split(',') if 'Projects' in student_profile else []
-        
-        response_data = {
-            'profile': {
-                'name': student_profile.get('Name', ''),
-                'registration_number': student_profile.get('Registration_Number', ''),
-                'email': student_profile.get('Email', ''),
-                'skills': skills,
-                'projects': projects
-            },
-            'upcoming_tasks': upcoming_tasks,
-            'marks': student_marks,
-            'courses': student_courses
-        }
-        
-        print("Dashboard data prepared successfully")
-        return jsonify(response_data)
-        
-    except Exception as e:
-        print(f"Error in get_dashboard_data: {str(e)}")
-        return jsonify({'error': f'Server error: {str(e)}'})
-
-@socketio.on('connect')
-def handle_connect():
-    print(f"Client connected: {request.sid}")
-
-@socketio.on('disconnect')
-def handle_disconnect():
-    print(f"Client disconnected: {request.sid}")
-
-@socketio.on('message')
-def handle_message(data):
-    print(f"Received message: {data}")
-    message = data.get('message', '')
-    
-    # Get response from chatbot
-    response = raizel.get_response(message)
-    
-    # Check for specific keywords to provide more detailed responses
-    message_lower = message.lower()
-    
-    # Handle academic performance queries
-    if any(keyword in message_lower for keyword in ['marks', 'grades', 'performance', 'score', 'result']):
-        marks_data = load_marks_data()
-        
-        if marks_data is not None:
-            student_marks = marks_data[marks_data['Registration_Number'] == current_user.registration_number]
-            
-            if not student_marks.empty:
-                # Get the latest semester's marks
-                latest_semester = student_marks['Semester'].max()
-                latest_marks = student_marks[student_marks['Semester'] == latest_semester]
-                
-                response = f"Here are your marks for semester {latest_semester}:\n\n"
-                for _, row in latest_marks.iterrows():
-                    status = "Pass" if row['Marks'] >= 60 else "Fail"
-                    response += f"- {row['Subject']}: {row['Marks']} ({status})\n"
-                
-                # Calculate average
-                avg_marks = latest_marks['Marks'].mean()
-                response += f"\nYour average marks: {avg_marks:.2f}"
-            else:
-                response = "I couldn't find any marks data for you."
-    
-    # Handle course queries
-    elif any(keyword in message_lower for keyword in ['courses', 'subjects', 'classes', 'department']):
-        course_data = load_course_details()
-        
-        if course_data is not None:
-            student_courses = course_data[course_data['Registration_Number'] == current_user.registration_number]
-            
-            if not student_courses.empty:
-                course_info = student_courses.iloc[0]
-                response = f"Here are your course details:\n\n"
-                response += f"- Department: {course_info['Department']}\n"
-                response += f"- Enrollment Year: {course_info['Enrollment_Year']}\n"
-                response += f"- Expected Graduation: {course_info['Expected_Graduation']}\n"
-            else:
-                response = "I couldn't find any course data for you."
-    
-    # Handle upcoming tasks queries
-    elif any(keyword in message_lower for keyword in ['tasks', 'assignments', 'deadlines', 'upcoming', 'schedule']):
-        tasks_data = load_tasks_data()
-        
-        if tasks_data is not None:
-            upcoming_tasks = tasks_data.head(5).to_dict('records')
-            
-            if upcoming_tasks:
-                response = "Here are your upcoming tasks:\n\n"
-                for task in upcoming_tasks:
-                    response += f"- {task['Event_Name']} (Due: {task['Date']})\n"
-                    if task['Description']:
-                        response += f"  Description: {task['Description']}\n"
-            else:
-                response = "I couldn't find any upcoming tasks."
-    
-    # Handle profile queries
-    elif any(keyword in message_lower for keyword in ['profile', 'info', 'details', 'about me', 'who am i']):
-        student_data = load_student_data()
-        
-        if student_data is not None:
-            student_profile = student_data[student_data['Registration_Number'] == current_user.registration_number]
-            
-            if not student_profile.empty:
-                profile = student_profile.iloc[0]
-                response = f"Here are your profile details:\n\n"
-                response += f"- Name: {profile['Name']}\n"
-                response += f"- Registration Number: {profile['Registration_Number']}\n"
-                response += f"- Department: {profile['Department']}\n"
-                response += f"- Year: {profile['Year']}\n"
-                response += f"- CGPA: {profile['CGPA']}\n"
-            else:
-                response = "I couldn't find your profile details."
-    
-    # Emit the response back to the client
-    emit('response', {'message': response})
-
-@socketio.on('voice_message')
-def handle_voice_message(data):
-    try:
-        print("Received voice message request")
-        
-        # Check if this is a text message instead of audio
-        if 'message' in data:
-            print(f"Received text message: {data['message']}")
-            response = raizel.get_response(data['message'])
-            emit('voice_response', {'response': response})
-            return
-            
-        # Get the audio data from the client
-        audio_data = data.get('audio')
-        if not audio_data:
-            print("Error: No audio data received")
-            emit('voice_response', {'error': 'No audio data received'})
-            return
-            
-        # Process the audio data using speech recognition
-        try:
-            # Convert base64 audio to audio data
-            audio_bytes = base64.b64decode(audio_data.split(',')[1])
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_audio:
-                temp_audio.write(audio_bytes)
-                temp_audio_path = temp_audio.name
-            
-            # Initialize recognizer
-            recognizer = sr.Recognizer()
-            
-            # Read the audio file
-            with sr.AudioFile(temp_audio_path) as source:
-                # Adjust for ambient noise
-                recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                # Record the audio
-                audio = recognizer.record(source)
-            
-            # Clean up temporary file
-            os.unlink(temp_audio_path)
-            
-            # Perform speech recognition
-            try:
-                # Use Google's speech recognition (faster than other options)
-                text = recognizer.recognize_google(audio)
-                print(f"Recognized text: {text}")
-                
-                # Get response from chatbot
-                response = raizel.get_response(text)
-                
-                # Check for specific keywords to provide more detailed responses
-                text_lower = text.lower()
-                
-                # Handle academic performance queries
-                if any(keyword in text_lower for keyword in ['marks', 'grades', 'performance', 'score', 'result']):
-                    marks_data = load_marks_data()
-                    if marks_data is not None:
-                        student_marks = marks_data[marks_data['Registration_Number'] == current_user.registration_number]
-                        if not student_marks.empty:
-                            latest_semester = student_marks['Semester'].max()
-                            latest_marks = student_marks[student_marks['Semester'] == latest_semester]
-                            response = f"Here are your marks for semester {latest_semester}:\n\n"
-                            for _, row in latest_marks.iterrows():
-                                status = "Pass" if row['Marks'] >= 60 else "Fail"
-                                response += f"- {row['Subject']}: {row['Marks']} ({status})\n"
-                            avg_marks = latest_marks['Marks'].mean()
-                            response += f"\nYour average marks: {avg_marks:.2f}"
-                
-                # Handle course queries
-                elif any(keyword in text_lower for keyword in ['courses', 'subjects', 'classes', 'department']):
-                    course_data = load_course_details()
-                    if course_data is not None:
-                        student_courses = course_data[course_data['Registration_Number'] == current_user.registration_number]
-                        if not student_courses.empty:
-                            course_info = student_courses.iloc[0]
-                            response = f"Here are your course details:\n\n"
-                            response += f"- Department: {course_info['Department']}\n"
-                            response += f"- Enrollment Year: {course_info['Enrollment_Year']}\n"
-                            response += f"- Expected Graduation: {course_info['Expected_Graduation']}\n"
-                
-                # Handle upcoming tasks queries
-                elif any(keyword in text_lower for keyword in ['tasks', 'assignments', 'deadlines', 'upcoming', 'schedule']):
-                    tasks_data = load_tasks_data()
-                    if tasks_data is not None:
-                        upcoming_tasks = tasks_data.head(5).to_dict('records')
-                        if upcoming_tasks:
-                            response = "Here are your upcoming tasks:\n\n"
-                            for task in upcoming_tasks:
-                                response += f"- {task['Event_Name']} (Due: {task['Date']})\n"
-                                if task['Description']:
-                                    response += f"  Description: {task['Description']}\n"
-                
-                emit('voice_response', {'response': response})
-                
-            except sr.UnknownValueError:
-                print("Speech recognition could not understand audio")
-                emit('voice_response', {'error': "I couldn't understand what you said. Please try again."})
-            except sr.RequestError as e:
-                print(f"Could not request results from speech recognition service: {e}")
-                emit('voice_response', {'error': "There was an error with the speech recognition service. Please try again."})
-                
-        except Exception as e:
-            print(f"Error processing audio: {str(e)}")
-            emit('voice_response', {'error': f"Error processing audio: {str(e)}"})
-            
-    except Exception as e:
-        print(f"Error in handle_voice_message: {str(e)}")
-        emit('voice_response', {'error': f'Server error: {str(e)}'})
-
-if __name__ == '__main__':
-    print("Starting Flask application...")
-    print("Starting server on http://127.0.0.1:3000")
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask_socketio import SocketIO, emit
+from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
+from voice_chatbot import Raizel
+from data_store import data_store
+from data_watcher import start_data_watcher
+from dashboard_view import DashboardViews
+from intent_router import IntentRouter
+from reply_formatting import format_marks_reply, format_course_reply, format_tasks_reply, format_profile_reply, ACADEMIC_KEYWORDS, CHAT_DATA_KEYWORDS
+from lru_cache import LRUCache
+from worker_pool import WorkerPool, create_worker_pool
+from server_config import socketio_options
+from voice_pipeline import decode_data_url, create_noise_profiles, create_voice_activity_detector, transcribe_segments
+from voice_stream import create_voice_streams
+from speech_backends import get_speech_service
+from speech_synthesis import create_speech_synthesis
+import json
+import os
+from werkzeug.security import generate_password_hash, check_password_hash
+from dotenv import load_dotenv
+import speech_recognition as sr
+
+# Load environment variables
+load_dotenv()
+
+app = Flask(__name__)
+app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'default_secret_key')
+socketio = SocketIO(app, cors_allowed_origins="*", **socketio_options())
+
+# Initialize Flask-Login
+login_manager = LoginManager()
+login_manager.init_app(app)
+login_manager.login_view = 'login'
+
+# User class for Flask-Login
+class User(UserMixin):
+    def __init__(self, id, registration_number):
+        self.id = id
+        self.registration_number = registration_number
+
+# Cache of User objects keyed by registration number, so the per-request
+# user loader is a dictionary lookup. Cleared whenever the records reload.
+user_cache = LRUCache(
+    maxsize=int(os.getenv('USER_CACHE_SIZE', '1024')),
+    ttl=float(os.getenv('USER_CACHE_TTL', '300'))
+)
+data_store.add_reload_listener(user_cache.clear)
+
+# User loader for Flask-Login
+@login_manager.user_loader
+def load_user(user_id):
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+    try:
+        student = data_store.get_student_profile(user_id)
+        if student is not None and not student.empty:
+            user = User(
+                id=student.iloc[0]['Registration_Number'],
+                registration_number=student.iloc[0]['Registration_Number']
+            )
+            user_cache.set(user_id, user)
+            return user
+        return None
+    except Exception as e:
+        print(f"Error loading user: {str(e)}")
+        return None
+
+# Initialize the chatbot
+raizel = Raizel()
+
+# Per-student dashboards, rebuilt off the request path whenever the data reloads
+dashboard_views = DashboardViews(data_store)
+data_store.add_reload_listener(dashboard_views.rebuild)
+
+# Background watcher that hot-reloads the CSVs (started by the server entry point)
+data_watcher = None
+
+# Blocking chat work (search, speech recognition, LLM calls) runs here, off the Socket.IO handlers
+chat_workers = create_worker_pool('raizel-chat')
+
+# Academic intents answered from the student's own data
+def reply_marks(match, registration_number, snapshot):
+    student_marks = snapshot.get_student_marks(registration_number)
+    if student_marks is None:
+        return None
+    if student_marks.empty:
+        return "I couldn't find any marks data for you."
+    return format_marks_reply(student_marks)
+
+def reply_courses(match, registration_number, snapshot):
+    student_courses = snapshot.get_student_courses(registration_number)
+    if student_courses is None:
+        return None
+    if student_courses.empty:
+        return "I couldn't find any course data for you."
+    return format_course_reply(student_courses)
+
+def reply_tasks(match, registration_number, snapshot):
+    tasks_data = snapshot.get_tasks_data()
+    if tasks_data is None:
+        return None
+    if tasks_data.empty:
+        return "I couldn't find any upcoming tasks."
+    return format_tasks_reply(tasks_data)
+
+def reply_profile(match, registration_number, snapshot):
+    student_profile = snapshot.get_student_profile(registration_number)
+    if student_profile is None:
+        return None
+    if student_profile.empty:
+        return "I couldn't find your profile details."
+    return format_profile_reply(student_profile)
+
+academic_handlers = {'marks': reply_marks, 'courses': reply_courses, 'tasks': reply_tasks, 'profile': reply_profile}
+academic_router = IntentRouter()
+for intent, keywords in ACADEMIC_KEYWORDS:
+    academic_router.register(intent, keywords, academic_handlers[intent])
+academic_router.compile()
+
+def build_reply(message, registration_number):
+    """Answer a chat message for a student: academic intents first, then the chatbot."""
+    # Only the highest-priority academic intent answers, as in the original if/elif chain
+    response = academic_router.dispatch(
+        message,
+        fallthrough=False,
+        registration_number=registration_number,
+        snapshot=data_store.snapshot()
+    )
+    if response is None:
+        response = raizel.get_response(message)
+    return response
+
+# Routes
+@app.route('/')
+def index():
+    if current_user.is_authenticated:
+        try:
+            # Serve the precomputed dashboard for the current user
+            entry = dashboard_views.current().get(current_user.registration_number)
+            return render_template('index.html', **entry.template_context)
+        except Exception as e:
+            print(f"Error loading dashboard data: {str(e)}")
+            flash(f"Error loading dashboard data: {str(e)}")
+            return render_template('index.html', 
+                                  user=current_user.registration_number,
+                                  academic_data=[],
+                                  tasks=[],
+                                  course_details=[])
+    return redirect(url_for('login'))
+
+@app.route('/login', methods=['GET', 'POST'])
+def login():
+    if current_user.is_authenticated:
+        return redirect(url_for('index'))
+    
+    if request.method == 'POST':
+        registration_number = request.form.get('registration_number')
+        
+        try:
+            student = data_store.get_student_profile(registration_number)
+            if student is None:
+                flash('Error loading student data. Please try again later.')
+                return redirect(url_for('login'))
+            
+            if student.empty:
+                flash('Invalid registration number.')
+                return redirect(url_for('login'))
+            
+            user = User(
+                id=student.iloc[0]['Registration_Number'],
+                registration_number=student.iloc[0]['Registration_Number']
+            )
+            login_user(user)
+            return redirect(url_for('index'))
+            
+        except Exception as e:
+            print(f"Login error: {str(e)}")
+            flash('An error occurred. Please try again later.')
+            return redirect(url_for('login'))
+    
+    return render_template('login.html')
+
+@app.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    return redirect(url_for('login'))
+
+@app.route('/api/chat', methods=['POST'])
+@login_required
+def chat():
+    data = request.json
+    message = data.get('message', '')
+    
+    # Get response from chatbot
+    response = raizel.get_response(message)
+    
+    # If the message asks about marks or courses, fetch and format the data
+    # (only the original five trigger words, not every marks/courses keyword)
+    match = academic_router.classify(message)
+    if not match.keywords.isdisjoint(CHAT_DATA_KEYWORDS):
+        snapshot = data_store.snapshot()
+        student_marks = snapshot.get_student_marks(current_user.registration_number)
+        student_courses = snapshot.get_student_courses(current_user.registration_number)
+        
+        if student_marks is not None and student_courses is not None:
+            if not student_marks.empty:
+                marks_info = student_marks.to_dict('records')
+                response += f"\n\nYour marks:\n{json.dumps(marks_info, indent=2)}"
+            
+            if not student_courses.empty:
+                courses_info = student_courses.to_dict('records')
+                response += f"\n\nYour courses:\n{json.dumps(courses_info, indent=2)}"
+    
+    return jsonify({'response': response})
+
+@app.route('/api/dashboard')
+@login_required
+def get_dashboard_data():
+    try:
+        snapshot = data_store.snapshot()
+        
+        # Check if data was loaded successfully
+        if snapshot.get_student_data() is None:
+            print("Error: Failed to load student data")
+            return jsonify({'error': 'Failed to load student data'})
+            
+        if snapshot.get_tasks_data() is None:
+            print("Error: Failed to load tasks data")
+            return jsonify({'error': 'Failed to load tasks data'})
+        
+        # Serve the pre-serialized payload for the current user
+        entry = dashboard_views.current(snapshot).get(current_user.registration_number)
+        if entry is None:
+            print(f"Error: No profile found for user {current_user.registration_number}")
+            return jsonify({'error': 'User profile not found'})
+        
+        return app.response_class(entry.api_json, mimetype='application/json')
+        
+    except Exception as e:
+        print(f"Error in get_dashboard_data: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'})
+
+@app.route('/api/metrics')
+@login_required
+def get_metrics():
+    return jsonify({
+        'data_store': data_store.stats(),
+        'data_watcher': data_watcher.stats() if data_watcher is not None else None,
+        'dashboard_view': dashboard_views.current().stats(),
+        'intent_router': {'classified': academic_router.classified},
+        'user_cache': user_cache.stats(),
+        'chat_workers': chat_workers.stats(),
+        'tts_workers': tts_workers.stats(),
+        'voice_streams': voice_streams.stats(),
+        'speech': get_speech_service().stats(),
+        'noise_profiles': noise_profiles.stats(),
+        'voice_activity': voice_activity.stats(),
+        'speech_synthesis': speech_synthesis.stats() if speech_synthesis is not None else None,
+        'search': raizel.search_cache.stats(),
+        'search_orchestrator': raizel.search_orchestrator.stats(),
+        'knowledge_base': raizel.knowledge_base.stats() if raizel.knowledge_base is not None else None
+    })
+
+@socketio.on('connect')
+def handle_connect():
+    print(f"Client connected: {request.sid}")
+
+@socketio.on('disconnect')
+def handle_disconnect():
+    print(f"Client disconnected: {request.sid}")
+    voice_streams.discard(request.sid)
+    noise_profiles.discard(request.sid)
+
+# Ambient-noise calibration kept per Socket.IO session instead of per utterance
+noise_profiles = create_noise_profiles()
+# Silence trimming in front of the recognizer
+voice_activity = create_voice_activity_detector()
+
+# Fixed voice replies, spoken often enough that their audio is cached
+NO_SPEECH_MESSAGE = "I didn't hear anything. Please try again."
+NOT_UNDERSTOOD_MESSAGE = "I couldn't understand what you said. Please try again."
+RECOGNITION_ERROR_MESSAGE = "There was an error with the speech recognition service. Please try again."
+BUSY_MESSAGE = "I'm handling a lot of requests right now. Please try again in a moment."
+
+# Replies rendered to audio on the server (None when TTS_BACKEND=none)
+speech_synthesis = create_speech_synthesis(raizel.create_tts_engine)
+if speech_synthesis is not None:
+    speech_synthesis.register_phrases(list(raizel.responses.values()) + [
+        NO_SPEECH_MESSAGE, NOT_UNDERSTOOD_MESSAGE, RECOGNITION_ERROR_MESSAGE, BUSY_MESSAGE
+    ])
+
+# Synthesis runs here, after the text reply has been sent, so a slow engine never delays an answer
+tts_workers = WorkerPool(
+    'raizel-tts',
+    max_workers=int(os.getenv('TTS_WORKERS', '1')),
+    queue_limit=int(os.getenv('TTS_QUEUE_LIMIT', '64'))
+)
+
+def reply_to_message(message, registration_number):
+    # Answer academic queries from the student's data, anything else from the chatbot
+    return {'message': build_reply(message, registration_number)}
+
+def reply_to_voice_message(data, registration_number, session_id):
+    """Recognize a voice message (or take its text) and build the reply payload."""
+    try:
+        # Check if this is a text message instead of audio
+        if 'message' in data:
+            print(f"Received text message: {data['message']}")
+            return {'response': raizel.get_response(data['message'])}
+            
+        # Get the audio data from the client
+        audio_data = data.get('audio')
+        if not audio_data:
+            print("Error: No audio data received")
+            return {'error': 'No audio data received'}
+            
+        # Process the audio data using speech recognition
+        try:
+            # Decode the base64 audio and read it straight from memory,
+            # with the session's reused Recognizer and noise profile
+            audio_bytes = decode_data_url(audio_data)
+            audio = noise_profiles.record(session_id, audio_bytes)
+            
+            # Trim silence and skip the recognizer entirely for clips without speech
+            threshold = noise_profiles.for_session(session_id).recognizer.energy_threshold
+            segments = voice_activity.split(audio, threshold)
+            if not segments:
+                print("No speech detected in voice message")
+                return {'error': NO_SPEECH_MESSAGE}
+            
+            # Perform speech recognition
+            try:
+                # Transcribe with the configured speech backend(s)
+                text = transcribe_segments(segments, recognize_speech)
+                print(f"Recognized text: {text}")
+                
+                # Answer academic queries from the student's data, anything else from the chatbot
+                return {'response': build_reply(text, registration_number)}
+                
+            except sr.UnknownValueError:
+                print("Speech recognition could not understand audio")
+                return {'error': NOT_UNDERSTOOD_MESSAGE}
+            except sr.RequestError as e:
+                print(f"Could not request results from speech recognition service: {e}")
+                return {'error': RECOGNITION_ERROR_MESSAGE}
+                
+        except Exception as e:
+            print(f"Error processing audio: {str(e)}")
+            return {'error': f"Error processing audio: {str(e)}"}
+            
+    except Exception as e:
+        print(f"Error in handle_voice_message: {str(e)}")
+        return {'error': f'Server error: {str(e)}'}
+
+def speak_reply(job, *args):
+    """Run a voice reply job; attach its audio if it is a cached phrase, or mark the audio as to follow."""
+    payload = job(*args)
+    if payload is not None and speech_synthesis is not None:
+        text = payload.get('response') or payload.get('error')
+        audio = speech_synthesis.cached(text)
+        if audio is not None:
+            payload['audio'] = audio
+            payload['audio_type'] = speech_synthesis.mimetype
+        elif text and speech_synthesis.available:
+            payload['audio_pending'] = True
+    return payload
+
+def reply_audio(text):
+    """Synthesize a reply for the 'voice_audio' follow-up event (audio is None if synthesis failed)."""
+    return {'text': text, 'audio': speech_synthesis.synthesize(text), 'audio_type': speech_synthesis.mimetype}
+
+def emit_reply(event, sid, payload):
+    """Emit a reply, then queue the synthesis of its audio if speak_reply marked it as to follow."""
+    if payload is None:
+        return
+    socketio.emit(event, payload, to=sid)
+    if payload.get('audio_pending'):
+        text = payload.get('response') or payload.get('error')
+        accepted = tts_workers.submit(
+            reply_audio, text,
+            on_result=lambda audio: socketio.emit('voice_audio', audio, to=sid)
+        )
+        if not accepted:
+            # Tell the client to stop waiting for this reply's audio
+            socketio.emit('voice_audio', {'text': text, 'audio': None}, to=sid)
+
+def submit_reply(event, sid, job, *args):
+    """Run job on the chat worker pool and emit its payload to the requesting client."""
+    accepted = chat_workers.submit(
+        job, *args,
+        on_result=lambda payload: emit_reply(event, sid, payload)
+    )
+    if not accepted:
+        print(f"Chat worker queue full, rejecting {event} request from {sid}")
+        busy_key = 'message' if event == 'response' else 'error'
+        socketio.emit(event, {busy_key: BUSY_MESSAGE}, to=sid)
+
+@socketio.on('message')
+def handle_message(data):
+    print(f"Received message: {data}")
+    message = data.get('message', '')
+    
+    # Reply from the worker pool so slow lookups don't block other clients
+    submit_reply('response', request.sid, reply_to_message, message, current_user.registration_number)
+
+@socketio.on('voice_message')
+def handle_voice_message(data):
+    print("Received voice message request")
+    submit_reply('voice_response', request.sid, speak_reply, reply_to_voice_message, data, current_user.registration_number, request.sid)
+
+def start_background_services():
+    """Warm the dashboards, speech models and cached phrases and start the CSV watcher (called by each server process)."""
+    global data_watcher
+    dashboard_views.rebuild()
+    get_speech_service()
+    # Chatbot subsystems that should not wait for their first request, e.g. RAIZEL_WARM_UP=nltk,search
+    warm_up = [name.strip() for name in os.getenv('RAIZEL_WARM_UP', '').split(',') if name.strip()]
+    if warm_up:
+        raizel.warm_up(warm_up)
+    # Render the fixed phrases off the startup path (instant once they are in the disk cache)
+    if speech_synthesis is not None:
+        tts_workers.submit(speech_synthesis.warm)
+    data_watcher = start_data_watcher(data_store)
+
+def recognize_speech(audio):
+    """Transcribe an sr.AudioData clip with the configured speech backend(s)."""
+    return get_speech_service().recognize(audio)
+
+# Per-session buffers for audio streamed in binary chunks
+voice_streams = create_voice_streams(recognize_speech)
+
+def reply_to_voice_stream(sid, stream, registration_number, expected_chunks=None):
+    """Finish a streamed utterance: wait for chunks still in flight, final transcript (reusing the interims), then the reply."""
+    try:
+        try:
+            text, reused_interim = stream.final_transcript(expected_chunks, timeout=voice_streams.end_timeout)
+        finally:
+            voice_streams.discard(sid, stream)
+        voice_streams.record(stream, reused_interim)
+        print(f"Recognized streamed text: {text}")
+        return {'transcript': text, 'response': build_reply(text, registration_number)}
+    except sr.UnknownValueError:
+        print("Speech recognition could not understand streamed audio")
+        return {'error': NOT_UNDERSTOOD_MESSAGE}
+    except sr.RequestError as e:
+        print(f"Could not request results from speech recognition service: {e}")
+        return {'error': RECOGNITION_ERROR_MESSAGE}
+    except Exception as e:
+        print(f"Error in reply_to_voice_stream: {str(e)}")
+        return {'error': f'Server error: {str(e)}'}
+
+def interim_payload(stream):
+    text = stream.interim_transcript()
+    return {'transcript': text} if text else None
+
+@socketio.on('voice_stream_start')
+def handle_voice_stream_start(data=None):
+    data = data or {}
+    voice_streams.start(
+        request.sid,
+        sample_rate=int(data.get('sample_rate', 16000)),
+        sample_width=int(data.get('sample_width', 2))
+    )
+
+@socketio.on('voice_chunk')
+def handle_voice_chunk(chunk, seq=None):
+    """Binary PCM chunk; clients send their 0-based chunk number as the second argument."""
+    sid = request.sid
+    stream = voice_streams.get(sid)
+    if stream is None:
+        emit('voice_response', {'error': 'Voice stream not started'})
+        return
+    try:
+        due = stream.append(chunk, None if seq is None else int(seq))
+    except (TypeError, ValueError) as e:
+        emit('voice_response', {'error': f'Invalid audio chunk: {str(e)}'})
+        return
+    # Recognize the partial utterance while the student keeps talking
+    if due:
+        accepted = chat_workers.submit(
+            interim_payload, stream,
+            on_result=lambda payload: payload is not None and socketio.emit('voice_interim', payload, to=sid)
+        )
+        if not accepted:
+            stream.cancel_interim()
+
+@socketio.on('voice_stream_end')
+def handle_voice_stream_end(data=None):
+    """End of the utterance; data may carry {'chunks': n}, the number of chunks the client sent."""
+    sid = request.sid
+    stream = voice_streams.finish(sid)
+    if stream is None:
+        emit('voice_response', {'error': 'No audio data received'})
+        return
+    expected_chunks = (data or {}).get('chunks')
+    if expected_chunks is not None:
+        expected_chunks = int(expected_chunks)
+    submit_reply('voice_response', sid, speak_reply, reply_to_voice_stream, sid, stream,
+                 current_user.registration_number, expected_chunks)
+
+if __name__ == '__main__':
+    print("Starting Flask application...")
+    start_background_services()
+    print("Starting server on http://127.0.0.1:3000")
     socketio.run(app, host='127.0.0.1', port=3000, debug=True) 
\ No newline at end of file
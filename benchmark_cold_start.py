@@ -0,0 +1,84 @@
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+DEFAULT_ROWS = 2_000_000
+SUBJECTS = ['Data Structures', 'Algorithms', 'Database Systems', 'Operating Systems', 'Discrete Mathematics']
+
+def make_marks_csv(path, rows):
+    """Write a registrar-scale SubjectWise_Marks.csv."""
+    rng = np.random.default_rng(42)
+    students = rows // 20
+    pd.DataFrame({
+        'Registration_Number': np.repeat([f"REG{i:07d}" for i in range(students)], 20),
+        'Semester': np.tile(np.repeat(np.arange(1, 5), 5), students),
+        'Subject': np.tile(SUBJECTS, students * 4),
+        'Marks': rng.integers(30, 100, students * 20)
+    }).to_csv(path, index=False)
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    # VmHWM is reset on exec, unlike ru_maxrss which inherits the parent's peak
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 if sys.platform != 'darwin' else 1024 * 1024)
+
+def load_once(mode, path):
+    """Child process: load path once and print timing and peak RSS as JSON."""
+    start = time.perf_counter()
+    import pandas
+    from columnar_cache import load_csv_cached
+    imported = time.perf_counter()
+    df = pandas.read_csv(path) if mode == 'csv' else load_csv_cached(path)
+    loaded = time.perf_counter()
+    print(json.dumps({
+        'rows': len(df),
+        'import_seconds': imported - start,
+        'load_seconds': loaded - imported,
+        'max_rss_mb': peak_rss_mb()
+    }))
+
+def run_child(mode, path):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', mode, path],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(rows):
+    work_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(work_dir, 'SubjectWise_Marks.csv')
+        make_marks_csv(path, rows)
+        print(f"Synthetic marks file: {rows} rows, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        results = {'csv': run_child('csv', path)}
+        run_child('cache', path)  # first cached run builds the cache
+        results['cache'] = run_child('cache', path)
+
+        print(f"{'mode':>6} {'load (s)':>10} {'max RSS (MB)':>14}")
+        for mode, result in results.items():
+            print(f"{mode:>6} {result['load_seconds']:>10.3f} {result['max_rss_mb']:>14.1f}")
+        print(f"Cold-start speedup: {results['csv']['load_seconds'] / results['cache']['load_seconds']:.1f}x")
+    finally:
+        shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        load_once(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
@@ -0,0 +1,103 @@
+import glob
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import numpy as np
+from html_extract import extract_sentences
+
+DEFAULT_PAGES = 20
+WORDS = ("python language program data student course lecture exam memory network algorithm graph tree "
+         "search index query answer university semester system design theory compiler process thread "
+         "history science research model function variable class object method").split()
+
+def make_sentence(rng):
+    words = rng.choice(WORDS, size=rng.integers(6, 22))
+    return ' '.join(words).capitalize() + '.'
+
+def make_page(rng, paragraphs):
+    """A Wikipedia-like article: head scripts and styles, navigation, sidebar, references and footer around the text."""
+    parts = ['<!DOCTYPE html><html><head><title>Article</title>']
+    parts += [f'<script>var config{i} = {{"key": "{"x" * 2000}"}};</script>' for i in range(5)]
+    parts.append('<style>' + 'body .mw-content p { margin: 0 0 1em; } ' * 200 + '</style></head><body>')
+    parts.append('<header><div class="logo">Site</div><form><input name="search"></form></header>')
+    parts.append('<nav class="vector-menu"><ul>' + ''.join(
+        f'<li><a href="/wiki/Link_{i}">{make_sentence(rng)}</a></li>' for i in range(150)) + '</ul></nav>')
+    parts.append('<main><div id="content"><h1>Article</h1><div class="toc">' + ''.join(
+        f'<li><a href="#s{i}">Section {i}</a></li>' for i in range(30)) + '</div>')
+    for i in range(paragraphs):
+        if i % 8 == 0:
+            parts.append(f'<h2 id="s{i}">Section {i}</h2>')
+        sentences = [make_sentence(rng) for _ in range(rng.integers(3, 8))]
+        parts.append('<p>' + ' '.join(f'<a href="/wiki/{s[:5]}">{s}</a>' if j % 3 == 0 else s
+                                      for j, s in enumerate(sentences)) + '<sup>[1]</sup></p>')
+    parts.append('<div class="reflist"><ol>' + ''.join(
+        f'<li>{make_sentence(rng)} <a href="https://example.org/{i}">Source</a></li>' for i in range(200)) + '</ol></div>')
+    parts.append('</div></main><aside>' + make_sentence(rng) * 20 + '</aside><footer>' + make_sentence(rng) * 10 + '</footer></body></html>')
+    return ''.join(parts)
+
+def write_corpus(directory, count):
+    """Save count synthetic pages of growing size as page_NNN.html."""
+    rng = np.random.default_rng(7)
+    for i in range(count):
+        with open(os.path.join(directory, f'page_{i:03d}.html'), 'w', encoding='utf-8') as f:
+            f.write(make_page(rng, paragraphs=20 + i * 25))
+
+def soup_extract(html, split):
+    """The previous pipeline: full BeautifulSoup tree, decompose(), get_text(), cleanup, sentence split."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(['script', 'style', 'nav', 'footer', 'header', 'iframe', 'aside']):
+        element.decompose()
+    text = re.sub(r'\s+', ' ', soup.get_text()).strip()
+    return [s.strip() for s in split(text) if len(s.split()) > 5]
+
+def sentence_splitter():
+    try:
+        from nltk.tokenize import sent_tokenize
+        sent_tokenize("Probe sentence. Another one.")
+        return 'nltk', sent_tokenize
+    except (ImportError, LookupError):
+        return 'regex', re.compile(r'(?<=[.!?])\s+').split
+
+def time_pages(pages, extract):
+    start = time.perf_counter()
+    found = sum(len(extract(html)) for html in pages)
+    return time.perf_counter() - start, found
+
+def main(corpus_dir=None):
+    work_dir = None
+    if corpus_dir is None:
+        work_dir = corpus_dir = tempfile.mkdtemp()
+        write_corpus(corpus_dir, DEFAULT_PAGES)
+    try:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(corpus_dir, '*.html'))):
+            with open(path, encoding='utf-8', errors='replace') as f:
+                pages.append(f.read())
+        total_mb = sum(len(page) for page in pages) / 1e6
+        print(f"Corpus: {len(pages)} pages, {total_mb:.1f} MB ({corpus_dir})")
+
+        runs = {'streaming, whole page': lambda html: extract_sentences(html)}
+        runs['streaming, first 200'] = lambda html: extract_sentences(html, max_sentences=200)
+        runs['streaming, first 50'] = lambda html: extract_sentences(html, max_sentences=50)
+        try:
+            import bs4
+            name, split = sentence_splitter()
+            runs = {f'bs4 + get_text ({name} split)': lambda html: soup_extract(html, split), **runs}
+        except ImportError:
+            print("beautifulsoup4 not installed, skipping the tree-based baseline")
+
+        print(f"{'pipeline':>32} {'total (s)':>10} {'ms/page':>9} {'MB/s':>7} {'sentences':>10}")
+        for name, extract in runs.items():
+            seconds, found = time_pages(pages, extract)
+            print(f"{name:>32} {seconds:>10.3f} {seconds / len(pages) * 1000:>9.1f} {total_mb / seconds:>7.1f} {found:>10}")
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    # Pass a directory of saved .html pages to benchmark real pages instead of the synthetic corpus
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
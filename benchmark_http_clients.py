@@ -0,0 +1,98 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import httplib2
+import wikipedia
+from googleapiclient.discovery import build
+from http_clients import GoogleSearchClient, WikipediaClient, create_http_session
+
+QUERIES = 40
+# Simulated network costs of the stub server: a new connection pays the TCP + TLS handshake
+HANDSHAKE_SECONDS = 0.03
+REQUEST_SECONDS = 0.005
+EXTRACT = "Python is a high-level programming language. Its design emphasizes code readability."
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers the MediaWiki and Custom Search requests both clients make, with keep-alive."""
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+
+    def setup(self):
+        StubHandler.connections += 1
+        time.sleep(HANDSHAKE_SECONDS)
+        # Headers and body go out in separate writes; don't let Nagle hold the body back
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(REQUEST_SECONDS)
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        if url.path.endswith('customsearch/v1'):
+            body = {'items': [{'snippet': EXTRACT}]}
+        elif params.get('generator') == 'search':
+            body = {'query': {'pages': [{'index': 1, 'title': 'Python', 'extract': EXTRACT}]}}
+        elif params.get('list') == 'search':
+            body = {'query': {'search': [{'title': 'Python'}]}}
+        elif params.get('prop') == 'info|pageprops':
+            body = {'query': {'pages': {'1': {'pageid': 1, 'title': 'Python', 'fullurl': 'https://en.wikipedia.org/wiki/Python'}}}}
+        else:
+            body = {'query': {'pages': {'1': {'pageid': 1, 'title': 'Python', 'extract': EXTRACT}}}}
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def measure(label, search):
+    StubHandler.connections = 0
+    latencies = []
+    for i in range(QUERIES):
+        start = time.perf_counter()
+        assert search(f"what is python {i}")
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return (label, sum(latencies) / len(latencies) * 1000, latencies[len(latencies) // 2] * 1000,
+            latencies[-1] * 1000, StubHandler.connections)
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Before: the wikipedia package (three requests per summary, new connection each) and
+    # a discovery client built per query with its own httplib2.Http
+    wikipedia.wikipedia.API_URL = f"{base}/w/api.php"
+
+    def google_per_query(query):
+        service = build('customsearch', 'v1', developerKey='stub-key', cache_discovery=False,
+                        client_options={'api_endpoint': f"{base}/"})
+        return service.cse().list(q=query, cx='stub-cse', num=3).execute(http=httplib2.Http())['items'][0]['snippet']
+
+    # After: one pooled session and one discovery client for the process
+    wiki = WikipediaClient(create_http_session(), api_url=f"{base}/w/api.php")
+    google = GoogleSearchClient('stub-key', 'stub-cse', api_endpoint=f"{base}/")
+
+    rows = [
+        measure('wikipedia package', lambda query: wikipedia.summary(query, sentences=2)),
+        measure('WikipediaClient', lambda query: wiki.summary(query)),
+        measure('build() per query', google_per_query),
+        measure('GoogleSearchClient', lambda query: google.search(query)),
+    ]
+    server.shutdown()
+    print(f"{QUERIES} sequential queries against a local stub "
+          f"({HANDSHAKE_SECONDS * 1000:.0f} ms per new connection, {REQUEST_SECONDS * 1000:.0f} ms per request)")
+    print(f"{'client':>20} {'mean (ms)':>10} {'p50 (ms)':>9} {'max (ms)':>9} {'connections':>12}")
+    for label, mean, p50, worst, connections in rows:
+        print(f"{label:>20} {mean:>10.1f} {p50:>9.1f} {worst:>9.1f} {connections:>12}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import random
+import time
+from intent_router import IntentRouter
+from reply_formatting import ACADEMIC_KEYWORDS
+
+MESSAGE_COUNT = 100_000
+
+def keyword_chains():
+    """The keyword lists the socket handlers and Raizel check, taken from the code that uses them."""
+    from voice_chatbot import Raizel
+    raizel = Raizel()
+    return ACADEMIC_KEYWORDS + [
+        (name, list(keywords)) for name, keywords in
+        ((name, raizel.intent_router.keywords_of(name)) for name, _, _ in raizel.intent_router.intents)
+    ]
+
+TEMPLATES = [
+    "What are my marks this semester?",
+    "show me my upcoming deadlines please",
+    "Tell me about quantum computing",
+    "who am i",
+    "Which department is the CGPA topper in?",
+    "hello raizel, how are you doing today",
+    "could you look up the weather in Mumbai for tomorrow afternoon",
+    "I just wanted to say that the lecture was really long and tiring"
+]
+
+def classify_chains(chains, message):
+    """The original approach: one `any(keyword in message)` scan per intent."""
+    lowered = message.lower()
+    return [name for name, keywords in chains if any(keyword in lowered for keyword in keywords)]
+
+def main():
+    rng = random.Random(7)
+    messages = [rng.choice(TEMPLATES) + f" #{i}" for i in range(MESSAGE_COUNT)]
+
+    chains = keyword_chains()
+    router = IntentRouter()
+    for name, keywords in chains:
+        router.register(name, keywords)
+    router.compile()
+
+    for message in TEMPLATES:
+        assert router.classify(message).intents == classify_chains(chains, message), message
+
+    start = time.perf_counter()
+    for message in messages:
+        classify_chains(chains, message)
+    chains = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for message in messages:
+        router.classify(message)
+    routed = time.perf_counter() - start
+
+    print(f"Classified {MESSAGE_COUNT} messages")
+    print(f"any() chains:  {chains:.3f} s ({chains / MESSAGE_COUNT * 1e6:.2f} us/message)")
+    print(f"IntentRouter:  {routed:.3f} s ({routed / MESSAGE_COUNT * 1e6:.2f} us/message)")
+    print(f"Speedup:       {chains / routed:.1f}x")
+
+if __name__ == "__main__":
+    main()
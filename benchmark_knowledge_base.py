@@ -0,0 +1,51 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import numpy as np
+from knowledge_base import KnowledgeBase
+from passage_ranker import ENGLISH_STOP_WORDS
+
+DEFAULT_DOCUMENTS = 50_000
+VOCABULARY = 20_000
+# The most frequent synthetic words play the part of stop words
+STOP_WORDS = ENGLISH_STOP_WORDS | {f"w{rank}" for rank in range(1, 51)}
+
+def make_words(rng, count, content_only=False):
+    """Synthetic words with a Zipf frequency distribution, like natural text."""
+    ranks = (rng.zipf(1.2, size=count * 4 if content_only else count) - 1) % VOCABULARY + 1
+    if content_only:
+        ranks = ranks[ranks > 50][:count]
+    return [f"w{rank}" for rank in ranks]
+
+def main(documents):
+    rng = np.random.default_rng(3)
+    work_dir = tempfile.mkdtemp()
+    try:
+        knowledge_base = KnowledgeBase(os.path.join(work_dir, 'kb.sqlite'), STOP_WORDS)
+        start = time.perf_counter()
+        knowledge_base.add_many(
+            (f"topic {i} " + ' '.join(make_words(rng, 2)), ' '.join(make_words(rng, 60)) + '.')
+            for i in range(documents)
+        )
+        knowledge_base.reindex()
+        print(f"Imported and indexed {documents} documents in {time.perf_counter() - start:.1f} s")
+
+        queries = [f"what is {' '.join(make_words(rng, int(rng.integers(1, 4)), content_only=True))}" for _ in range(1000)]
+        for title_only in (False, True):
+            timings = []
+            for query in queries:
+                start = time.perf_counter()
+                knowledge_base.answer(query, title_only=title_only)
+                timings.append(time.perf_counter() - start)
+            timings = np.array(timings) * 1000
+            print(f"{'title' if title_only else 'full-text'} lookups: median {np.median(timings):.3f} ms, "
+                  f"p99 {np.percentile(timings, 99):.3f} ms")
+        print(knowledge_base.stats())
+        knowledge_base.close()
+    finally:
+        shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DOCUMENTS)
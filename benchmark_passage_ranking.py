@@ -0,0 +1,60 @@
+import time
+import numpy as np
+from passage_ranker import ENGLISH_STOP_WORDS, PassageIndex
+
+PAGE_SIZES = [10_000, 50_000]
+QUERIES_PER_PAGE = 20
+VOCABULARY = 20_000
+
+def make_page(rng, sentences):
+    """Sentences of 8-30 words drawn from a Zipf-distributed vocabulary plus stop words."""
+    words = np.array([f"term{i}" for i in range(VOCABULARY)])
+    stop_words = np.array(sorted(ENGLISH_STOP_WORDS))
+    page = []
+    for length in rng.integers(8, 31, sentences):
+        content = words[np.minimum(rng.zipf(1.3, length // 2), VOCABULARY) - 1]
+        filler = rng.choice(stop_words, length - length // 2)
+        page.append(' '.join(np.concatenate([content, filler])) + '.')
+    return page
+
+def make_queries(rng):
+    return [f"what is term{a} and term{b} term{c}" for a, b, c in rng.integers(10, 3000, (QUERIES_PER_PAGE, 3))]
+
+def substring_scan(query, sentences):
+    """The previous find_best_answer: stopword set rebuilt per call, substring test per word per sentence."""
+    query_words = set(query.lower().split()) - set(sorted(ENGLISH_STOP_WORDS))
+    best_score, best_sentence = 0, None
+    for sentence in sentences:
+        sentence = sentence.lower()
+        score = sum(1 for word in query_words if word in sentence)
+        if score > best_score:
+            best_score, best_sentence = score, sentence
+    return best_sentence
+
+def main():
+    rng = np.random.default_rng(11)
+    print(f"{QUERIES_PER_PAGE} queries per page, times in ms")
+    print(f"{'sentences':>10} {'scan per query':>15} {'index build':>12} {'BM25 per query':>15} {'total: scan':>12} {'index':>8}")
+    for size in PAGE_SIZES:
+        page = make_page(rng, size)
+        queries = make_queries(rng)
+
+        start = time.perf_counter()
+        for query in queries:
+            substring_scan(query, page)
+        scan = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        index = PassageIndex(page, ENGLISH_STOP_WORDS)
+        built = time.perf_counter()
+        for query in queries:
+            index.top_k(query, k=3)
+        done = time.perf_counter()
+        build_ms = (built - start) * 1000
+        query_ms = (done - built) * 1000
+
+        print(f"{size:>10} {scan / QUERIES_PER_PAGE:>15.2f} {build_ms:>12.1f} {query_ms / QUERIES_PER_PAGE:>15.3f} "
+              f"{scan:>12.1f} {build_ms + query_ms:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import time
+import numpy as np
+import pandas as pd
+from reply_formatting import format_marks_reply
+
+SUBJECT_COUNTS = [10, 1_000, 100_000]
+
+def format_marks_reply_iterrows(student_marks):
+    """The original per-row formatting loop from the socket handlers."""
+    latest_semester = student_marks['Semester'].max()
+    latest_marks = student_marks[student_marks['Semester'] == latest_semester]
+    response = f"Here are your marks for semester {latest_semester}:\n\n"
+    for _, row in latest_marks.iterrows():
+        status = "Pass" if row['Marks'] >= 60 else "Fail"
+        response += f"- {row['Subject']}: {row['Marks']} ({status})\n"
+    avg_marks = latest_marks['Marks'].mean()
+    response += f"\nYour average marks: {avg_marks:.2f}"
+    return response
+
+def make_student_marks(subjects):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        'Registration_Number': 'REG2023001',
+        'Semester': np.repeat([1, 2], subjects),
+        'Subject': [f"Subject {i}" for i in range(subjects)] * 2,
+        'Marks': rng.integers(30, 100, subjects * 2)
+    })
+
+def best_time(func, arg, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    print(f"{'subjects':>10} {'iterrows (ms)':>15} {'vectorized (ms)':>17} {'speedup':>9}")
+    print("-" * 55)
+    for subjects in SUBJECT_COUNTS:
+        marks = make_student_marks(subjects)
+        assert format_marks_reply(marks) == format_marks_reply_iterrows(marks)
+        repeat = 3 if subjects >= 100_000 else 20
+        old = best_time(format_marks_reply_iterrows, marks, repeat)
+        new = best_time(format_marks_reply, marks, repeat)
+        print(f"{subjects:>10} {old * 1e3:>15.2f} {new * 1e3:>17.2f} {old / new:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
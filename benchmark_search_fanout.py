@@ -0,0 +1,67 @@
+import random
+import time
+import numpy as np
+from search_orchestrator import SearchOrchestrator, SearchProvider
+
+QUERIES = 200
+# Simulated time runs this many times faster than wall-clock time
+SPEEDUP = 20
+TIMEOUT_SECONDS = 2.0
+# (median latency s, miss rate, stall rate); a stalled request takes STALL_SECONDS
+SOURCES = {'wikipedia': (0.35, 0.35, 0.03), 'google': (0.25, 0.10, 0.01)}
+STALL_SECONDS = 8.0
+
+def plan(rng):
+    """Latency and outcome of each source for every query, shared by both strategies."""
+    queries = []
+    for i in range(QUERIES):
+        outcomes = {}
+        for name, (median, miss_rate, stall_rate) in SOURCES.items():
+            latency = STALL_SECONDS if rng.random() < stall_rate else median * rng.lognormvariate(0, 0.5)
+            outcomes[name] = (latency, None if rng.random() < miss_rate else f"{name} answer {i}")
+        queries.append(outcomes)
+    return queries
+
+def simulated(name, queries):
+    def search(query):
+        latency, answer = queries[int(query)][name]
+        time.sleep(latency / SPEEDUP)
+        return answer
+    return search
+
+def sequential(queries):
+    """The old search_internet: Wikipedia, then Google only after a Wikipedia miss, no timeouts."""
+    wikipedia, google = simulated('wikipedia', queries), simulated('google', queries)
+    latencies = []
+    for i in range(len(queries)):
+        start = time.perf_counter()
+        wikipedia(str(i)) or google(str(i))
+        latencies.append((time.perf_counter() - start) * SPEEDUP)
+    return latencies
+
+def fan_out(queries):
+    orchestrator = SearchOrchestrator([
+        SearchProvider(name, simulated(name, queries), timeout=TIMEOUT_SECONDS / SPEEDUP) for name in SOURCES
+    ], max_workers=16)
+    latencies = []
+    for i in range(len(queries)):
+        start = time.perf_counter()
+        orchestrator.search(str(i))
+        latencies.append((time.perf_counter() - start) * SPEEDUP)
+    orchestrator.shutdown()
+    return latencies, orchestrator.stats()
+
+def main():
+    queries = plan(random.Random(5))
+    print(f"{QUERIES} queries, times in simulated seconds, {TIMEOUT_SECONDS:.0f} s per-source timeout for fan-out")
+    old = np.array(sequential(queries))
+    new, stats = fan_out(queries)
+    new = np.array(new)
+    print(f"{'':>12} {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}")
+    for label, latencies in [('sequential', old), ('fan-out', new)]:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"{label:>12} {latencies.mean():>7.2f} {p50:>7.2f} {p95:>7.2f} {p99:>7.2f} {latencies.max():>7.2f}")
+    print(f"Fan-out wins: {stats['wins']}, timeouts: {stats['timeouts']}")
+
+if __name__ == "__main__":
+    main()
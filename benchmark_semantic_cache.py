@@ -0,0 +1,63 @@
+import sys
+import time
+import numpy as np
+from semantic_cache import SemanticCache, SemanticIndex, embed
+
+DEFAULT_ENTRIES = 50_000
+# Ways students ask the same few questions
+PARAPHRASES = [
+    ["what are my grades", "show my marks", "tell me my scores", "what marks did I get", "my scores please"],
+    ["what courses am I taking", "list my subjects", "which classes am I enrolled in", "show my courses"],
+    ["when are the exams", "exam schedule", "when is the examination", "show the exam timetable"],
+    ["what are my grades in semester 2", "show my marks for semester 2", "semester 2 scores"],
+    ["when is the next holiday", "next vacation", "when is the next break"],
+]
+
+def paraphrase_workload(students=200, questions=5000, seed=5):
+    """Simulated chat traffic: hit rate and model calls saved."""
+    rng = np.random.default_rng(seed)
+    cache = SemanticCache()
+    for _ in range(questions):
+        student = f"REG{rng.integers(students):05d}"
+        group = PARAPHRASES[rng.integers(len(PARAPHRASES))]
+        query = group[rng.integers(len(group))]
+        scope = ('search', student)
+        if cache.get(query, scope) is None:
+            cache.record_llm_call()
+            cache.set(query, f"answer for {student}", scope)
+    return cache.stats()
+
+def lookup_latency(entries, queries=1000, seed=9):
+    """Nearest-neighbour lookups in one large scope: exact scan versus LSH candidates."""
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"word{i}" for i in range(5000)]
+    texts = [list(rng.choice(vocabulary, size=4)) for _ in range(entries)]
+    vectors = [embed(words) for words in texts]
+    results = {}
+    for name, limit in (('exact', entries), ('lsh', 0)):
+        index = SemanticIndex(maxsize=entries, brute_force_limit=limit)
+        start = time.perf_counter()
+        for row, vector in enumerate(vectors):
+            index.add(vector, row)
+        build = time.perf_counter() - start
+        targets = rng.integers(entries, size=queries)
+        found = 0
+        start = time.perf_counter()
+        for target in targets:
+            found += index.nearest(vectors[target], minimum=0.9)[1] == target
+        seconds = time.perf_counter() - start
+        results[name] = (build, seconds / queries * 1000, found / queries)
+    return results
+
+def main(entries):
+    stats = paraphrase_workload()
+    print(f"Paraphrase workload: {stats['lookups']} questions, hit rate {stats['hit_rate']:.1%}, "
+          f"{stats['llm_calls']} model calls, {stats['llm_calls_saved']} saved, "
+          f"avg lookup {stats['avg_lookup_ms']:.3f} ms")
+    print(f"Index of {entries} entries in one scope:")
+    print(f"{'index':>6} {'build (s)':>10} {'ms/lookup':>10} {'recall':>7}")
+    for name, (build, ms, recall) in lookup_latency(entries).items():
+        print(f"{name:>6} {build:>10.2f} {ms:>10.3f} {recall:>7.1%}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRIES)
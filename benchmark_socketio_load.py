@@ -0,0 +1,117 @@
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import requests
+import socketio
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Socket.IO load test: connections/s and messages/s")
+    parser.add_argument('--url', help="Server to test (default: start serve.py locally)")
+    parser.add_argument('--workers', type=int, default=2, help="Workers for the locally started server")
+    parser.add_argument('--async-mode', default='auto')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--messages', type=int, default=20, help="Messages per client")
+    parser.add_argument('--message', default='hello')
+    parser.add_argument('--registration-number', default='REG2023001')
+    return parser.parse_args()
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_server(workers, async_mode):
+    port = free_port()
+    env = dict(os.environ, DATA_WATCH_INTERVAL='0')
+    process = subprocess.Popen(
+        [sys.executable, 'serve.py', '--host', '127.0.0.1', '--port', str(port),
+         '--workers', str(workers), '--async-mode', async_mode],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(300):
+        try:
+            requests.get(f"{url}/login", timeout=5)
+            # Give every worker time to finish loading before measuring
+            time.sleep(workers * 0.5)
+            return process, url
+        except requests.RequestException:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+def login_cookie(url, registration_number):
+    session = requests.Session()
+    session.post(f"{url}/login", data={'registration_number': registration_number}, allow_redirects=False)
+    return '; '.join(f"{name}={value}" for name, value in session.cookies.items())
+
+class LoadClient:
+    """One simulated student sending messages and waiting for each reply."""
+
+    def __init__(self, url, cookie):
+        self.url = url
+        self.cookie = cookie
+        self.client = socketio.Client(reconnection=False)
+        self.reply = threading.Event()
+        self.latencies = []
+        self.errors = 0
+        self.client.on('response', lambda data: self.reply.set())
+
+    def connect(self):
+        self.client.connect(self.url, headers={'Cookie': self.cookie}, transports=['websocket'])
+
+    def run(self, message, count):
+        for _ in range(count):
+            self.reply.clear()
+            start = time.perf_counter()
+            self.client.emit('message', {'message': message})
+            if self.reply.wait(10):
+                self.latencies.append(time.perf_counter() - start)
+            else:
+                self.errors += 1
+
+def run_parallel(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+def main():
+    args = parse_args()
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args.workers, args.async_mode)
+    try:
+        cookie = login_cookie(url, args.registration_number)
+        clients = [LoadClient(url, cookie) for _ in range(args.clients)]
+
+        connect_seconds = run_parallel([client.connect for client in clients])
+        message_seconds = run_parallel([lambda client=client: client.run(args.message, args.messages) for client in clients])
+
+        latencies = sorted(latency for client in clients for latency in client.latencies)
+        errors = sum(client.errors for client in clients)
+        for client in clients:
+            client.client.disconnect()
+
+        print(f"Server:        {url}" + (f" ({args.workers} worker(s), {args.async_mode})" if process else ""))
+        print(f"Connections:   {args.clients} in {connect_seconds:.2f} s ({args.clients / connect_seconds:.1f}/s)")
+        print(f"Messages:      {len(latencies)} in {message_seconds:.2f} s ({len(latencies) / message_seconds:.1f}/s), "
+              f"{errors} timed out")
+        if latencies:
+            print(f"Latency (ms):  p50 {latencies[len(latencies) // 2] * 1000:.1f}, "
+                  f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}, max {latencies[-1] * 1000:.1f}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import random
+import tempfile
+import time
+from speech_synthesis import AudioCache, SpeechSynthesis, StubSynthesizer
+
+# Simulated engine cost per character of text
+SECONDS_PER_CHAR = 0.0005
+FIXED_PHRASES = [
+    "Hello! I'm Raizel, your AI assistant. How can I help you today?",
+    "Hi there! How can I assist you?",
+    "Goodbye! Have a great day!",
+    "I'm not sure about that. Would you like me to search the internet for more information?",
+    "I didn't hear anything. Please try again.",
+    "I couldn't understand what you said. Please try again.",
+]
+DYNAMIC_SHARE = 0.4
+REQUESTS = 300
+
+def workload():
+    rng = random.Random(7)
+    texts = []
+    for i in range(REQUESTS):
+        if rng.random() < DYNAMIC_SHARE:
+            texts.append(f"Your marks in course CS{rng.randint(100, 999)} are {rng.randint(40, 100)} out of 100.")
+        else:
+            texts.append(rng.choice(FIXED_PHRASES))
+    return texts
+
+def run(texts, synthesis):
+    start = time.perf_counter()
+    for text in texts:
+        synthesis.synthesize(text)
+    return time.perf_counter() - start
+
+def main():
+    texts = workload()
+    print(f"{REQUESTS} voice replies, {1 - DYNAMIC_SHARE:.0%} fixed phrases, {SECONDS_PER_CHAR * 1000:.1f} ms per char synthesis")
+    print(f"{'':>22} {'time (s)':>9} {'syntheses':>10} {'hit rate':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        runs = [
+            ('no cache', SpeechSynthesis(StubSynthesizer(SECONDS_PER_CHAR), AudioCache(maxsize=1), 'wav'), False),
+            ('cache, cold disk', SpeechSynthesis(StubSynthesizer(SECONDS_PER_CHAR), AudioCache(directory=directory), 'wav'), True),
+            ('cache, after restart', SpeechSynthesis(StubSynthesizer(SECONDS_PER_CHAR), AudioCache(directory=directory), 'wav'), True),
+        ]
+        for label, synthesis, cached in runs:
+            if cached:
+                synthesis.register_phrases(FIXED_PHRASES)
+            elapsed = run(texts, synthesis)
+            stats = synthesis.stats()
+            print(f"{label:>22} {elapsed:>9.2f} {stats['syntheses']:>10} {stats['cache']['hit_rate']:>9.1%}")
+
+if __name__ == "__main__":
+    main()
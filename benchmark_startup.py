@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+RUNS = 3
+REGISTRATION_NUMBER = 'REG2023001'
+# Prefix of the child's result line; background threads may print after it
+RESULT_MARKER = 'STARTUP_RESULT '
+
+def start_once(mode):
+    """Child process: import app, optionally warm every subsystem, answer one message; print timings as JSON."""
+    start = time.perf_counter()
+    import app
+    imported = time.perf_counter()
+    warm_up = {}
+    if mode == 'eager':
+        # What Raizel.__init__ and the module imports used to do before the first request
+        warm_up = app.raizel.warm_up()
+    ready = time.perf_counter()
+    app.build_reply("hello", REGISTRATION_NUMBER)
+    replied = time.perf_counter()
+    print(RESULT_MARKER + json.dumps({
+        'import_seconds': imported - start,
+        'startup_seconds': ready - start,
+        'first_reply_seconds': replied - start,
+        'warm_up': warm_up
+    }), flush=True)
+
+def run_child(mode):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', mode],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout
+    for line in output.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError(f"No result from the {mode} child process:\n{output}")
+
+def main():
+    results = {}
+    for mode in ['eager', 'lazy']:
+        runs = [run_child(mode) for _ in range(RUNS)]
+        results[mode] = {key: min(run[key] for run in runs) for key in ['import_seconds', 'startup_seconds', 'first_reply_seconds']}
+        results[mode]['warm_up'] = runs[0]['warm_up']
+
+    print(f"Best of {RUNS} fresh processes, seconds from the start of 'import app'")
+    print(f"{'mode':>6} {'import':>8} {'ready':>8} {'first text reply':>17}")
+    for mode, result in results.items():
+        print(f"{mode:>6} {result['import_seconds']:>8.3f} {result['startup_seconds']:>8.3f} {result['first_reply_seconds']:>17.3f}")
+    print("Eager warm-up by subsystem: " + ", ".join(
+        f"{name} {seconds:.3f}" for name, seconds in results['eager']['warm_up'].items()))
+    print(f"Startup reduction: {results['eager']['startup_seconds'] / results['lazy']['startup_seconds']:.1f}x")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--child':
+        start_once(sys.argv[2])
+    else:
+        main()
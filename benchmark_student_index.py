@@ -0,0 +1,44 @@
+import time
+import numpy as np
+import pandas as pd
+from student_index import StudentIndex
+
+SUBJECTS_PER_STUDENT = 20
+STUDENT_COUNTS = [250, 25_000, 250_000]
+
+def make_marks_table(num_students):
+    """Build a synthetic SubjectWise_Marks-shaped table."""
+    registration_numbers = np.array([f"REG{i:07d}" for i in range(num_students)], dtype=object)
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Registration_Number': np.repeat(registration_numbers, SUBJECTS_PER_STUDENT),
+        'Semester': np.tile(np.repeat(np.arange(1, 5), SUBJECTS_PER_STUDENT // 4), num_students),
+        'Subject': np.tile([f"Subject {j}" for j in range(SUBJECTS_PER_STUDENT)], num_students),
+        'Marks': rng.integers(30, 100, num_students * SUBJECTS_PER_STUDENT)
+    }), registration_numbers
+
+def time_lookups(lookup, keys):
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter() - start) / len(keys)
+
+def main():
+    print(f"{'students':>10} {'rows':>10} {'mask (us)':>12} {'index (us)':>12} {'speedup':>9} {'build (ms)':>11}")
+    print("-" * 70)
+    for num_students in STUDENT_COUNTS:
+        marks, registration_numbers = make_marks_table(num_students)
+        keys = np.random.default_rng(7).choice(registration_numbers, 200)
+
+        start = time.perf_counter()
+        index = StudentIndex({'marks': marks})
+        build_time = time.perf_counter() - start
+
+        mask_time = time_lookups(lambda reg: marks[marks['Registration_Number'] == reg], keys[:20])
+        index_time = time_lookups(lambda reg: index.lookup('marks', reg), keys)
+
+        print(f"{num_students:>10} {len(marks):>10} {mask_time * 1e6:>12.1f} {index_time * 1e6:>12.1f} "
+              f"{mask_time / index_time:>8.0f}x {build_time * 1e3:>11.1f}")
+
+if __name__ == "__main__":
+    main()
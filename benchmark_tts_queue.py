@@ -0,0 +1,72 @@
+import time
+from tts_queue import SpeechQueue
+
+# Simulated engine costs: synthesis before the first sound, then playback, per character
+SYNTHESIS_SECONDS_PER_CHAR = 0.0004
+PLAYBACK_SECONDS_PER_CHAR = 0.0008
+ANSWERS = [
+    "Hi there! How can I assist you?",
+    "Your CGPA is 8.4. You have 3 pending tasks this week. The next one is due on Friday.",
+    "Python is a high-level, general-purpose programming language. Its design philosophy emphasizes "
+    "code readability with the use of significant indentation. Python is dynamically typed and garbage-collected. "
+    "It supports multiple programming paradigms, including structured, object-oriented and functional programming. "
+    "It is often described as a batteries included language due to its comprehensive standard library.",
+]
+
+class SimulatedEngine:
+    """pyttsx3 stand-in: synthesizes the whole utterance, then plays it."""
+
+    def __init__(self):
+        self._callbacks = {}
+        self._text = ''
+        self.first_audio_at = None
+
+    def connect(self, topic, callback):
+        self._callbacks.setdefault(topic, []).append(callback)
+
+    def say(self, text):
+        self._text = text
+
+    def runAndWait(self):
+        time.sleep(len(self._text) * SYNTHESIS_SECONDS_PER_CHAR)
+        if self.first_audio_at is None:
+            self.first_audio_at = time.perf_counter()
+        for callback in self._callbacks.get('started-utterance', []):
+            callback(self._text)
+        time.sleep(len(self._text) * PLAYBACK_SECONDS_PER_CHAR)
+
+    def stop(self):
+        pass
+
+def blocking(text):
+    """The old speak(): say() plus runAndWait() on the caller's thread."""
+    engine = SimulatedEngine()
+    start = time.perf_counter()
+    engine.say(text)
+    engine.runAndWait()
+    returned = time.perf_counter()
+    return engine.first_audio_at - start, returned - start
+
+def queued(text):
+    engine = SimulatedEngine()
+    speech = SpeechQueue(lambda: engine).start()
+    # Let the worker create its engine before timing, as a running chatbot would have
+    time.sleep(0.01)
+    start = time.perf_counter()
+    speech.say(text)
+    returned = time.perf_counter()
+    speech.wait()
+    speech.shutdown()
+    return engine.first_audio_at - start, returned - start
+
+def main():
+    print(f"{'chars':>6} {'first audio (ms): blocking':>27} {'queued':>8} {'caller blocked (ms): blocking':>30} {'queued':>8}")
+    print("-" * 84)
+    for text in ANSWERS:
+        old_first, old_blocked = blocking(text)
+        new_first, new_blocked = queued(text)
+        print(f"{len(text):>6} {old_first * 1000:>27.1f} {new_first * 1000:>8.1f} "
+              f"{old_blocked * 1000:>30.1f} {new_blocked * 1000:>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import time
+import numpy as np
+import speech_recognition as sr
+from voice_pipeline import NoiseProfile, VoiceActivityDetector, transcribe_segments
+
+SAMPLE_RATE = 16000
+# (leading silence, speech, trailing silence) in seconds; speech 0 is an empty clip
+CLIPS = [(1.5, 2.0, 2.5), (0.5, 3.0, 1.0), (2.0, 0.0, 3.0), (3.0, 1.5, 4.0), (0.2, 6.0, 0.5), (1.0, 0.0, 1.0)] * 20
+
+class RecognizerStub:
+    """Stand-in recognizer costing 20 ms per call plus 10 ms per second of audio."""
+
+    def __init__(self):
+        self.calls = 0
+        self.audio_seconds = 0.0
+
+    def __call__(self, audio):
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        self.calls += 1
+        self.audio_seconds += seconds
+        time.sleep(0.02 + 0.01 * seconds)
+        raw = np.frombuffer(audio.frame_data, dtype=np.int16).astype(np.float32)
+        if np.sqrt((raw * raw).mean()) < 500:
+            raise sr.UnknownValueError()
+        return "what are my marks"
+
+def make_clip(rng, leading, speech, trailing):
+    t = np.arange(int(SAMPLE_RATE * speech)) / SAMPLE_RATE
+    voice = 6000 * np.sin(2 * np.pi * 180 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    samples = np.concatenate([np.zeros(int(SAMPLE_RATE * leading)), voice, np.zeros(int(SAMPLE_RATE * trailing))])
+    samples += rng.normal(0, 120, samples.size)
+    return sr.AudioData(samples.astype(np.int16).tobytes(), SAMPLE_RATE, 2)
+
+def run(clips, use_vad):
+    recognize = RecognizerStub()
+    profile = NoiseProfile()
+    vad = VoiceActivityDetector()
+    understood = 0
+    start = time.perf_counter()
+    for clip in clips:
+        try:
+            if use_vad:
+                profile.observe(clip)
+                segments = vad.split(clip, profile.recognizer.energy_threshold)
+                if not segments:
+                    continue
+                transcribe_segments(segments, recognize)
+            else:
+                recognize(clip)
+            understood += 1
+        except sr.UnknownValueError:
+            pass
+    return time.perf_counter() - start, recognize, understood, vad
+
+def main():
+    rng = np.random.default_rng(3)
+    clips = [make_clip(rng, *layout) for layout in CLIPS]
+    total_seconds = sum(sum(layout) for layout in CLIPS)
+    print(f"{len(clips)} clips, {total_seconds:.0f} s of audio")
+    print(f"{'':>10} {'time (s)':>9} {'recognizer calls':>17} {'audio recognized (s)':>21} {'understood':>11}")
+    for label, use_vad in [('no VAD', False), ('VAD', True)]:
+        elapsed, recognize, understood, vad = run(clips, use_vad)
+        print(f"{label:>10} {elapsed:>9.2f} {recognize.calls:>17} {recognize.audio_seconds:>21.1f} {understood:>11}")
+    print(f"VAD stats: {vad.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import base64
+import io
+import os
+import tempfile
+import time
+import wave
+import numpy as np
+import speech_recognition as sr
+from voice_pipeline import decode_data_url, read_audio, NoiseProfiles
+
+SAMPLE_RATE = 16000
+CLIP_SECONDS = [1, 3, 8]
+UTTERANCES = 200
+
+def make_data_url(seconds):
+    """A browser-style base64 WAV data URL containing a tone over noise."""
+    rng = np.random.default_rng(seconds)
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    samples = 4000 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 300, t.size)
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+    return "data:audio/wav;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+def recognize_stub(audio):
+    """Local stand-in for recognize_google so only the audio handling is measured."""
+    return "what are my marks" if audio.get_raw_data() else ""
+
+def temp_file_path(audio_data):
+    """The original handler: decode, write a temp file, reopen it, unlink it."""
+    audio_bytes = base64.b64decode(audio_data.split(',')[1])
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_audio:
+        temp_audio.write(audio_bytes)
+        temp_audio_path = temp_audio.name
+    recognizer = sr.Recognizer()
+    with sr.AudioFile(temp_audio_path) as source:
+        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+        audio = recognizer.record(source)
+    os.unlink(temp_audio_path)
+    return recognize_stub(audio)
+
+def in_memory_path(audio_data):
+    """In memory with a new Recognizer per utterance and no noise calibration."""
+    audio = read_audio(decode_data_url(audio_data), sr.Recognizer())
+    return recognize_stub(audio)
+
+noise_profiles = NoiseProfiles()
+
+def session_profile_path(audio_data):
+    """In memory with the session's Recognizer and cached noise profile."""
+    audio = noise_profiles.record('benchmark-session', decode_data_url(audio_data))
+    return recognize_stub(audio)
+
+def utterances_per_second(func, audio_data):
+    start = time.perf_counter()
+    for _ in range(UTTERANCES):
+        func(audio_data)
+    return UTTERANCES / (time.perf_counter() - start)
+
+def main():
+    print(f"{'clip (s)':>9} {'temp file (utt/s)':>18} {'in memory (utt/s)':>18} {'speedup':>9} "
+          f"{'session profile (utt/s)':>24} {'speedup':>9}")
+    print("-" * 93)
+    for seconds in CLIP_SECONDS:
+        audio_data = make_data_url(seconds)
+        assert temp_file_path(audio_data) == in_memory_path(audio_data) == session_profile_path(audio_data)
+        old = utterances_per_second(temp_file_path, audio_data)
+        new = utterances_per_second(in_memory_path, audio_data)
+        profiled = utterances_per_second(session_profile_path, audio_data)
+        print(f"{seconds:>9} {old:>18.1f} {new:>18.1f} {new / old:>8.2f}x {profiled:>24.1f} {profiled / old:>8.2f}x")
+    print(f"Noise profile: {noise_profiles.stats()}")
+
+if __name__ == "__main__":
+    main()
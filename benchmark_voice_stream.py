@@ -0,0 +1,71 @@
+import base64
+import threading
+import time
+import speech_recognition as sr
+from voice_pipeline import decode_data_url
+from voice_stream import VoiceStream
+from worker_pool import WorkerPool
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+CHUNK_SECONDS = 0.25
+UTTERANCE_SECONDS = [2, 5, 10]
+# Simulated time runs this many times faster than wall-clock time
+SPEEDUP = 10
+
+def recognize_stub(audio):
+    """Stand-in recognizer: 300 ms round trip plus 50 ms per second of audio (simulated time)."""
+    seconds = len(audio.get_raw_data()) / (SAMPLE_RATE * SAMPLE_WIDTH)
+    time.sleep((0.3 + 0.05 * seconds) / SPEEDUP)
+    return "what are my marks"
+
+def one_shot(pcm):
+    """The current protocol: the whole clip is uploaded as base64 after the student stops talking."""
+    speech_seconds = len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH)
+    payload = "data:audio/wav;base64," + base64.b64encode(pcm).decode('ascii')
+    start = time.perf_counter()
+    recognize_stub(sr.AudioData(decode_data_url(payload), SAMPLE_RATE, SAMPLE_WIDTH))
+    after_end = (time.perf_counter() - start) * SPEEDUP
+    # The first (and only) transcript arrives after the speech plus recognition
+    return speech_seconds + after_end, after_end, len(payload)
+
+def streamed(pcm, pool):
+    """Binary chunks arriving in real time, with interim recognitions on the worker pool."""
+    stream = VoiceStream(recognize_stub, SAMPLE_RATE, SAMPLE_WIDTH)
+    chunk_bytes = int(SAMPLE_RATE * SAMPLE_WIDTH * CHUNK_SECONDS)
+    first_transcript = []
+    start = time.perf_counter()
+
+    def on_interim(text):
+        if text and not first_transcript:
+            first_transcript.append((time.perf_counter() - start) * SPEEDUP)
+
+    for offset in range(0, len(pcm), chunk_bytes):
+        time.sleep(CHUNK_SECONDS / SPEEDUP)
+        if stream.append(pcm[offset:offset + chunk_bytes]):
+            pool.submit(stream.interim_transcript, on_result=on_interim)
+
+    ended = time.perf_counter()
+    done = threading.Event()
+    pool.submit(stream.final_transcript, on_result=lambda result: done.set())
+    done.wait()
+    after_end = (time.perf_counter() - ended) * SPEEDUP
+    speech_seconds = len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH)
+    return (first_transcript[0] if first_transcript else speech_seconds + after_end), after_end, len(pcm)
+
+def main():
+    pool = WorkerPool('benchmark', max_workers=4)
+    print("Times are in simulated seconds from the start of speech")
+    print(f"{'speech (s)':>10} {'first transcript: one-shot':>27} {'streamed':>9} "
+          f"{'after end: one-shot':>20} {'streamed':>9} {'upload bytes: base64':>21} {'binary':>9}")
+    print("-" * 112)
+    for seconds in UTTERANCE_SECONDS:
+        pcm = b'\x00\x01' * int(SAMPLE_RATE * seconds)
+        old_first, old_after, old_bytes = one_shot(pcm)
+        new_first, new_after, new_bytes = streamed(pcm, pool)
+        print(f"{seconds:>10} {old_first:>27.2f} {new_first:>9.2f} "
+              f"{old_after:>20.2f} {new_after:>9.2f} {old_bytes:>21} {new_bytes:>9}")
+    pool.shutdown()
+
+if __name__ == "__main__":
+    main()
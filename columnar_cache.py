@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 2
+CACHE_SUFFIX = '.npycache'
+
+def cache_dir_for(csv_path):
+    """Return the cache directory kept next to csv_path."""
+    directory, name = os.path.split(csv_path)
+    return os.path.join(directory, f".{name}{CACHE_SUFFIX}")
+
+def source_hash(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _signature(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, 'manifest.json')) as f:
+            manifest = json.load(f)
+        return manifest if manifest.get('version') == CACHE_VERSION else None
+    except (OSError, ValueError):
+        return None
+
+def _atomic_write(path, write, mode='wb'):
+    """Write path through a per-process temp file and os.replace, so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_manifest(cache_dir, manifest):
+    _atomic_write(os.path.join(cache_dir, 'manifest.json'), lambda f: json.dump(manifest, f), mode='w')
+
+def _is_string_column(series):
+    return pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty')
+
+def is_fresh(csv_path, manifest):
+    """
+    Check whether a cache manifest still describes csv_path.
+
+    The (mtime, size) signature is checked first; only if it differs is the
+    file re-hashed, so an untouched CSV is validated without reading it.
+    A touched-but-identical file gets its manifest signature refreshed.
+    """
+    if manifest is None:
+        return False
+    signature = _signature(csv_path)
+    if manifest.get('source_signature') == signature:
+        return True
+    if manifest.get('source_sha256') != source_hash(csv_path):
+        return False
+    manifest['source_signature'] = signature
+    _write_manifest(cache_dir_for(csv_path), manifest)
+    return True
+
+def write_cache(csv_path, df, digest=None):
+    """
+    Write df as a columnar cache next to csv_path.
+
+    Numeric columns are stored as raw .npy arrays. String columns are
+    dictionary-encoded: int32 codes in a .npy file (-1 marks a missing value)
+    plus the distinct values in a JSON file. Any other column (e.g. booleans
+    mixed with NaN) is pickled as-is so its values keep their types. Every
+    file is replaced atomically, since several server workers share the cache.
+
+    Args:
+        csv_path (str): The CSV the DataFrame was parsed from
+        df (pd.DataFrame): The parsed data
+        digest (str, optional): SHA-256 of csv_path if already known
+    """
+    cache_dir = cache_dir_for(csv_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    digest = digest or source_hash(csv_path)
+    prefix = digest[:16]
+    columns = []
+
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        entry = {'name': name, 'dtype': str(series.dtype)}
+        if series.dtype.kind in 'biuf':
+            entry['kind'] = 'numeric'
+            entry['file'] = f"{prefix}.{i}.npy"
+            array = series.to_numpy()
+            _atomic_write(os.path.join(cache_dir, entry['file']), lambda f: np.save(f, array))
+        elif _is_string_column(series):
+            codes, uniques = pd.factorize(series)
+            entry['kind'] = 'dictionary'
+            entry['file'] = f"{prefix}.{i}.codes.npy"
+            entry['values_file'] = f"{prefix}.{i}.values.json"
+            entry['has_nulls'] = bool((codes < 0).any())
+            codes = codes.astype(np.int32)
+            _atomic_write(os.path.join(cache_dir, entry['file']), lambda f: np.save(f, codes))
+            _atomic_write(os.path.join(cache_dir, entry['values_file']),
+                          lambda f: json.dump([str(value) for value in uniques], f), mode='w')
+        else:
+            entry['kind'] = 'object'
+            entry['file'] = f"{prefix}.{i}.object.npy"
+            array = series.to_numpy(dtype=object)
+            _atomic_write(os.path.join(cache_dir, entry['file']), lambda f: np.save(f, array, allow_pickle=True))
+        columns.append(entry)
+
+    # Publishing the manifest is the atomic switch to the new cache contents
+    _write_manifest(cache_dir, {
+        'version': CACHE_VERSION,
+        'source_sha256': digest,
+        'source_signature': _signature(csv_path),
+        'rows': len(df),
+        'columns': columns
+    })
+
+    # Drop column files left over from older versions of the CSV (other workers' temp files are left alone)
+    for file in os.listdir(cache_dir):
+        if not file.startswith(prefix) and file != 'manifest.json' and not file.endswith('.tmp'):
+            try:
+                os.remove(os.path.join(cache_dir, file))
+            except OSError:
+                pass
+
+def read_cache(csv_path, manifest=None):
+    """
+    Load the cached DataFrame for csv_path without checking freshness.
+
+    Numeric columns are memory-mapped; dictionary columns are rebuilt by
+    indexing the distinct values with the memory-mapped codes, so repeated
+    strings share one Python object.
+    """
+    cache_dir = cache_dir_for(csv_path)
+    manifest = manifest or _read_manifest(cache_dir)
+    data = {}
+    for entry in manifest['columns']:
+        if entry['kind'] == 'object':
+            values = np.load(os.path.join(cache_dir, entry['file']), allow_pickle=True)
+            data[entry['name']] = pd.Series(values, dtype=entry['dtype'])
+            continue
+        values = np.load(os.path.join(cache_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'dictionary':
+            with open(os.path.join(cache_dir, entry['values_file'])) as f:
+                uniques = np.array(json.load(f) + [np.nan], dtype=object)
+            if entry['has_nulls']:
+                # Code -1 (missing) maps to the trailing NaN
+                values = np.where(values < 0, len(uniques) - 1, values)
+            values = uniques.take(values)
+        data[entry['name']] = pd.Series(values, dtype=entry['dtype'], copy=False)
+    return pd.DataFrame(data, columns=[entry['name'] for entry in manifest['columns']])
+
+def load_csv_cached(csv_path):
+    """
+    Read csv_path through its columnar cache.
+
+    Serves the cache when it matches the CSV's content hash, otherwise parses
+    the CSV and rewrites the cache. Cache failures never block the CSV path.
+
+    Returns:
+        pd.DataFrame: The dataset
+    """
+    manifest = _read_manifest(cache_dir_for(csv_path))
+    try:
+        if is_fresh(csv_path, manifest):
+            return read_cache(csv_path, manifest)
+    except Exception as e:
+        print(f"Ignoring unreadable cache for {csv_path}: {str(e)}")
+
+    df = pd.read_csv(csv_path)
+    try:
+        write_cache(csv_path, df)
+    except Exception as e:
+        print(f"Could not write columnar cache for {csv_path}: {str(e)}")
+    return df
@@ -0,0 +1,154 @@
+import json
+import threading
+import time
+from reply_formatting import UPCOMING_TASK_COUNT, latest_semester_marks, academic_data_records
+
+def _json_default(value):
+    # numpy scalars (e.g. from Series.max()) serialize as their Python value
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+def serialize(payload):
+    """Serialize a payload the way Flask's jsonify does (sorted keys, compact), as UTF-8 bytes."""
+    return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+class DashboardEntry:
+    """Precomputed dashboard data for one student."""
+
+    def __init__(self, template_context, api_payload):
+        self.template_context = template_context
+        self.api_json = serialize(api_payload)
+
+class DashboardView:
+    """Materialized per-student dashboard payloads for one data generation.
+
+    Everything index() and /api/dashboard need (profile, latest semester marks
+    with pass/fail, averages, course details, upcoming tasks) is computed once
+    per student and kept, together with the pre-serialized API JSON, until the
+    next data generation replaces the view.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.generation = snapshot.generation
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.build_seconds = 0.0
+
+        tasks_data = snapshot.get_tasks_data()
+        self.upcoming_tasks = tasks_data.head(UPCOMING_TASK_COUNT).to_dict('records') if tasks_data is not None else []
+
+    def build_all(self):
+        """Precompute entries for every student with a profile."""
+        start = time.perf_counter()
+        student_data = self.snapshot.get_student_data()
+        if student_data is not None:
+            for registration_number in student_data['Registration_Number'].dropna().unique():
+                self.get(registration_number)
+        self.build_seconds = time.perf_counter() - start
+        print(f"Built {len(self._entries)} dashboard entries for generation {self.generation} "
+              f"in {self.build_seconds * 1000:.1f} ms")
+        return self
+
+    def get(self, registration_number):
+        """Return the student's DashboardEntry (building it on first use), or None if unknown."""
+        entry = self._entries.get(registration_number)
+        if entry is None:
+            entry = self._build_entry(registration_number)
+            if entry is not None:
+                with self._lock:
+                    self._entries.setdefault(registration_number, entry)
+        return entry
+
+    def _build_entry(self, registration_number):
+        profile = self.snapshot.get_student_profile(registration_number)
+        if profile is None or profile.empty:
+            return None
+        profile = profile.iloc[0].to_dict()
+
+        student_marks = self.snapshot.get_student_marks(registration_number)
+        student_courses = self.snapshot.get_student_courses(registration_number)
+        marks_records = student_marks.to_dict('records') if student_marks is not None else []
+        course_records = student_courses.to_dict('records') if student_courses is not None else []
+
+        # Latest semester marks with pass/fail status
+        latest_semester = None
+        academic_data = []
+        average_marks = None
+        if marks_records:
+            latest_semester, latest_marks = latest_semester_marks(student_marks)
+            academic_data = academic_data_records(latest_marks)
+            average_marks = latest_marks['Marks'].mean()
+
+        course_details = [
+            {
+                'department': record['Department'],
+                'enrollment_year': record['Enrollment_Year'],
+                'expected_graduation': record['Expected_Graduation']
+            }
+            for record in course_records
+        ]
+
+        # Get skills and projects (assuming these are in the student profile)
+        skills = profile.get('Skills', '').split(',') if 'Skills' in profile else []
+        projects = profile.get('Projects', '').split(',') if 'Projects' in profile else []
+
+        template_context = {
+            'user': profile['Name'],
+            'academic_data': academic_data,
+            'tasks': self.upcoming_tasks,
+            'course_details': course_details
+        }
+        api_payload = {
+            'profile': {
+                'name': profile.get('Name', ''),
+                'registration_number': profile.get('Registration_Number', ''),
+                'email': profile.get('Email', ''),
+                'skills': skills,
+                'projects': projects
+            },
+            'upcoming_tasks': self.upcoming_tasks,
+            'marks': marks_records,
+            'courses': course_records,
+            'latest_semester': {
+                'semester': latest_semester,
+                'subjects': academic_data,
+                'average_marks': average_marks
+            }
+        }
+        return DashboardEntry(template_context, api_payload)
+
+    def stats(self):
+        """Return view counters suitable for a metrics endpoint."""
+        return {
+            'generation': self.generation,
+            'entries': len(self._entries),
+            'build_seconds': self.build_seconds,
+            'json_bytes': sum(len(entry.api_json) for entry in list(self._entries.values()))
+        }
+
+class DashboardViews:
+    """Keeps the DashboardView for the data store's current generation."""
+
+    def __init__(self, store):
+        self.store = store
+        self._view = None
+        self._lock = threading.Lock()
+
+    def current(self, snapshot=None):
+        """Return the view for snapshot (default: the store's current one), building it if needed."""
+        snapshot = snapshot or self.store.snapshot()
+        view = self._view
+        if view is None or view.generation != snapshot.generation:
+            with self._lock:
+                view = self._view
+                if view is None or view.generation != snapshot.generation:
+                    view = DashboardView(snapshot)
+                    if view.generation >= self.store.generation:
+                        self._view = view
+        return view
+
+    def rebuild(self):
+        """Eagerly build every entry for the current generation (run off the request path)."""
+        return self.current().build_all()
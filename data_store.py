@@ -0,0 +1,236 @@
+import os
+import threading
+import time
+import pandas as pd
+from student_index import StudentIndex, sort_by_registration
+from columnar_cache import load_csv_cached
+
+# CSV files backing each academic dataset
+DATASET_FILES = {
+    'students': 'Students_Academic_Records.csv',
+    'tasks': 'Academic_Calendar.csv',
+    'marks': 'SubjectWise_Marks.csv',
+    'courses': 'Student_Course_Details.csv'
+}
+
+# Datasets keyed by Registration_Number and served through the student index
+PER_STUDENT_DATASETS = ('students', 'marks', 'courses')
+
+def file_signature(path):
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+class DataSnapshot:
+    """Immutable view of every dataset and its student index for one data generation.
+
+    Request handlers should grab a snapshot once and use it for every lookup,
+    so a reload that happens mid-request cannot mix rows from two generations.
+    """
+
+    def __init__(self, datasets, generation, signatures):
+        # Group per-student tables by registration number so the index can slice them
+        for name in PER_STUDENT_DATASETS:
+            datasets[name] = sort_by_registration(datasets[name])
+        self.datasets = datasets
+        self.index = StudentIndex({name: datasets[name] for name in PER_STUDENT_DATASETS})
+        self.generation = generation
+        self.signatures = signatures
+        self.loaded_at = time.time()
+
+    def get_student_data(self):
+        """Return the student profiles DataFrame, or None if it failed to load."""
+        return self.datasets['students']
+
+    def get_tasks_data(self):
+        """Return the academic calendar DataFrame, or None if it failed to load."""
+        return self.datasets['tasks']
+
+    def get_marks_data(self):
+        """Return the subject-wise marks DataFrame, or None if it failed to load."""
+        return self.datasets['marks']
+
+    def get_course_details(self):
+        """Return the student course details DataFrame, or None if it failed to load."""
+        return self.datasets['courses']
+
+    def get_student_profile(self, registration_number):
+        """Return the student's profile row as a one-row DataFrame (empty if unknown), or None."""
+        profile = self.index.lookup('students', registration_number)
+        return profile.iloc[:1] if profile is not None else None
+
+    def get_student_marks(self, registration_number):
+        """Return the student's subject-wise marks (empty if none), or None."""
+        return self.index.lookup('marks', registration_number)
+
+    def get_student_courses(self, registration_number):
+        """Return the student's course detail rows (empty if none), or None."""
+        return self.index.lookup('courses', registration_number)
+
+    def as_file_dict(self):
+        """Return the loaded datasets keyed by their CSV file name."""
+        return {
+            DATASET_FILES[name]: df
+            for name, df in self.datasets.items()
+            if df is not None
+        }
+
+    def memory_usage(self):
+        """
+        Report the memory used by each loaded dataset.
+
+        Returns:
+            dict: Dataset name -> bytes used (deep, including string data)
+        """
+        return {
+            name: int(df.memory_usage(deep=True).sum()) if df is not None else 0
+            for name, df in self.datasets.items()
+        }
+
+class AcademicDataStore:
+    """Process-wide, in-memory store for the academic CSV datasets.
+
+    The CSV files are parsed once, on first access, and the resulting
+    DataFrames are shared by every request handler, Raizel and GoogleAIHelper.
+    A reload builds a complete new DataSnapshot off the request path and swaps
+    it in with a single reference assignment, so readers always see one
+    consistent generation.
+    """
+
+    def __init__(self, data_dir=None):
+        self.data_dir = data_dir or os.getenv('RAIZEL_DATA_DIR', '.')
+        self.use_columnar_cache = os.getenv('RAIZEL_COLUMNAR_CACHE', '1') != '0'
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._first_load_lock = threading.Lock()
+        self._reload_listeners = []
+        self.reload_count = 0
+        self.last_reload_seconds = None
+        self.last_reload_error = None
+
+    @property
+    def generation(self):
+        """Generation number of the current snapshot (0 before the first load)."""
+        snapshot = self._snapshot
+        return snapshot.generation if snapshot is not None else 0
+
+    def path_for(self, name):
+        """Return the CSV path backing the named dataset."""
+        return os.path.join(self.data_dir, DATASET_FILES[name])
+
+    def source_signatures(self):
+        """Return the current on-disk signature of every backing CSV."""
+        return {name: file_signature(self.path_for(name)) for name in DATASET_FILES}
+
+    def _read_dataset(self, name):
+        try:
+            if self.use_columnar_cache:
+                return load_csv_cached(self.path_for(name))
+            return pd.read_csv(self.path_for(name))
+        except Exception as e:
+            print(f"Error loading {name} data: {str(e)}")
+            return None
+
+    def load(self):
+        """
+        (Re)load every dataset from disk and swap in the new snapshot.
+
+        If a dataset that loaded previously fails to parse now (for example a
+        CSV caught half-written), the current snapshot is kept.
+
+        Returns:
+            DataSnapshot: The snapshot being served after the call
+        """
+        with self._lock:
+            start = time.perf_counter()
+            signatures = self.source_signatures()
+            datasets = {name: self._read_dataset(name) for name in DATASET_FILES}
+
+            previous = self._snapshot
+            if previous is not None:
+                failed = [
+                    name for name, df in datasets.items()
+                    if df is None and previous.datasets[name] is not None
+                ]
+                if failed:
+                    self.last_reload_error = f"Failed to reload {', '.join(failed)}; keeping generation {previous.generation}"
+                    print(self.last_reload_error)
+                    return previous
+
+            snapshot = DataSnapshot(datasets, self.generation + 1, signatures)
+            self._snapshot = snapshot
+            self.reload_count += 1
+            self.last_reload_seconds = time.perf_counter() - start
+            self.last_reload_error = None
+
+        for name, df in datasets.items():
+            if df is not None:
+                print(f"Loaded {DATASET_FILES[name]} ({len(df)} rows)")
+        print(f"Data generation {snapshot.generation} ready in {self.last_reload_seconds * 1000:.1f} ms")
+        for listener in self._reload_listeners:
+            listener()
+        return snapshot
+
+    def add_reload_listener(self, callback):
+        """Register a callback invoked after every (re)load, e.g. to invalidate caches."""
+        self._reload_listeners.append(callback)
+
+    def snapshot(self):
+        """Return the current DataSnapshot, loading the datasets on first use."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._first_load_lock:
+                snapshot = self._snapshot or self.load()
+        return snapshot
+
+    # Convenience accessors that read from the current snapshot
+    def get_student_data(self):
+        return self.snapshot().get_student_data()
+
+    def get_tasks_data(self):
+        return self.snapshot().get_tasks_data()
+
+    def get_marks_data(self):
+        return self.snapshot().get_marks_data()
+
+    def get_course_details(self):
+        return self.snapshot().get_course_details()
+
+    def get_student_profile(self, registration_number):
+        return self.snapshot().get_student_profile(registration_number)
+
+    def get_student_marks(self, registration_number):
+        return self.snapshot().get_student_marks(registration_number)
+
+    def get_student_courses(self, registration_number):
+        return self.snapshot().get_student_courses(registration_number)
+
+    def as_file_dict(self):
+        return self.snapshot().as_file_dict()
+
+    def memory_usage(self):
+        return self.snapshot().memory_usage()
+
+    def stats(self):
+        """Return a summary of the store suitable for a metrics endpoint."""
+        snapshot = self.snapshot()
+        usage = snapshot.memory_usage()
+        return {
+            'generation': snapshot.generation,
+            'loaded_at': snapshot.loaded_at,
+            'reload_count': self.reload_count,
+            'last_reload_seconds': self.last_reload_seconds,
+            'last_reload_error': self.last_reload_error,
+            'rows': {
+                name: (len(df) if df is not None else 0)
+                for name, df in snapshot.datasets.items()
+            },
+            'memory_bytes': usage,
+            'total_memory_bytes': sum(usage.values())
+        }
+
+# Shared instance used by app.py, Raizel and GoogleAIHelper
+data_store = AcademicDataStore()
@@ -0,0 +1,83 @@
+import os
+import threading
+
+class DataWatcher:
+    """Background thread that reloads the data store when its CSV files change.
+
+    Uses stat polling (mtime and size) so it works on every platform without
+    extra dependencies. A change is only acted on once the file signature has
+    been stable for one full poll interval, so a CSV that is still being
+    written by the registrar export is not picked up half-finished.
+    """
+
+    def __init__(self, store, interval=2.0):
+        self.store = store
+        self.interval = interval
+        self.checks = 0
+        self.changes_detected = 0
+        self._pending = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start watching in a daemon thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='raizel-data-watcher', daemon=True)
+        self._thread.start()
+        print(f"Watching academic CSV files for changes every {self.interval}s")
+        return self
+
+    def stop(self):
+        """Stop the watcher thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+
+    def check(self):
+        """
+        Compare the on-disk CSV signatures with the loaded snapshot and reload if needed.
+
+        Returns:
+            bool: True if a reload was triggered
+        """
+        self.checks += 1
+        current = self.store.source_signatures()
+        if current == self.store.snapshot().signatures:
+            self._pending = None
+            return False
+
+        # Wait until the files stop changing before reloading
+        if current != self._pending:
+            self._pending = current
+            return False
+
+        self._pending = None
+        self.changes_detected += 1
+        print("Academic CSV files changed on disk, reloading...")
+        self.store.load()
+        return True
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Error checking data files: {str(e)}")
+
+    def stats(self):
+        """Return watcher counters suitable for a metrics endpoint."""
+        return {
+            'interval': self.interval,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'checks': self.checks,
+            'changes_detected': self.changes_detected
+        }
+
+def start_data_watcher(store):
+    """Start a DataWatcher for store unless DATA_WATCH_INTERVAL is 0."""
+    interval = float(os.getenv('DATA_WATCH_INTERVAL', '2'))
+    if interval <= 0:
+        return None
+    return DataWatcher(store, interval).start()
@@ -0,0 +1,162 @@
+import codecs
+import re
+from html.parser import HTMLParser
+
+# Subtrees that never hold article text
+SKIP_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'header', 'iframe', 'aside', 'noscript', 'template', 'svg', 'form'])
+
+# Tags that end a run of text, so sentences never straddle two paragraphs or cells
+BLOCK_TAGS = frozenset([
+    'p', 'div', 'br', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'table', 'tr', 'td', 'th', 'caption',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'section', 'article', 'main', 'blockquote', 'pre',
+    'figure', 'figcaption', 'hr', 'body', 'title'
+])
+
+# Elements marked as navigation or page furniture by their class or id (main-content heuristic)
+BOILERPLATE = re.compile(
+    r'(?:^|[\s_-])(?:nav|navbox|navbar|menu|sidebar|footer|cookie|banner|advert|ads|breadcrumbs?|'
+    r'toc|reflist|references?|catlinks|comments?|share|social|related)(?:$|[\s_-])',
+    re.IGNORECASE
+)
+
+# Class names describing the page's state ("has-sidebar", "vector-toc-available"), not the element itself
+STATE_CLASS = re.compile(
+    r'^(?:has|no|with|without|is)-|-(?:available|enabled|disabled|pinned|open|closed|visible|hidden)$|(?:^|-)feature-',
+    re.IGNORECASE
+)
+
+# The only elements the class/id heuristic may skip: containers whose end tag is
+# required, so the skipped subtree always ends (never html, body, main or article)
+BOILERPLATE_TAGS = frozenset(['div', 'section', 'nav', 'aside', 'header', 'footer', 'form', 'ul', 'ol', 'table', 'span', 'sup'])
+
+# A sentence ends at ., ! or ? (optionally followed by a closing quote or bracket)
+# and whitespace, when the next sentence starts with a capital, digit or quote
+SENTENCE_END = re.compile(r'(?<=[.!?])["\'”’)\]]*\s+(?=["\'“‘(\[]?[A-Z0-9])')
+
+WHITESPACE = re.compile(r'\s+')
+
+class SentenceExtractor(HTMLParser):
+    """Streaming HTML-to-sentences parser.
+
+    Text outside SKIP_TAGS and boilerplate class/id containers is collected
+    per block element; each finished block is split into sentences right
+    away, so sentences become available while the page is still being fed
+    and no document tree is ever built. Sentences with min_words words or
+    fewer are dropped.
+    """
+
+    def __init__(self, min_words=5):
+        super().__init__(convert_charrefs=True)
+        self.min_words = min_words
+        self.sentences = []
+        self._text = []
+        self._skip_tag = None
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag in SKIP_TAGS or (tag in BOILERPLATE_TAGS and self._is_boilerplate(attrs)):
+            self._flush()
+            self._skip_tag = tag
+            self._skip_depth = 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>, <img/>: never opens a subtree
+        if self._skip_tag is None and tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            elif tag in ('body', 'html'):
+                # The skipped element was never closed
+                self._skip_tag = None
+            return
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._skip_tag is None:
+            self._text.append(data)
+
+    @staticmethod
+    def _is_boilerplate(attrs):
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == 'class':
+                if any(BOILERPLATE.search(class_name) and not STATE_CLASS.search(class_name) for class_name in value.split()):
+                    return True
+            elif (name == 'id' or name == 'role') and BOILERPLATE.search(value):
+                return True
+        return False
+
+    def _flush(self):
+        if not self._text:
+            return
+        text = WHITESPACE.sub(' ', ''.join(self._text)).strip()
+        self._text = []
+        if not text:
+            return
+        for sentence in SENTENCE_END.split(text):
+            if len(sentence.split()) > self.min_words:
+                self.sentences.append(sentence)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+def iter_chunks(page, chunk_size=16384):
+    """Yield str chunks of page (str, bytes, or an iterable of str/bytes chunks such as response.iter_content())."""
+    if isinstance(page, (str, bytes)):
+        chunks = (page[start:start + chunk_size] for start in range(0, len(page), chunk_size))
+    else:
+        chunks = page
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in chunks:
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+def iter_sentences(page, max_sentences=None, min_words=5, chunk_size=16384):
+    """
+    Stream the content sentences of an HTML page.
+
+    Args:
+        page: HTML as str or bytes, or an iterable of chunks
+        max_sentences (int): Stop parsing once this many sentences were found (None for the whole page)
+        min_words (int): Drop sentences with this many words or fewer
+        chunk_size (int): Chunk size used to feed a whole str/bytes page
+
+    Yields:
+        str: Sentences in page order
+    """
+    parser = SentenceExtractor(min_words=min_words)
+    emitted = 0
+    for chunk in iter_chunks(page, chunk_size):
+        parser.feed(chunk)
+        for sentence in parser.sentences:
+            yield sentence
+            emitted += 1
+            if max_sentences is not None and emitted >= max_sentences:
+                return
+        parser.sentences = []
+    parser.close()
+    for sentence in parser.sentences:
+        yield sentence
+        emitted += 1
+        if max_sentences is not None and emitted >= max_sentences:
+            return
+
+def extract_sentences(page, max_sentences=None, min_words=5):
+    """Return the content sentences of an HTML page as a list (see iter_sentences)."""
+    return list(iter_sentences(page, max_sentences=max_sentences, min_words=min_words))
@@ -0,0 +1,129 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Raizel/1.0 (student assistant; python-requests)'
+
+def http_timeout():
+    """(connect, read) timeout in seconds from HTTP_CONNECT_TIMEOUT and HTTP_READ_TIMEOUT."""
+    return (float(os.getenv('HTTP_CONNECT_TIMEOUT', '3')), float(os.getenv('HTTP_READ_TIMEOUT', '5')))
+
+def create_http_session(pool_size=10, retries=1):
+    """A requests.Session whose keep-alive connection pool is shared by every thread."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=['GET'])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+_http_session = None
+_google_client = None
+_clients_lock = threading.Lock()
+
+def get_http_session():
+    """Return the process-wide pooled session (HTTP_POOL_SIZE connections per host, HTTP_RETRIES retries)."""
+    global _http_session
+    if _http_session is None:
+        with _clients_lock:
+            if _http_session is None:
+                _http_session = create_http_session(
+                    pool_size=int(os.getenv('HTTP_POOL_SIZE', '10')),
+                    retries=int(os.getenv('HTTP_RETRIES', '1'))
+                )
+    return _http_session
+
+class WikipediaClient:
+    """Article summaries from the MediaWiki API in a single round trip over a pooled session.
+
+    The search and the extract are combined with generator=search, instead
+    of the separate search, page-info and extract requests (each on a new
+    connection) that the wikipedia package makes. Disambiguation pages are
+    skipped in favour of the next-ranked article.
+    """
+
+    def __init__(self, session=None, api_url='https://en.wikipedia.org/w/api.php', timeout=None):
+        self.session = session or get_http_session()
+        self.api_url = api_url
+        self.timeout = timeout or http_timeout()
+
+    def summary(self, query, sentences=2):
+        """
+        Return the first sentences of the best-matching article.
+
+        Returns:
+            str: The summary, or None if no article matched
+        """
+        response = self.session.get(self.api_url, params={
+            'action': 'query',
+            'format': 'json',
+            'formatversion': 2,
+            'generator': 'search',
+            'gsrsearch': query,
+            'gsrlimit': 3,
+            'prop': 'extracts|pageprops',
+            'ppprop': 'disambiguation',
+            'exintro': 1,
+            'explaintext': 1,
+            'exsentences': sentences,
+            'redirects': 1
+        }, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if 'error' in data:
+            raise RuntimeError(f"Wikipedia API error: {data['error'].get('info')}")
+        pages = sorted(data.get('query', {}).get('pages', []), key=lambda page: page.get('index', 0))
+        for page in pages:
+            if 'disambiguation' not in page.get('pageprops', {}) and page.get('extract'):
+                return page['extract']
+        return None
+
+class GoogleSearchClient:
+    """Google Custom Search through one discovery client built per process.
+
+    The service object is immutable and shared; httplib2.Http is not
+    thread-safe, so each thread keeps its own keep-alive connection.
+    """
+
+    def __init__(self, api_key, cse_id, timeout=None, api_endpoint=None):
+        from googleapiclient.discovery import build
+        self.cse_id = cse_id
+        self.timeout = timeout or sum(http_timeout())
+        options = {'api_endpoint': api_endpoint} if api_endpoint else None
+        self.service = build('customsearch', 'v1', developerKey=api_key, cache_discovery=False,
+                             static_discovery=True, client_options=options)
+        self._local = threading.local()
+
+    def _http(self):
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            http = self._local.http = httplib2.Http(timeout=self.timeout)
+        return http
+
+    def search(self, query, num=3):
+        """Return the snippet of the first result, or None."""
+        result = self.service.cse().list(q=query, cx=self.cse_id, num=num).execute(http=self._http())
+        if 'items' in result:
+            return result['items'][0]['snippet']
+        return None
+
+def get_google_search_client():
+    """Return the process-wide GoogleSearchClient, or None if GOOGLE_API_KEY/GOOGLE_CSE_ID are not set."""
+    global _google_client
+    api_key = os.getenv('GOOGLE_API_KEY')
+    cse_id = os.getenv('GOOGLE_CSE_ID')
+    if not api_key or not cse_id:
+        return None
+    if _google_client is None:
+        with _clients_lock:
+            if _google_client is None:
+                _google_client = GoogleSearchClient(api_key, cse_id)
+    return _google_client
@@ -0,0 +1,152 @@
+import re
+
+def _trie_pattern(words):
+    """Build a regex alternation for words factored by common prefix, longest match first."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(node[char]) for char in sorted(node) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ending here makes the longer continuations optional (tried first, greedily)
+        return f"(?:{body})?" if '' in node else body
+
+    return build(trie)
+
+class IntentMatch:
+    """Result of classifying one message: every keyword found and the intents they imply."""
+
+    def __init__(self, router, text, lowered, keywords, intents):
+        self.router = router
+        self.text = text
+        self.lowered = lowered
+        self.keywords = keywords
+        # Matched intents, in registration (priority) order
+        self.intents = intents
+
+    def has(self, intent):
+        """Return True if any keyword of intent occurs in the message."""
+        return intent in self.intents
+
+    def keyword_for(self, intent):
+        """Return the first keyword of intent (in registration order) that occurs in the message."""
+        for keyword in self.router.keywords_of(intent):
+            if keyword in self.keywords:
+                return keyword
+        return None
+
+    def text_after(self, keyword):
+        """Return the message text following the last occurrence of keyword."""
+        end = self.lowered.rfind(keyword) + len(keyword)
+        # Slice the original text when lowercasing kept character positions aligned
+        source = self.text if len(self.text) == len(self.lowered) else self.lowered
+        return source[end:].strip()
+
+class IntentRouter:
+    """Keyword intent classifier that scans a message once for every registered keyword.
+
+    All keywords are compiled into one regular expression whose alternation is
+    factored into a prefix trie, so each position is checked character by
+    character instead of keyword by keyword. The alternation sits inside a
+    lookahead so it is tried at every position, which finds every occurrence
+    (including overlapping ones) in a single pass, matching the substring
+    semantics of the `keyword in message` chains it replaces.
+    Matching is case-insensitive.
+    """
+
+    def __init__(self):
+        self.intents = []
+        self._keywords_by_intent = {}
+        self._pattern = None
+        self._expansions = {}
+        self._intent_sets = {}
+        self._handlers = {}
+        self.classified = 0
+
+    def register(self, name, keywords, handler=None):
+        """
+        Register an intent. Intents registered earlier take priority.
+
+        Args:
+            name (str): Intent name
+            keywords (list): Substrings that signal the intent
+            handler (callable, optional): handler(match, **context) returning a reply, or None to pass
+        """
+        keywords = [keyword.lower() for keyword in keywords]
+        self.intents.append((name, frozenset(keywords), handler))
+        self._keywords_by_intent[name] = keywords
+        self._pattern = None
+        return self
+
+    def keywords_of(self, intent):
+        return self._keywords_by_intent.get(intent, [])
+
+    def compile(self):
+        """Build the combined matcher (done automatically on first use)."""
+        keywords = sorted({keyword for _, intent_keywords, _ in self.intents for keyword in intent_keywords})
+        # The regex reports the longest keyword starting at each position, so
+        # precompute, for each keyword, the shorter keywords that are its prefixes
+        # and a bitmask of every intent the group signals
+        self._expansions = {}
+        for keyword in keywords:
+            group = frozenset(other for other in keywords if keyword.startswith(other))
+            mask = 0
+            for bit, (_, intent_keywords, _) in enumerate(self.intents):
+                if not group.isdisjoint(intent_keywords):
+                    mask |= 1 << bit
+            self._expansions[keyword] = (group, mask)
+        self._intent_sets = {}
+        self._handlers = {name: handler for name, _, handler in self.intents}
+        alternation = _trie_pattern(keywords) or '(?!)'
+        self._pattern = re.compile(f"(?=({alternation}))")
+        return self
+
+    def classify(self, text):
+        """Scan text once and return an IntentMatch."""
+        if self._pattern is None:
+            self.compile()
+        self.classified += 1
+        lowered = text.lower()
+        found = set()
+        mask = 0
+        for keyword in set(self._pattern.findall(lowered)):
+            group, keyword_mask = self._expansions[keyword]
+            found |= group
+            mask |= keyword_mask
+        return IntentMatch(self, text, lowered, found, self._intents_for(mask))
+
+    def _intents_for(self, mask):
+        # Intent name lists are shared between matches with the same bitmask
+        intents = self._intent_sets.get(mask)
+        if intents is None:
+            intents = [name for bit, (name, _, _) in enumerate(self.intents) if mask >> bit & 1]
+            self._intent_sets[mask] = intents
+        return intents
+
+    def dispatch(self, text, fallthrough=True, **context):
+        """
+        Classify text and call the handler of the highest-priority matched intent.
+
+        Args:
+            text (str or IntentMatch): The message, or an existing classification of it
+            fallthrough (bool): If a handler returns None, try the next matched intent
+            **context: Extra keyword arguments passed to the handler
+
+        Returns:
+            The handler's reply, or None if no handler produced one
+        """
+        match = text if isinstance(text, IntentMatch) else self.classify(text)
+        for intent in match.intents:
+            handler = self._handlers[intent]
+            if handler is None:
+                continue
+            reply = handler(match, **context)
+            if reply is not None or not fallthrough:
+                return reply
+        return None
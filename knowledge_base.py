@@ -0,0 +1,397 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from html_extract import extract_sentences
+from passage_ranker import ENGLISH_STOP_WORDS, tokenize
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    path TEXT,
+    added_at REAL NOT NULL,
+    expires_at REAL,
+    UNIQUE (source, title)
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passages_document ON passages(document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS passages_fts USING fts5(
+    title, body, content='passages', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS passages_insert AFTER INSERT ON passages BEGIN
+    INSERT INTO passages_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS passages_delete AFTER DELETE ON passages BEGIN
+    INSERT INTO passages_fts(passages_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+"""
+
+# Title matches count five times as much as body matches; stored as the table's
+# rank function so ORDER BY rank LIMIT n is evaluated inside FTS5
+RANK = 'bm25(5.0, 1.0)'
+
+SOURCE_LABELS = {'wikipedia': 'Wikipedia'}
+
+# Summaries saved from internet searches: they only answer the exact topic they
+# were fetched for ("what is france" must not get the "president of france" summary)
+LEARNED_SOURCES = ('wikipedia',)
+
+# Full-text candidates ranked before documents are filtered by source and expiry
+CANDIDATES_PER_RESULT = 20
+
+# An admin document whose title shares no word with the question only answers it
+# when the question has at least this many content words, all in one passage;
+# otherwise a one-word topic ("what is python") would match any passage naming it
+MIN_BODY_MATCH_TERMS = 2
+
+IMPORT_EXTENSIONS = ('.txt', '.md', '.html', '.htm', '.jsonl')
+
+def split_passages(paragraphs, max_chars=600):
+    """Group consecutive paragraphs (or sentences) into passages of at most about max_chars characters."""
+    passages, current = [], []
+    for paragraph in paragraphs:
+        paragraph = ' '.join(paragraph.split())
+        if not paragraph:
+            continue
+        if current and sum(len(part) + 1 for part in current) + len(paragraph) > max_chars:
+            passages.append(' '.join(current))
+            current = []
+        current.append(paragraph)
+    if current:
+        passages.append(' '.join(current))
+    return passages
+
+def read_document(path):
+    """
+    Read an admin-supplied file.
+
+    .txt and .md files are split on blank lines (a leading "# Heading" becomes
+    the title), .html pages go through the streaming sentence extractor and
+    .jsonl files hold one {"title": ..., "body": ...} document per line.
+
+    Returns:
+        list: (title, passages) pairs
+    """
+    name, extension = os.path.splitext(os.path.basename(path))
+    extension = extension.lower()
+    if extension == '.jsonl':
+        documents = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    documents.append((record['title'], split_passages(re.split(r'\n\s*\n', record['body']))))
+        return documents
+    if extension in ('.html', '.htm'):
+        with open(path, 'rb') as f:
+            return [(name, split_passages(extract_sentences(f.read())))]
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    title = name.replace('_', ' ')
+    heading = re.match(r'\s*#+\s*(.+)', text)
+    if heading:
+        title = heading.group(1).strip()
+        text = text[heading.end():]
+    return [(title, split_passages(re.split(r'\n\s*\n', text)))]
+
+class KnowledgeBase:
+    """Offline answers from an SQLite FTS5 full-text index.
+
+    Documents (Wikipedia summaries fetched earlier, admin-supplied notes)
+    are stored as short passages. An admin document answers a question
+    with its best-ranked passage containing every content word of the
+    question, with matches in the title weighted higher. A learned
+    summary (LEARNED_SOURCES) only answers when the question's content
+    words are exactly the topic it was saved under, and only until it
+    expires. Lookups are indexed queries on a local file, so they take
+    well under a millisecond to a few milliseconds and need no network.
+    """
+
+    def __init__(self, db_path, stop_words=ENGLISH_STOP_WORDS):
+        self.db_path = db_path
+        self.stop_words = stop_words
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA foreign_keys=ON')
+        self._db.executescript(SCHEMA)
+        columns = [row[1] for row in self._db.execute('PRAGMA table_info(documents)')]
+        if 'expires_at' not in columns:
+            self._db.execute('ALTER TABLE documents ADD COLUMN expires_at REAL')
+        self._db.execute("INSERT INTO passages_fts(passages_fts, rank) VALUES ('rank', ?)", (RANK,))
+        self._db.commit()
+        self.lookups = 0
+        self.hits = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def match_expression(self, query):
+        """FTS5 query requiring every content word of query, or None if it has none."""
+        terms = tokenize(query, self.stop_words)
+        if not terms:
+            return None
+        return ' '.join(f'"{term}"' for term in dict.fromkeys(terms))
+
+    def topic(self, query):
+        """The content words of query, the title a learned summary is saved and looked up under."""
+        return ' '.join(tokenize(query, self.stop_words))
+
+    def add(self, title, passages, source='admin', path=None, ttl=None):
+        """
+        Add a document, replacing any document with the same source and title.
+
+        Args:
+            title (str): Document title (for Wikipedia summaries, topic() of the search)
+            passages (list or str): Passage texts, or one text
+            source (str): Where it came from, e.g. 'wikipedia' or 'admin'
+            path (str, optional): File it was imported from
+            ttl (float, optional): Seconds until the document stops answering (None for never)
+        """
+        self.add_many([(title, passages)], source=source, path=path, ttl=ttl)
+
+    def add_many(self, documents, source='admin', path=None, ttl=None):
+        """Add (title, passages) documents in a single transaction; returns how many were added."""
+        count = 0
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._db:
+            for title, passages in documents:
+                if isinstance(passages, str):
+                    passages = [passages]
+                self._db.execute('DELETE FROM documents WHERE source = ? AND title = ?', (source, title))
+                document_id = self._db.execute(
+                    'INSERT INTO documents (title, source, path, added_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                    (title, source, path, now, expires_at)
+                ).lastrowid
+                self._db.executemany(
+                    'INSERT INTO passages (document_id, title, body) VALUES (?, ?, ?)',
+                    [(document_id, title, body) for body in passages if body.strip()]
+                )
+                count += 1
+        return count
+
+    def remove(self, title, source='admin'):
+        """Delete a document; returns True if it existed."""
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM documents WHERE source = ? AND title = ?', (source, title)).rowcount > 0
+
+    def import_path(self, path, source='admin'):
+        """Import a file, or every supported file under a directory; returns the number of documents."""
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names if name.lower().endswith(IMPORT_EXTENSIONS)
+            )
+        else:
+            files = [path]
+        count = 0
+        for file_path in files:
+            try:
+                count += self.add_many(read_document(file_path), source=source, path=os.path.abspath(file_path))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error importing {file_path}: {str(e)}")
+        return count
+
+    def purge_expired(self):
+        """Delete expired documents; returns how many were removed."""
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM documents WHERE expires_at <= ?', (time.time(),)).rowcount
+
+    def reindex(self):
+        """Drop expired documents, rebuild the full-text index from the stored passages and merge its segments."""
+        self.purge_expired()
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO passages_fts(passages_fts) VALUES ('rebuild')")
+            self._db.execute("INSERT INTO passages_fts(passages_fts) VALUES ('optimize')")
+
+    def _search(self, query, limit, title_only=False, learned=True, title_match=False):
+        expression = self.match_expression(query)
+        if expression is None:
+            return []
+        if title_only:
+            expression = f'title : ({expression})'
+        elif title_match:
+            # Every word in the passage, at least one of them in the title
+            expression = f"({expression}) AND (title : ({' OR '.join(expression.split())}))"
+        sql = ('SELECT p.title, p.body, d.source FROM '
+               '(SELECT rowid, rank FROM passages_fts WHERE passages_fts MATCH ? ORDER BY rank LIMIT ?) AS best '
+               'JOIN passages p ON p.id = best.rowid JOIN documents d ON d.id = p.document_id '
+               'WHERE (d.expires_at IS NULL OR d.expires_at > ?) ')
+        params = [expression, limit * CANDIDATES_PER_RESULT, time.time()]
+        if not learned:
+            sql += f"AND d.source NOT IN ({', '.join('?' * len(LEARNED_SOURCES))}) "
+            params += LEARNED_SOURCES
+        sql += 'ORDER BY best.rank LIMIT ?'
+        params.append(limit)
+        try:
+            with self._lock:
+                # Rank inside FTS5 first, then join only the top rows
+                return self._db.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Knowledge base search error: {str(e)}")
+            return []
+
+    def _learned(self, query):
+        topic = self.topic(query)
+        if not topic:
+            return None
+        try:
+            with self._lock:
+                return self._db.execute(
+                    'SELECT p.title, p.body, d.source FROM documents d JOIN passages p ON p.document_id = d.id '
+                    f"WHERE d.title = ? AND d.source IN ({', '.join('?' * len(LEARNED_SOURCES))}) "
+                    'AND (d.expires_at IS NULL OR d.expires_at > ?) ORDER BY p.id LIMIT 1',
+                    (topic, *LEARNED_SOURCES, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Knowledge base search error: {str(e)}")
+            return None
+
+    def _record(self, start, hit):
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.lookups += 1
+            self.hits += bool(hit)
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    def search(self, query, limit=3, title_only=False, learned=True):
+        """
+        Full-text search.
+
+        Args:
+            query (str): The question
+            limit (int): Maximum number of passages
+            title_only (bool): Only match words in document titles
+            learned (bool): Include learned summaries
+
+        Returns:
+            list: (title, body, source) tuples, best first
+        """
+        start = time.perf_counter()
+        rows = self._search(query, limit, title_only, learned)
+        self._record(start, rows)
+        return rows
+
+    def answer(self, query, title_only=False, learned=True):
+        """
+        Return the best passage for query phrased as a reply, or None.
+
+        A learned summary saved under exactly this topic comes first (with
+        learned=True), then the best admin passage containing every content
+        word of the question, from a document whose title shares a word with
+        the question or, for questions of at least MIN_BODY_MATCH_TERMS
+        content words, from any document. Anything else is left to the
+        internet search.
+        """
+        start = time.perf_counter()
+        row = self._learned(query) if learned else None
+        if row is None:
+            rows = self._search(query, 1, title_only, learned=False, title_match=True)
+            if not rows and not title_only and len(set(tokenize(query, self.stop_words))) >= MIN_BODY_MATCH_TERMS:
+                rows = self._search(query, 1, learned=False)
+            row = rows[0] if rows else None
+        self._record(start, row)
+        if row is None:
+            return None
+        title, body, source = row
+        label = SOURCE_LABELS.get(source)
+        return f"According to {label}, {body}" if label else body
+
+    def counts(self):
+        with self._lock:
+            documents = self._db.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+            passages = self._db.execute('SELECT COUNT(*) FROM passages').fetchone()[0]
+        return documents, passages
+
+    def stats(self):
+        """Return size and lookup counters for a metrics endpoint."""
+        documents, passages = self.counts()
+        with self._lock:
+            return {
+                'documents': documents,
+                'passages': passages,
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'hit_rate': self.hits / self.lookups if self.lookups else 0.0,
+                'avg_ms': self.total_seconds / self.lookups * 1000 if self.lookups else 0.0,
+                'max_ms': self.max_seconds * 1000
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+def create_knowledge_base(stop_words=ENGLISH_STOP_WORDS):
+    """
+    Open the knowledge base at KNOWLEDGE_BASE_DB (default knowledge_base.sqlite).
+
+    Returns:
+        KnowledgeBase: Or None if KNOWLEDGE_BASE_DB is empty or the file can't be opened
+    """
+    db_path = os.getenv('KNOWLEDGE_BASE_DB', 'knowledge_base.sqlite')
+    if not db_path:
+        return None
+    try:
+        return KnowledgeBase(db_path, stop_words)
+    except sqlite3.Error as e:
+        print(f"Knowledge base unavailable: {str(e)}")
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage Raizel's offline knowledge base")
+    parser.add_argument('--db', default=os.getenv('KNOWLEDGE_BASE_DB', 'knowledge_base.sqlite'))
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_command = commands.add_parser('import', help="Import .txt, .md, .html and .jsonl files or directories")
+    import_command.add_argument('paths', nargs='+')
+    import_command.add_argument('--source', default='admin')
+    commands.add_parser('reindex', help="Rebuild and optimize the full-text index")
+    search_command = commands.add_parser('search', help="Show the best passages for a question")
+    search_command.add_argument('query')
+    search_command.add_argument('--limit', type=int, default=3)
+    remove_command = commands.add_parser('remove', help="Delete a document by title")
+    remove_command.add_argument('title')
+    remove_command.add_argument('--source', default='admin')
+    commands.add_parser('stats', help="Show document and passage counts")
+    args = parser.parse_args(argv)
+
+    knowledge_base = KnowledgeBase(args.db)
+    try:
+        if args.command == 'import':
+            start = time.perf_counter()
+            count = sum(knowledge_base.import_path(path, source=args.source) for path in args.paths)
+            knowledge_base.reindex()
+            print(f"Imported {count} documents in {time.perf_counter() - start:.2f} s")
+        elif args.command == 'reindex':
+            start = time.perf_counter()
+            knowledge_base.reindex()
+            print(f"Reindexed in {time.perf_counter() - start:.2f} s")
+        elif args.command == 'search':
+            for title, body, source in knowledge_base.search(args.query, limit=args.limit):
+                print(f"[{source}] {title}: {body}")
+        elif args.command == 'remove':
+            if not knowledge_base.remove(args.title, args.source):
+                print("No such document")
+                return 1
+            print("Removed")
+        if args.command in ('import', 'stats'):
+            documents, passages = knowledge_base.counts()
+            print(f"{documents} documents, {passages} passages in {args.db}")
+    finally:
+        knowledge_base.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import string
+import numpy as np
+import pandas as pd
+
+# Punctuation becomes whitespace, so str.split() yields the word tokens (much faster than a regex)
+PUNCTUATION = str.maketrans({char: ' ' for char in string.punctuation + '\u201c\u201d\u2018\u2019\u2014\u2013\u2026\u00ab\u00bb'})
+
+SEPARATOR = '\x01'
+
+# Used when the NLTK stopwords corpus is not available
+ENGLISH_STOP_WORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her
+here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+def tokenize(text, stop_words=frozenset()):
+    """Lowercase word tokens of text, without stop words."""
+    return [token for token in text.lower().translate(PUNCTUATION).split() if token not in stop_words]
+
+class PassageIndex:
+    """BM25 ranking over a fixed list of passages (e.g. the sentences of one page).
+
+    The passages are tokenized once into an inverted index stored as flat
+    arrays (term -> slice of passage ids and term frequencies), so each
+    query only touches the postings of its own terms instead of scanning
+    every passage.
+    """
+
+    def __init__(self, passages, stop_words=frozenset(), k1=1.5, b=0.75):
+        self.passages = passages
+        self.stop_words = stop_words
+        self.k1 = k1
+        self.b = b
+        count = len(passages)
+        # Tokenize the whole page in one pass, with a SEPARATOR token between passages,
+        # and number the distinct terms with a hash-based factorize
+        page = f' {SEPARATOR} '.join(passage.replace(SEPARATOR, ' ') for passage in passages)
+        tokens = np.array([SEPARATOR] + page.lower().translate(PUNCTUATION).split(), dtype=object)
+        term_ids, terms = pd.factorize(tokens)
+        passage_ids = np.cumsum(term_ids == 0) - 1
+        vocabulary = {term: term_id for term_id, term in enumerate(terms)}
+        is_stop = np.zeros(len(terms), dtype=bool)
+        is_stop[0] = True
+        for word in stop_words:
+            if word in vocabulary:
+                is_stop[vocabulary[word]] = True
+        keep = ~is_stop[term_ids]
+        term_ids, passage_ids = term_ids[keep].astype(np.int64), passage_ids[keep]
+
+        # One posting per (term, passage) pair, sorted by term
+        pairs, frequencies = np.unique(term_ids * max(count, 1) + passage_ids, return_counts=True)
+        self._passage_ids = (pairs % max(count, 1)).astype(np.int32)
+        self._frequencies = frequencies.astype(np.float64)
+        self._starts = np.searchsorted(pairs // max(count, 1), np.arange(len(vocabulary) + 1))
+        self.vocabulary = {term: term_id for term, term_id in vocabulary.items() if not is_stop[term_id]}
+
+        self.lengths = np.bincount(passage_ids, minlength=count).astype(np.float64)
+        average_length = self.lengths.mean() if count else 0.0
+        # Per-passage length normalisation is the same for every term, so compute it once
+        self._norm = k1 * (1 - b + b * self.lengths / average_length) if average_length else np.full(count, k1)
+        document_frequency = np.diff(self._starts)
+        self._idf = np.log(1 + (count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def __len__(self):
+        return len(self.passages)
+
+    def scores(self, query):
+        """BM25 score of every passage for query."""
+        scores = np.zeros(len(self.passages))
+        for term in set(tokenize(query, self.stop_words)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self._starts[term_id], self._starts[term_id + 1]
+            ids, frequencies = self._passage_ids[start:end], self._frequencies[start:end]
+            scores[ids] += self._idf[term_id] * frequencies * (self.k1 + 1) / (frequencies + self._norm[ids])
+        return scores
+
+    def top_k(self, query, k=3):
+        """
+        Rank passages for query.
+
+        Args:
+            query (str): The question
+            k (int): How many passages to return
+
+        Returns:
+            list: (score, passage) pairs, best first, only passages sharing a term with the query
+        """
+        scores = self.scores(query)
+        matching = np.flatnonzero(scores > 0)
+        if len(matching) > k:
+            matching = matching[np.argpartition(-scores[matching], k - 1)[:k]]
+        # Ties keep page order
+        ranked = sorted(matching, key=lambda passage_id: (-scores[passage_id], passage_id))
+        return [(float(scores[passage_id]), self.passages[passage_id]) for passage_id in ranked]
@@ -0,0 +1,214 @@
+import queue
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+import socketio
+
+BROKER_SCHEME = 'raizel-pubsub'
+
+PUBLISH = b'PUBLISH\n'
+SUBSCRIBE = b'SUBSCRIBE\n'
+
+class _Subscriber:
+    """A subscriber connection with its own send queue and writer thread."""
+
+    def __init__(self, conn, max_pending):
+        self.conn = conn
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.closed = False
+        threading.Thread(target=self._write, name='raizel-pubsub-writer', daemon=True).start()
+
+    def _write(self):
+        while True:
+            line = self.queue.get()
+            if line is None:
+                return
+            try:
+                self.conn.sendall(line)
+            except OSError:
+                self.close()
+                return
+
+    def offer(self, line):
+        """Queue line for sending; returns False if the subscriber is too far behind."""
+        try:
+            self.queue.put_nowait(line)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.conn.close()
+        # Wake the writer; if the queue is full it is exiting on the closed socket anyway
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+class PubSubBroker:
+    """Minimal TCP pub/sub hub that lets several server processes share Socket.IO emits.
+
+    Stands in for Redis when running multiple workers on one machine. Each
+    connection starts with a PUBLISH or SUBSCRIBE line. Lines sent on a
+    publisher connection are forwarded to every subscriber; nothing is ever
+    written back to publishers. Each subscriber has its own bounded queue and
+    writer thread, so a slow reader never stalls the broker or the
+    publishers: a subscriber more than max_pending messages behind is
+    disconnected and reconnects. There is no persistence, so a worker that is
+    restarting simply misses the messages published meanwhile.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, max_pending=10000):
+        self._listener = socket.create_server((host, port))
+        self.host, self.port = self._listener.getsockname()[:2]
+        self.max_pending = max_pending
+        self._subscribers = []
+        self._connections = set()
+        self._lock = threading.Lock()
+        self.messages = 0
+        self.dropped_subscribers = 0
+
+    @property
+    def url(self):
+        return f"{BROKER_SCHEME}://{self.host}:{self.port}"
+
+    def start(self):
+        """Accept connections on a daemon thread."""
+        threading.Thread(target=self._accept, name='raizel-pubsub-broker', daemon=True).start()
+        print(f"Pub/sub broker listening on {self.url}")
+        return self
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._connections.add(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        subscriber = None
+        try:
+            lines = conn.makefile('rb')
+            role = lines.readline()
+            if role == PUBLISH:
+                self._relay(lines)
+            elif role == SUBSCRIBE:
+                subscriber = _Subscriber(conn, self.max_pending)
+                with self._lock:
+                    self._subscribers.append(subscriber)
+                # Subscribers send nothing more; reading only notices the disconnect
+                while lines.readline():
+                    pass
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._connections.discard(conn)
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+            if subscriber is not None:
+                subscriber.close()
+            else:
+                conn.close()
+
+    def _relay(self, lines):
+        for line in lines:
+            with self._lock:
+                self.messages += 1
+                subscribers = list(self._subscribers)
+            for subscriber in subscribers:
+                if not subscriber.offer(line):
+                    print("Pub/sub subscriber is too far behind, disconnecting it")
+                    with self._lock:
+                        self.dropped_subscribers += 1
+                        if subscriber in self._subscribers:
+                            self._subscribers.remove(subscriber)
+                    subscriber.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'messages': self.messages,
+                'subscribers': len(self._subscribers),
+                'dropped_subscribers': self.dropped_subscribers
+            }
+
+    def stop(self):
+        self._listener.close()
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+            connections, self._connections = self._connections, set()
+        for subscriber in subscribers:
+            subscriber.close()
+        for conn in connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+
+class LocalPubSubManager(socketio.PubSubManager):
+    """Socket.IO client manager that exchanges messages through a PubSubBroker.
+
+    Used like socketio.RedisManager, with a raizel-pubsub://host:port URL.
+    Each message is one line: the channel name, a space, and the JSON packet.
+    Publishing and listening use separate connections, announced to the
+    broker as PUBLISH and SUBSCRIBE.
+    """
+
+    name = 'raizel-pubsub'
+
+    def __init__(self, url, channel='socketio', write_only=False, logger=None, json=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger, json=json)
+        parsed = urlparse(url)
+        self.address = (parsed.hostname or '127.0.0.1', parsed.port)
+        self._publisher = None
+        self._publish_lock = threading.Lock()
+
+    def _publish(self, data):
+        line = f"{self.channel} {self.json.dumps(data)}\n".encode('utf-8')
+        for attempt in range(2):
+            try:
+                with self._publish_lock:
+                    if self._publisher is None:
+                        publisher = socket.create_connection(self.address)
+                        publisher.sendall(PUBLISH)
+                        # The broker never writes to publishers
+                        publisher.shutdown(socket.SHUT_RD)
+                        self._publisher = publisher
+                    self._publisher.sendall(line)
+                return
+            except OSError as e:
+                with self._publish_lock:
+                    if self._publisher is not None:
+                        self._publisher.close()
+                        self._publisher = None
+                if attempt:
+                    self._get_logger().error(f"Cannot publish to pub/sub broker: {str(e)}")
+
+    def _listen(self):
+        prefix = f"{self.channel} ".encode('utf-8')
+        retry_sleep = 1
+        while True:
+            try:
+                with socket.create_connection(self.address) as conn:
+                    conn.sendall(SUBSCRIBE)
+                    retry_sleep = 1
+                    for line in conn.makefile('rb'):
+                        if line.startswith(prefix):
+                            yield line[len(prefix):].decode('utf-8')
+            except OSError as e:
+                self._get_logger().error(f"Cannot receive from pub/sub broker, retrying in {retry_sleep}s: {str(e)}")
+            time.sleep(retry_sleep)
+            retry_sleep = min(retry_sleep * 2, 30)
@@ -0,0 +1,90 @@
+import numpy as np
+
+PASS_MARK = 60
+UPCOMING_TASK_COUNT = 5
+
+# Keywords of the academic intents answered from a student's own data, in priority order
+ACADEMIC_KEYWORDS = [
+    ('marks', ['marks', 'grades', 'performance', 'score', 'result']),
+    ('courses', ['courses', 'subjects', 'classes', 'department']),
+    ('tasks', ['tasks', 'assignments', 'deadlines', 'upcoming', 'schedule']),
+    ('profile', ['profile', 'info', 'details', 'about me', 'who am i'])
+]
+
+# Keywords that make /api/chat append the student's raw marks and courses
+CHAT_DATA_KEYWORDS = frozenset(['marks', 'grades', 'performance', 'courses', 'subjects'])
+
+def with_status(marks):
+    """Return marks with a Pass/Fail 'Status' column computed in one array operation."""
+    return marks.assign(Status=np.where(marks['Marks'] >= PASS_MARK, 'Pass', 'Fail'))
+
+def latest_semester_marks(student_marks):
+    """
+    Select a student's most recent semester and classify each subject.
+
+    Args:
+        student_marks (pd.DataFrame): The student's rows from SubjectWise_Marks.csv
+
+    Returns:
+        tuple: (latest semester, DataFrame of that semester's marks with a Status column)
+    """
+    semesters = student_marks['Semester'].to_numpy()
+    latest_semester = semesters.max()
+    return latest_semester, with_status(student_marks[semesters == latest_semester])
+
+def academic_data_records(latest_marks):
+    """Convert classified marks into the dashboard's subject records."""
+    return latest_marks[['Subject', 'Marks', 'Status']].rename(
+        columns={'Subject': 'name', 'Marks': 'grade', 'Status': 'status'}
+    ).to_dict('records')
+
+def format_marks_reply(student_marks):
+    """Render the latest semester's marks, pass/fail status and average."""
+    semesters = student_marks['Semester'].to_numpy()
+    latest_semester = semesters.max()
+    in_latest = semesters == latest_semester
+    subjects = student_marks['Subject'].to_numpy()[in_latest]
+    marks = student_marks['Marks'].to_numpy()[in_latest]
+    statuses = np.where(marks >= PASS_MARK, 'Pass', 'Fail')
+
+    # Render every subject line in a single join
+    lines = '\n'.join([
+        f"- {subject}: {mark} ({status})"
+        for subject, mark, status in zip(subjects.tolist(), marks.tolist(), statuses.tolist())
+    ])
+    return f"Here are your marks for semester {latest_semester}:\n\n{lines}\n\nYour average marks: {marks.mean():.2f}"
+
+def format_course_reply(student_courses):
+    """Render the student's course details."""
+    course_info = student_courses.iloc[0]
+    return (
+        "Here are your course details:\n\n"
+        f"- Department: {course_info['Department']}\n"
+        f"- Enrollment Year: {course_info['Enrollment_Year']}\n"
+        f"- Expected Graduation: {course_info['Expected_Graduation']}\n"
+    )
+
+def format_tasks_reply(tasks_data, count=UPCOMING_TASK_COUNT):
+    """Render the next upcoming tasks, with their descriptions when present."""
+    tasks = tasks_data.head(count)
+    descriptions = tasks['Description']
+    has_description = (descriptions.notna() & (descriptions.astype(str).str.strip() != '')).tolist()
+    lines = '\n'.join([
+        f"- {name} (Due: {date})" + (f"\n  Description: {description}" if present else '')
+        for name, date, description, present in zip(
+            tasks['Event_Name'].tolist(), tasks['Date'].tolist(), descriptions.tolist(), has_description
+        )
+    ])
+    return f"Here are your upcoming tasks:\n\n{lines}\n"
+
+def format_profile_reply(student_profile):
+    """Render the student's profile details."""
+    profile = student_profile.iloc[0]
+    return (
+        "Here are your profile details:\n\n"
+        f"- Name: {profile['Name']}\n"
+        f"- Registration Number: {profile['Registration_Number']}\n"
+        f"- Department: {profile['Department']}\n"
+        f"- Year: {profile['Year']}\n"
+        f"- CGPA: {profile['CGPA']}\n"
+    )
@@ -0,0 +1,190 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from lru_cache import LRUCache
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+def normalize_query(query):
+    """Cache key for a search: lowercase words without punctuation, single-spaced."""
+    return ' '.join(_PUNCTUATION.sub(' ', query.lower()).split())
+
+class SourceStats:
+    """Answer/miss/error counts and latency for one search source."""
+
+    def __init__(self):
+        self.calls = 0
+        self.answers = 0
+        self.misses = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'answers': self.answers,
+            'misses': self.misses,
+            'errors': self.errors,
+            'avg_ms': self.total_seconds / self.calls * 1000 if self.calls else 0.0,
+            'max_ms': self.max_seconds * 1000
+        }
+
+class SearchCache:
+    """Internet search answers keyed by normalized query.
+
+    Answers stay in an in-memory LRU for ttl seconds. Queries that found
+    nothing are cached too (negative caching), for the shorter
+    negative_ttl, so repeated unknown questions don't go back to the
+    network. With db_path set, entries are also written to a SQLite file
+    that survives restarts and is shared by every server process.
+    """
+
+    def __init__(self, maxsize=1024, ttl=6 * 3600, negative_ttl=600, db_path=None):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.answers = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.negatives = LRUCache(maxsize=maxsize, ttl=negative_ttl)
+        self.db_path = db_path
+        self._db = None
+        self._lock = threading.Lock()
+        self._sources = {}
+        self.lookups = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_writes = 0
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS search_cache '
+                    '(query TEXT PRIMARY KEY, answer TEXT, source TEXT, stored_at REAL NOT NULL)'
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Search cache database unavailable, using memory only: {str(e)}")
+                self._db = None
+
+    def get(self, key):
+        """
+        Look up a normalized query.
+
+        Returns:
+            tuple: (found, answer); answer is None for a cached miss
+        """
+        found, answer = self._get(key)
+        with self._lock:
+            self.lookups += 1
+            if found:
+                self.hits += 1
+        return found, answer
+
+    def _get(self, key):
+        answer = self.answers.get(key)
+        if answer is not None:
+            return True, answer
+        if self.negatives.get(key) is not None:
+            return True, None
+        if self._db is None:
+            return False, None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    'SELECT answer, stored_at FROM search_cache WHERE query = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Search cache read error: {str(e)}")
+            return False, None
+        if row is not None:
+            answer, stored_at = row
+            age = time.time() - stored_at
+            if age < (self.ttl if answer is not None else self.negative_ttl):
+                with self._lock:
+                    self.disk_hits += 1
+                # Promoted with its age, so it expires from memory when the row does
+                if answer is None:
+                    self.negatives.set(key, True, age=age)
+                else:
+                    self.answers.set(key, answer, age=age)
+                return True, answer
+        with self._lock:
+            self.disk_misses += 1
+        return False, None
+
+    def set(self, key, answer, source=None):
+        """Cache an answer, or a miss when answer is None."""
+        if answer is None:
+            self.negatives.set(key, True)
+        else:
+            self.negatives.invalidate(key)
+            self.answers.set(key, answer)
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO search_cache (query, answer, source, stored_at) VALUES (?, ?, ?, ?)',
+                    (key, answer, source, time.time())
+                )
+                self._db.commit()
+                self.disk_writes += 1
+        except sqlite3.Error as e:
+            print(f"Search cache write error: {str(e)}")
+
+    def purge_expired(self):
+        """Delete expired rows from the database; returns how many were removed."""
+        if self._db is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                'DELETE FROM search_cache WHERE (answer IS NOT NULL AND stored_at < ?) OR (answer IS NULL AND stored_at < ?)',
+                (now - self.ttl, now - self.negative_ttl)
+            )
+            self._db.commit()
+            return cursor.rowcount
+
+    def record_source(self, source, seconds, answered, error=False):
+        """Count one call to a search source."""
+        with self._lock:
+            stats = self._sources.setdefault(source, SourceStats())
+            stats.calls += 1
+            if error:
+                stats.errors += 1
+            elif answered:
+                stats.answers += 1
+            else:
+                stats.misses += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def stats(self):
+        """Return cache tier and per-source counters for a metrics endpoint."""
+        answers = self.answers.stats()
+        negatives = self.negatives.stats()
+        with self._lock:
+            return {
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'hit_rate': self.hits / self.lookups if self.lookups else 0.0,
+                'answers': answers,
+                'negatives': negatives,
+                'disk': {'hits': self.disk_hits, 'misses': self.disk_misses, 'writes': self.disk_writes} if self._db else None,
+                'sources': {name: stats.as_dict() for name, stats in self._sources.items()}
+            }
+
+def create_search_cache():
+    """
+    Create a SearchCache configured by SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL,
+    SEARCH_NEGATIVE_TTL and SEARCH_CACHE_DB (empty for memory only).
+    """
+    return SearchCache(
+        maxsize=int(os.getenv('SEARCH_CACHE_SIZE', '1024')),
+        ttl=float(os.getenv('SEARCH_CACHE_TTL', str(6 * 3600))),
+        negative_ttl=float(os.getenv('SEARCH_NEGATIVE_TTL', '600')),
+        db_path=os.getenv('SEARCH_CACHE_DB', '.search_cache.sqlite') or None
+    )
@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+class SearchProvider:
+    """One search source: search() returns an answer string or None, and may raise on errors."""
+
+    def __init__(self, name, search, label=None, timeout=5.0):
+        self.name = name
+        self.label = label or name
+        self.timeout = timeout
+        self._search = search
+
+    def search(self, query):
+        return self._search(query)
+
+class StubProvider(SearchProvider):
+    """Local provider for tests and benchmarks: a fixed answer (or None) after a delay, or an error."""
+
+    def __init__(self, name, answer=None, delay=0.0, error=None, timeout=5.0):
+        super().__init__(name, self._answer, timeout=timeout)
+        self.answer = answer
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def _answer(self, query):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.answer
+
+class _Call:
+    """When a submitted provider call started running."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.started_at = None
+
+class SearchOrchestrator:
+    """Queries every search provider at once and returns the best answer.
+
+    Providers are listed in priority order and all start together, each on
+    its own thread pool of max_workers threads, so a slow provider never
+    holds up another one and up to max_workers concurrent searches (one per
+    chat worker) start every provider immediately. Each provider's timeout
+    runs from when its call starts; a call still waiting for a thread
+    after one timeout is given up. The answer of the highest-priority
+    provider wins, and a lower-priority answer is returned as soon as every
+    provider ahead of it has missed, failed or timed out, so a Wikipedia
+    miss no longer delays the Google request. Providers that have not
+    started are cancelled; ones already running finish in the background
+    and their results are discarded.
+    """
+
+    def __init__(self, providers, max_workers=8, record=None):
+        self.providers = providers
+        self.record = record
+        self._executors = {
+            provider.name: ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'raizel-search-{provider.name}')
+            for provider in providers
+        }
+        self._lock = threading.Lock()
+        self.searches = 0
+        self.answered = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.wins = {provider.name: 0 for provider in providers}
+        self.timeouts = {provider.name: 0 for provider in providers}
+
+    @staticmethod
+    def _call(provider, query, call):
+        call.started_at = start = time.perf_counter()
+        call.started.set()
+        answer = provider.search(query)
+        return answer, time.perf_counter() - start
+
+    def _record(self, provider, seconds, answered, error=False):
+        if self.record is not None:
+            self.record(provider.name, seconds, answered, error)
+
+    def search(self, query):
+        """
+        Search all providers concurrently.
+
+        Args:
+            query (str): The search query
+
+        Returns:
+            tuple: (answer, provider, complete) - answer and provider are None
+            if nobody answered; complete is False if any provider that was
+            waited for timed out or failed, so a miss should not be cached
+        """
+        start = time.perf_counter()
+        futures = []
+        for provider in self.providers:
+            call = _Call()
+            futures.append((provider, call, self._executors[provider.name].submit(self._call, provider, query, call)))
+        answer, winner, complete = None, None, True
+        try:
+            for index, (provider, call, future) in enumerate(futures):
+                try:
+                    if not call.started.wait(max(start + provider.timeout - time.perf_counter(), 0)):
+                        future.cancel()
+                        raise TimeoutError()
+                    remaining = call.started_at + provider.timeout - time.perf_counter()
+                    result, seconds = future.result(timeout=max(remaining, 0))
+                except TimeoutError:
+                    print(f"{provider.label} search timed out after {provider.timeout:.1f} s")
+                    with self._lock:
+                        self.timeouts[provider.name] += 1
+                    self._record(provider, provider.timeout, False, error=True)
+                    complete = False
+                    continue
+                except Exception as e:
+                    print(f"{provider.label} search error: {str(e)}")
+                    self._record(provider, time.perf_counter() - call.started_at, False, error=True)
+                    complete = False
+                    continue
+                self._record(provider, seconds, bool(result))
+                if result and result.strip():
+                    answer, winner = result, provider
+                    for _, _, other in futures[index + 1:]:
+                        other.cancel()
+                    break
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.searches += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+                if winner is not None:
+                    self.answered += 1
+                    self.wins[winner.name] += 1
+        return answer, winner, complete
+
+    def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """Return search latency and per-provider wins and timeouts for a metrics endpoint."""
+        with self._lock:
+            return {
+                'searches': self.searches,
+                'answered': self.answered,
+                'avg_ms': self.total_seconds / self.searches * 1000 if self.searches else 0.0,
+                'max_ms': self.max_seconds * 1000,
+                'wins': dict(self.wins),
+                'timeouts': dict(self.timeouts)
+            }
+
+def create_search_orchestrator(sources, record=None):
+    """
+    Create a SearchOrchestrator over the available sources.
+
+    Args:
+        sources (dict): name -> (label, search function) for every known source
+
+    SEARCH_SOURCES picks and orders them (default "wikipedia,google"),
+    SEARCH_TIMEOUT sets the per-source timeout in seconds (overridable with
+    e.g. SEARCH_TIMEOUT_GOOGLE) and SEARCH_WORKERS the threads per source,
+    by default CHAT_WORKERS so every chat worker can search at once.
+    """
+    default_timeout = float(os.getenv('SEARCH_TIMEOUT', '5'))
+    providers = []
+    for name in os.getenv('SEARCH_SOURCES', 'wikipedia,google').split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in sources:
+            print(f"Unknown search source: {name}")
+            continue
+        label, search = sources[name]
+        timeout = float(os.getenv(f'SEARCH_TIMEOUT_{name.upper()}', str(default_timeout)))
+        providers.append(SearchProvider(name, search, label, timeout))
+    workers = int(os.getenv('SEARCH_WORKERS') or os.getenv('CHAT_WORKERS', '8'))
+    return SearchOrchestrator(providers, max_workers=max(workers, 1), record=record)
@@ -0,0 +1,294 @@
+import os
+import re
+import threading
+import time
+import zlib
+import numpy as np
+from lru_cache import LRUCache
+from passage_ranker import ENGLISH_STOP_WORDS, tokenize
+
+# Words that say how to ask, not what is asked
+FILLER_WORDS = frozenset("""
+show tell give list display please kindly know want see check get find need can could would let current
+taking enrolled registered t s d ll re ve m
+""".split())
+
+# Negations and comparisons decide what is asked ("courses I did not pass", "grades
+# above 80"), so they are kept although they are stop words, and a cached answer
+# is only reused for a question with the same ones
+QUALIFIER_WORDS = frozenset("not no nor without above below before after more most less least than".split())
+
+# Other ways of saying a qualifier (contractions are split at the apostrophe: "didn't" -> "didn t")
+QUALIFIER_SYNONYMS = {
+    'never': 'not', 'didn': 'not', 'don': 'not', 'doesn': 'not', 'isn': 'not', 'aren': 'not', 'wasn': 'not',
+    'weren': 'not', 'haven': 'not', 'hasn': 'not', 'hadn': 'not', 'cannot': 'not', 'cant': 'not',
+    'over': 'above', 'under': 'below', 'prior': 'before', 'fewer': 'less'
+}
+
+_KEPT_STOP_WORDS = QUALIFIER_WORDS | frozenset(QUALIFIER_SYNONYMS)
+_CONTENT_STOP_WORDS = ENGLISH_STOP_WORDS - _KEPT_STOP_WORDS
+
+# Canonical word for each synonym (after the plural "s" is stripped). Only true
+# paraphrases: a CGPA is one number, not the per-subject marks, and a midterm or a
+# test is one particular exam, so such words keep their own meaning
+SYNONYMS = {
+    'mark': 'grade', 'score': 'grade',
+    'subject': 'course', 'class': 'course', 'module': 'course',
+    'examination': 'exam',
+    'timetable': 'schedule',
+    'holiday': 'break', 'vacation': 'break',
+    'sem': 'semester',
+    'teacher': 'professor', 'lecturer': 'professor',
+}
+
+_NUMBER = re.compile(r'\d+')
+
+def normalize_words(query, stop_words=ENGLISH_STOP_WORDS):
+    """Content and qualifier words of query with filler removed, plurals stripped and synonyms mapped to one word."""
+    stop_words = _CONTENT_STOP_WORDS if stop_words is ENGLISH_STOP_WORDS else stop_words - _KEPT_STOP_WORDS
+    words = []
+    for word in tokenize(query, stop_words):
+        if word in FILLER_WORDS:
+            continue
+        if word in _KEPT_STOP_WORDS:
+            words.append(QUALIFIER_SYNONYMS.get(word, word))
+            continue
+        if word.endswith(('sses', 'ches', 'shes', 'xes')):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        words.append(SYNONYMS.get(word, word))
+    return words
+
+def _hashed(feature, dimensions):
+    # crc32 is stable across processes, unlike hash()
+    value = zlib.crc32(feature.encode('utf-8'))
+    return value % dimensions, 1.0 if value & 0x80000000 else -1.0
+
+def embed(words, dimensions=512):
+    """
+    Hashed n-gram embedding of normalized words.
+
+    Words, word bigrams and character trigrams are hashed (with a sign bit)
+    into a fixed-size vector, so spelling variants and reordered words stay
+    close without any model download.
+
+    Returns:
+        numpy.ndarray: Unit-length float32 vector (all zeros for no words)
+    """
+    vector = np.zeros(dimensions, dtype=np.float32)
+    features = [(word, 1.0) for word in words]
+    features += [(f'{first} {second}', 0.7) for first, second in zip(words, words[1:])]
+    for word in words:
+        padded = f'<{word}>'
+        trigrams = [padded[start:start + 3] for start in range(len(padded) - 2)]
+        features += [(f'#{trigram}', 0.6 / len(trigrams)) for trigram in trigrams]
+    for feature, weight in features:
+        index, sign = _hashed(feature, dimensions)
+        vector[index] += sign * weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+class SemanticIndex:
+    """Cached answers for one scope, searchable by cosine similarity.
+
+    Up to brute_force_limit entries are compared exactly with one matrix
+    product. Beyond that, random-hyperplane LSH tables narrow the search to
+    the entries sharing a bucket with the query in any table, and only
+    those candidates are scored.
+    """
+
+    def __init__(self, dimensions=512, maxsize=1000, tables=10, bits=8, brute_force_limit=1024, seed=0):
+        self.maxsize = maxsize
+        self.brute_force_limit = brute_force_limit
+        self.tables = tables
+        self.bits = bits
+        self._planes = np.random.default_rng(seed).standard_normal((tables * bits, dimensions)).astype(np.float32)
+        self._powers = 1 << np.arange(bits)
+        self._vectors = np.zeros((min(maxsize, 64), dimensions), dtype=np.float32)
+        self._codes = np.zeros((min(maxsize, 64), tables), dtype=np.int64)
+        self._entries = []
+        self._buckets = [{} for _ in range(tables)]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _hash(self, vectors):
+        bits = (vectors @ self._planes.T > 0).reshape(len(vectors), self.tables, self.bits)
+        return bits @ self._powers
+
+    def add(self, vector, entry):
+        if len(self._entries) >= self.maxsize:
+            # Drop the oldest quarter at once so eviction stays amortized O(1)
+            self._rebuild(len(self._entries) // 4 or 1)
+        row = len(self._entries)
+        if row == len(self._vectors):
+            capacity = min(self.maxsize, row * 2)
+            self._vectors = np.resize(self._vectors, (capacity, self._vectors.shape[1]))
+            self._codes = np.resize(self._codes, (capacity, self.tables))
+        self._vectors[row] = vector
+        self._codes[row] = self._hash(vector[None, :])[0]
+        self._entries.append(entry)
+        for table, code in enumerate(self._codes[row]):
+            self._buckets[table].setdefault(int(code), []).append(row)
+
+    def _rebuild(self, drop):
+        keep = len(self._entries) - drop
+        self._vectors[:keep] = self._vectors[drop:drop + keep]
+        self._codes[:keep] = self._codes[drop:drop + keep]
+        self._entries = self._entries[drop:]
+        self._buckets = [{} for _ in range(self.tables)]
+        for row in range(keep):
+            for table, code in enumerate(self._codes[row]):
+                self._buckets[table].setdefault(int(code), []).append(row)
+
+    def nearest(self, vector, accept=None, minimum=-1.0):
+        """
+        Best entry for vector.
+
+        Args:
+            accept (callable, optional): accept(entry) -> bool filters candidates
+            minimum (float): Ignore entries less similar than this
+
+        Returns:
+            tuple: (similarity, entry), or (0.0, None) if there is no candidate
+        """
+        count = len(self._entries)
+        if count == 0:
+            return 0.0, None
+        if count <= self.brute_force_limit:
+            similarities = self._vectors[:count] @ vector
+            rows = np.flatnonzero(similarities >= minimum)
+            similarities = similarities[rows]
+        else:
+            codes = self._hash(vector[None, :])[0]
+            candidates = set()
+            for table, code in enumerate(codes):
+                candidates.update(self._buckets[table].get(int(code), ()))
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarities = self._vectors[rows] @ vector
+        for position in np.argsort(-similarities):
+            if similarities[position] < minimum:
+                break
+            entry = self._entries[rows[position]]
+            if accept is None or accept(entry):
+                return float(similarities[position]), entry
+        return 0.0, None
+
+class SemanticCache:
+    """LLM responses reused for questions that mean the same thing.
+
+    Queries are normalized (stop and filler words removed, synonyms such as
+    marks/grades mapped to one word), embedded as hashed n-gram vectors and
+    looked up in a per-scope SemanticIndex, so one student's cached answers
+    are never returned to another. A cached answer is used when its cosine
+    similarity reaches threshold and the queries contain the same numbers
+    ("semester 2" never answers "semester 3") and the same negations and
+    comparisons ("courses I did not pass" never answers "courses I passed").
+    """
+
+    def __init__(self, threshold=0.9, maxsize=1000, max_scopes=256, ttl=3600, dimensions=512):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.dimensions = dimensions
+        self._scopes = LRUCache(maxsize=max_scopes)
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.exact_hits = 0
+        self.llm_calls = 0
+        self.total_similarity = 0.0
+        self.total_seconds = 0.0
+
+    def _key(self, query):
+        words = normalize_words(query)
+        qualifiers = tuple(sorted(set(word for word in words if word in QUALIFIER_WORDS)))
+        return words, (tuple(_NUMBER.findall(query)), qualifiers)
+
+    def get(self, query, scope=None):
+        """
+        Look up an answer for query.
+
+        Args:
+            query (str): The question
+            scope: Hashable scope, e.g. (kind, registration number)
+
+        Returns:
+            str: The cached answer, or None
+        """
+        start = time.perf_counter()
+        words, constraints = self._key(query)
+        answer = None
+        similarity = 0.0
+        if words:
+            index = self._scopes.get(scope)
+            if index is not None:
+                vector = embed(words, self.dimensions)
+                now = time.monotonic()
+                with self._lock:
+                    similarity, entry = index.nearest(
+                        vector,
+                        accept=lambda entry: entry[0] == constraints and now - entry[2] < self.ttl,
+                        minimum=self.threshold
+                    )
+                if entry is not None and similarity >= self.threshold:
+                    answer = entry[1]
+        with self._lock:
+            self.lookups += 1
+            self.total_seconds += time.perf_counter() - start
+            if answer is not None:
+                self.hits += 1
+                self.total_similarity += similarity
+                if similarity >= 0.9999:
+                    self.exact_hits += 1
+        return answer
+
+    def set(self, query, answer, scope=None):
+        """Cache the answer the model gave for query."""
+        words, constraints = self._key(query)
+        if not words:
+            return
+        vector = embed(words, self.dimensions)
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is None:
+                index = SemanticIndex(self.dimensions, maxsize=self.maxsize)
+                self._scopes.set(scope, index)
+            index.add(vector, (constraints, answer, time.monotonic()))
+
+    def record_llm_call(self):
+        """Count one model call that the cache could not save."""
+        with self._lock:
+            self.llm_calls += 1
+
+    def clear(self):
+        """Forget every answer, e.g. after the student data was reloaded (counters are kept)."""
+        self._scopes.clear()
+
+    def stats(self):
+        """Return hit rate and model calls saved for a metrics endpoint."""
+        with self._lock:
+            return {
+                'lookups': self.lookups,
+                'hits': self.hits,
+                'exact_hits': self.exact_hits,
+                'hit_rate': self.hits / self.lookups if self.lookups else 0.0,
+                'llm_calls': self.llm_calls,
+                'llm_calls_saved': self.hits,
+                'avg_hit_similarity': self.total_similarity / self.hits if self.hits else 0.0,
+                'avg_lookup_ms': self.total_seconds / self.lookups * 1000 if self.lookups else 0.0,
+                'scopes': len(self._scopes)
+            }
+
+def create_semantic_cache():
+    """
+    Create a SemanticCache configured by SEMANTIC_CACHE_THRESHOLD (cosine similarity),
+    SEMANTIC_CACHE_SIZE (answers per scope), SEMANTIC_CACHE_SCOPES and SEMANTIC_CACHE_TTL.
+    """
+    return SemanticCache(
+        threshold=float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.9')),
+        maxsize=int(os.getenv('SEMANTIC_CACHE_SIZE', '1000')),
+        max_scopes=int(os.getenv('SEMANTIC_CACHE_SCOPES', '256')),
+        ttl=float(os.getenv('SEMANTIC_CACHE_TTL', '3600'))
+    )
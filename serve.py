@@ -0,0 +1,123 @@
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+import multiprocessing
+from server_config import detect_async_mode
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Raizel with a production Socket.IO server")
+    parser.add_argument('--host', default=os.getenv('RAIZEL_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('RAIZEL_PORT', '3000')))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('RAIZEL_WORKERS', str(os.cpu_count() or 1))),
+                        help="Number of server processes")
+    parser.add_argument('--async-mode', default=os.getenv('SOCKETIO_ASYNC_MODE', 'auto'),
+                        choices=['auto', 'eventlet', 'gevent', 'threading'])
+    parser.add_argument('--message-queue', default=os.getenv('SOCKETIO_MESSAGE_QUEUE'),
+                        help="redis:// or amqp:// URL; defaults to a local pub/sub broker when workers > 1")
+    return parser.parse_args()
+
+def serve_socket(flask_app, sock, async_mode):
+    """Serve flask_app on an already listening socket with the given async mode."""
+    if async_mode == 'eventlet':
+        import eventlet.greenio
+        import eventlet.wsgi
+        eventlet.wsgi.server(eventlet.greenio.GreenSocket(sock), flask_app, log_output=False)
+    elif async_mode == 'gevent':
+        from gevent import pywsgi
+        import gevent.socket
+        # The listening socket was created before monkey patching
+        sock = gevent.socket.socket(sock.family, sock.type, fileno=sock.detach())
+        try:
+            from geventwebsocket.handler import WebSocketHandler
+            server = pywsgi.WSGIServer(sock, flask_app, handler_class=WebSocketHandler, log=None)
+        except ImportError:
+            # WebSocket support comes from the simple-websocket package
+            server = pywsgi.WSGIServer(sock, flask_app, log=None)
+        server.serve_forever()
+    else:
+        from werkzeug.serving import make_server
+        host, port = sock.getsockname()[:2]
+        make_server(host, port, flask_app, threaded=True, fd=sock.fileno()).serve_forever()
+
+def run_worker(sock, async_mode, worker_id):
+    """Worker process body: patch for the async mode, load the app and serve."""
+    # The supervisor's shutdown handlers are inherited across fork
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    if async_mode == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+    elif async_mode == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+
+    import app as raizel_app
+    raizel_app.start_background_services()
+    print(f"Worker {worker_id} (pid {os.getpid()}) serving with {async_mode}")
+    serve_socket(raizel_app.app, sock, async_mode)
+
+def main():
+    args = parse_args()
+    async_mode = detect_async_mode(args.async_mode)
+    workers = max(args.workers, 1)
+    if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        print("Multiple workers need fork(); running a single worker on this platform")
+        workers = 1
+
+    sock = socket.create_server((args.host, args.port), backlog=2048)
+    os.environ['SOCKETIO_ASYNC_MODE'] = async_mode
+
+    broker = None
+    if workers > 1:
+        message_queue = args.message_queue
+        if not message_queue:
+            from pubsub_broker import PubSubBroker
+            broker = PubSubBroker().start()
+            message_queue = broker.url
+        os.environ['SOCKETIO_MESSAGE_QUEUE'] = message_queue
+        # Connections are spread across processes by the kernel, so long-polling
+        # requests from one client could land on different workers
+        os.environ.setdefault('SOCKETIO_TRANSPORTS', 'websocket')
+
+    print(f"Starting Raizel on http://{args.host}:{args.port} with {workers} {async_mode} worker(s)")
+    if workers == 1:
+        run_worker(sock, async_mode, 0)
+        return
+
+    context = multiprocessing.get_context('fork')
+    processes = {}
+
+    def spawn(worker_id):
+        process = context.Process(target=run_worker, args=(sock, async_mode, worker_id), daemon=True)
+        process.start()
+        processes[worker_id] = process
+
+    def shutdown(signum, frame):
+        print("Shutting down workers...")
+        for process in processes.values():
+            process.terminate()
+        for process in processes.values():
+            process.join(timeout=5)
+        if broker is not None:
+            broker.stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    for worker_id in range(workers):
+        spawn(worker_id)
+
+    # Replace workers that die so capacity stays constant
+    while True:
+        time.sleep(1)
+        for worker_id, process in list(processes.items()):
+            if not process.is_alive():
+                print(f"Worker {worker_id} exited with code {process.exitcode}, restarting")
+                spawn(worker_id)
+
+if __name__ == "__main__":
+    main()
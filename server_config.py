@@ -0,0 +1,44 @@
+import os
+
+ASYNC_MODES = ['eventlet', 'gevent', 'threading']
+
+def detect_async_mode(preferred='auto'):
+    """Return preferred, or the first installed of eventlet, gevent and threading."""
+    if preferred and preferred != 'auto':
+        return preferred
+    for mode in ASYNC_MODES[:-1]:
+        try:
+            __import__(mode)
+            return mode
+        except ImportError:
+            continue
+    return 'threading'
+
+def socketio_options():
+    """
+    Build the SocketIO keyword arguments from the environment.
+
+    SOCKETIO_ASYNC_MODE picks the worker model (default threading), SOCKETIO_MESSAGE_QUEUE makes
+    emits reach clients connected to other processes (redis://, amqp:// or the
+    local raizel-pubsub:// broker) and SOCKETIO_TRANSPORTS limits the allowed
+    transports (e.g. "websocket" when there are no sticky sessions).
+
+    Returns:
+        dict: Options to pass to SocketIO()
+    """
+    # Default to threading: the development server does not monkey patch, and
+    # the chat worker pool emits from ordinary threads
+    options = {'async_mode': os.getenv('SOCKETIO_ASYNC_MODE', 'threading')}
+
+    message_queue = os.getenv('SOCKETIO_MESSAGE_QUEUE')
+    if message_queue:
+        from pubsub_broker import BROKER_SCHEME, LocalPubSubManager
+        if message_queue.startswith(f"{BROKER_SCHEME}://"):
+            options['client_manager'] = LocalPubSubManager(message_queue)
+        else:
+            options['message_queue'] = message_queue
+
+    transports = os.getenv('SOCKETIO_TRANSPORTS')
+    if transports:
+        options['transports'] = [transport.strip() for transport in transports.split(',')]
+    return options
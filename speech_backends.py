@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import speech_recognition as sr
+
+class SpeechBackend(ABC):
+    """Interface for a speech-to-text engine.
+
+    Backends with a model (pooled = True) load it in load_model(); the
+    ModelPool keeps loaded models warm and hands one to each transcribe()
+    call. transcribe() returns the text, or raises sr.UnknownValueError when
+    there was no intelligible speech and sr.RequestError when the engine
+    itself failed.
+    """
+
+    name = 'base'
+    pooled = False
+
+    def load_model(self):
+        return None
+
+    @abstractmethod
+    def transcribe(self, model, audio):
+        """Return the text spoken in audio (sr.AudioData), using model from load_model()."""
+
+class GoogleBackend(SpeechBackend):
+    """Google Web Speech API (network round trip per utterance, no local model)."""
+
+    name = 'google'
+
+    def __init__(self, language='en-US'):
+        self.language = language
+        self._recognizer = sr.Recognizer()
+
+    def transcribe(self, model, audio):
+        return self._recognizer.recognize_google(audio, language=self.language)
+
+class VoskBackend(SpeechBackend):
+    """Offline Kaldi recognition on the CPU through the vosk package."""
+
+    name = 'vosk'
+    pooled = True
+
+    def __init__(self, model_path, sample_rate=16000):
+        self.model_path = model_path
+        self.sample_rate = sample_rate
+
+    def load_model(self):
+        try:
+            from vosk import Model, SetLogLevel
+        except ImportError:
+            raise sr.RequestError("Offline recognition needs the vosk package (pip install vosk)")
+        SetLogLevel(-1)
+        return Model(self.model_path)
+
+    def transcribe(self, model, audio):
+        from vosk import KaldiRecognizer
+        recognizer = KaldiRecognizer(model, self.sample_rate)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get('text', '')
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+class StubBackend(SpeechBackend):
+    """Deterministic local recognizer for tests and benchmarks.
+
+    Silent clips raise sr.UnknownValueError. Other clips return the
+    transcript registered for their exact audio (by SHA-1 of the PCM data)
+    or default_text, after an optional fixed delay.
+    """
+
+    name = 'stub'
+    pooled = True
+
+    def __init__(self, default_text="what are my marks", transcripts=None, delay=0.0, load_delay=0.0):
+        self.default_text = default_text
+        self.transcripts = transcripts or {}
+        self.delay = delay
+        self.load_delay = load_delay
+
+    @staticmethod
+    def key(audio):
+        return hashlib.sha1(audio.get_raw_data()).hexdigest()
+
+    def load_model(self):
+        time.sleep(self.load_delay)
+        return object()
+
+    def transcribe(self, model, audio):
+        if self.delay:
+            time.sleep(self.delay)
+        raw = audio.get_raw_data()
+        if not raw.strip(b'\x00'):
+            raise sr.UnknownValueError()
+        return self.transcripts.get(self.key(audio), self.default_text)
+
+class ModelPool:
+    """Pre-loaded models for one backend, shared by all requests.
+
+    Every model is loaded once up front, so no utterance pays load time;
+    concurrent recognitions each borrow a model and block if all are busy.
+    """
+
+    def __init__(self, backend, size=2):
+        self.backend = backend
+        self.size = size
+        self._models = queue.Queue()
+        self.load_seconds = 0.0
+        self.waits = 0
+        start = time.perf_counter()
+        for _ in range(size):
+            self._models.put(backend.load_model())
+        self.load_seconds = time.perf_counter() - start
+
+    @contextmanager
+    def acquire(self):
+        try:
+            model = self._models.get_nowait()
+        except queue.Empty:
+            self.waits += 1
+            model = self._models.get()
+        try:
+            yield model
+        finally:
+            self._models.put(model)
+
+    def stats(self):
+        return {
+            'size': self.size,
+            'available': self._models.qsize(),
+            'load_seconds': self.load_seconds,
+            'waits': self.waits
+        }
+
+class BackendStats:
+    """Latency counters for one backend."""
+
+    def __init__(self):
+        self.calls = 0
+        self.recognized = 0
+        self.no_speech = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.audio_seconds = 0.0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'recognized': self.recognized,
+            'no_speech': self.no_speech,
+            'errors': self.errors,
+            'avg_ms': self.total_seconds / self.calls * 1000 if self.calls else 0.0,
+            'max_ms': self.max_seconds * 1000,
+            # Processing time per second of audio (below 1 is faster than real time)
+            'real_time_factor': self.total_seconds / self.audio_seconds if self.audio_seconds else None
+        }
+
+class SpeechService:
+    """Recognizes sr.AudioData clips with an ordered list of backends.
+
+    Backends are tried in order: if one fails with sr.RequestError (engine
+    unavailable, network error) the next one is used. sr.UnknownValueError
+    means the clip had no speech and is raised straight away.
+    """
+
+    def __init__(self, backends, pool_size=2):
+        self.backends = []
+        self.pools = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        for backend in backends:
+            try:
+                if backend.pooled:
+                    self.pools[backend.name] = ModelPool(backend, pool_size)
+            except Exception as e:
+                print(f"Could not load the {backend.name} speech model: {str(e)}")
+                continue
+            self.backends.append(backend)
+            self._stats[backend.name] = BackendStats()
+        print(f"Speech recognition backends: {', '.join(backend.name for backend in self.backends) or 'none'}")
+
+    def _transcribe(self, backend, audio):
+        pool = self.pools.get(backend.name)
+        if pool is None:
+            return backend.transcribe(None, audio)
+        with pool.acquire() as model:
+            return backend.transcribe(model, audio)
+
+    def recognize(self, audio):
+        """
+        Transcribe audio with the first backend that is available.
+
+        Args:
+            audio (sr.AudioData): The clip
+
+        Returns:
+            str: The transcript
+        """
+        error = sr.RequestError("No speech recognition backend is available")
+        audio_seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        for backend in self.backends:
+            stats = self._stats[backend.name]
+            start = time.perf_counter()
+            outcome = 'errors'
+            try:
+                text = self._transcribe(backend, audio)
+                outcome = 'recognized'
+                return text
+            except sr.UnknownValueError:
+                outcome = 'no_speech'
+                raise
+            except sr.RequestError as e:
+                print(f"{backend.name} speech recognition failed: {str(e)}")
+                error = e
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    stats.calls += 1
+                    setattr(stats, outcome, getattr(stats, outcome) + 1)
+                    stats.total_seconds += elapsed
+                    stats.max_seconds = max(stats.max_seconds, elapsed)
+                    stats.audio_seconds += audio_seconds
+        raise error
+
+    def stats(self):
+        """Return per-backend latency and model pool counters for a metrics endpoint."""
+        with self._lock:
+            return {
+                name: dict(stats.as_dict(), pool=self.pools[name].stats() if name in self.pools else None)
+                for name, stats in self._stats.items()
+            }
+
+def create_backend(name):
+    if name == 'google':
+        return GoogleBackend(os.getenv('SPEECH_LANGUAGE', 'en-US'))
+    if name == 'vosk':
+        return VoskBackend(os.getenv('VOSK_MODEL_PATH', 'model'))
+    if name == 'stub':
+        return StubBackend()
+    raise ValueError(f"Unknown speech backend: {name}")
+
+_speech_service = None
+_speech_service_lock = threading.Lock()
+
+def get_speech_service():
+    """
+    Return the process-wide SpeechService, loading its models on first use.
+
+    SPEECH_BACKENDS lists the backends in order of preference (default
+    "google"; e.g. "vosk,google" for offline recognition with an online
+    fallback) and SPEECH_MODEL_POOL_SIZE sets how many models each offline
+    backend keeps loaded.
+    """
+    global _speech_service
+    if _speech_service is None:
+        with _speech_service_lock:
+            if _speech_service is None:
+                names = [name.strip() for name in os.getenv('SPEECH_BACKENDS', 'google').split(',') if name.strip()]
+                _speech_service = SpeechService(
+                    [create_backend(name) for name in names],
+                    pool_size=int(os.getenv('SPEECH_MODEL_POOL_SIZE', '2'))
+                )
+    return _speech_service
@@ -0,0 +1,362 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from lru_cache import LRUCache
+
+AUDIO_MIMETYPES = {'wav': 'audio/wav', 'mp3': 'audio/mpeg', 'ogg': 'audio/ogg'}
+
+class Synthesizer(ABC):
+    """Interface for a text-to-speech engine that renders to WAV bytes.
+
+    voice_tag() identifies the voice settings, so cached audio is not reused
+    after the voice, rate or volume change.
+    """
+
+    name = 'base'
+
+    def voice_tag(self):
+        return self.name
+
+    @abstractmethod
+    def synthesize_wav(self, text):
+        """Return text rendered as WAV bytes."""
+
+class Pyttsx3Synthesizer(Synthesizer):
+    """Renders with pyttsx3 on one dedicated thread that owns the engine.
+
+    pyttsx3 can only write to a file, so each phrase goes through a
+    temporary WAV file that is read back and deleted. If the engine fails
+    it is dropped and created again on the next call.
+    """
+
+    name = 'pyttsx3'
+
+    def __init__(self, engine_factory=None):
+        self.engine_factory = engine_factory
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='raizel-synthesis')
+        self._engine = None
+        self._tag = None
+
+    def _get_engine(self):
+        if self._engine is None:
+            if self.engine_factory is not None:
+                self._engine = self.engine_factory()
+            else:
+                import pyttsx3
+                self._engine = pyttsx3.init()
+            if self._engine is None:
+                raise RuntimeError("Text-to-speech engine is not available")
+            self._tag = '|'.join(str(self._engine.getProperty(name)) for name in ('voice', 'rate', 'volume'))
+        return self._engine
+
+    def _voice_tag(self):
+        try:
+            self._get_engine()
+        except Exception:
+            self._engine = None
+            raise
+        return f"{self.name}|{self._tag}"
+
+    def voice_tag(self):
+        return self._executor.submit(self._voice_tag).result()
+
+    def _render(self, text):
+        fd, path = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        try:
+            engine = self._get_engine()
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            with open(path, 'rb') as f:
+                return f.read()
+        except Exception:
+            self._engine = None
+            raise
+        finally:
+            os.remove(path)
+
+    def synthesize_wav(self, text):
+        return self._executor.submit(self._render, text).result()
+
+class StubSynthesizer(Synthesizer):
+    """Deterministic tone generator for tests and benchmarks (delay and length scale with the text)."""
+
+    name = 'stub'
+
+    def __init__(self, seconds_per_char=0.0, sample_rate=16000):
+        self.seconds_per_char = seconds_per_char
+        self.sample_rate = sample_rate
+
+    def synthesize_wav(self, text):
+        if self.seconds_per_char:
+            time.sleep(self.seconds_per_char * len(text))
+        t = np.arange(int(self.sample_rate * 0.06 * len(text))) / self.sample_rate
+        samples = (3000 * np.sin(2 * np.pi * (150 + len(text) % 50) * t)).astype(np.int16)
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
+
+def encoder_available(audio_format):
+    """True if WAV audio can be encoded to audio_format (mp3/ogg need pydub and ffmpeg)."""
+    if audio_format == 'wav':
+        return True
+    try:
+        import pydub
+    except ImportError:
+        return False
+    return shutil.which('ffmpeg') is not None or shutil.which('avconv') is not None
+
+def encode_audio(wav_bytes, audio_format):
+    """Compress WAV bytes to audio_format in memory."""
+    if audio_format == 'wav':
+        return wav_bytes
+    from pydub import AudioSegment
+    output = io.BytesIO()
+    AudioSegment.from_wav(io.BytesIO(wav_bytes)).export(output, format=audio_format)
+    return output.getvalue()
+
+class AudioCache:
+    """Synthesized audio keyed by content hash: an in-memory LRU in front of a directory of files.
+
+    The disk tier survives restarts and is shared by every server process;
+    files are written atomically and the oldest are removed beyond max_files.
+    """
+
+    def __init__(self, maxsize=256, directory=None, max_files=2000):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.directory = directory
+        self.max_files = max_files
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self.disk_evictions = 0
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        audio = self.memory.get(key)
+        if audio is not None or not self.directory:
+            return audio
+        try:
+            with open(self._path(key), 'rb') as f:
+                audio = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        self.memory.set(key, audio)
+        return audio
+
+    def set(self, key, audio):
+        self.memory.set(key, audio)
+        if not self.directory:
+            return
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(audio)
+            os.replace(temp_path, self._path(key))
+            with self._lock:
+                self.disk_writes += 1
+            self._prune()
+        except OSError as e:
+            print(f"Error writing speech cache file: {str(e)}")
+
+    def _prune(self):
+        entries = [entry for entry in os.scandir(self.directory) if not entry.name.endswith('.tmp')]
+        if len(entries) <= self.max_files:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_files]:
+            try:
+                os.remove(entry.path)
+                with self._lock:
+                    self.disk_evictions += 1
+            except OSError:
+                pass
+
+    def stats(self):
+        memory = self.memory.stats()
+        lookups = memory['hits'] + memory['misses']
+        return {
+            'memory': memory,
+            'disk_hits': self.disk_hits,
+            'disk_writes': self.disk_writes,
+            'disk_evictions': self.disk_evictions,
+            'hit_rate': (memory['hits'] + self.disk_hits) / lookups if lookups else 0.0
+        }
+
+class SpeechSynthesis:
+    """Renders replies to compressed audio on the server.
+
+    Fixed phrases (greetings, error messages) registered with
+    register_phrases() are cached by a hash of voice, format and text, so
+    repeated ones are served without re-synthesis. Other text is rendered
+    fresh every time. If the engine fails, synthesize() returns None
+    (replies stay text-only) for retry_seconds, doubling after each further
+    failure up to max_retry_seconds, and then tries the engine again.
+    """
+
+    def __init__(self, synthesizer, cache=None, audio_format='mp3', retry_seconds=5, max_retry_seconds=300):
+        if not encoder_available(audio_format):
+            print(f"No {audio_format} encoder available (needs pydub and ffmpeg), sending WAV audio")
+            audio_format = 'wav'
+        self.synthesizer = synthesizer
+        self.cache = cache or AudioCache()
+        self.audio_format = audio_format
+        self.mimetype = AUDIO_MIMETYPES[audio_format]
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self._failures = 0
+        self._retry_at = 0.0
+        self._phrases = set()
+        self._voice_tag = None
+        self._lock = threading.Lock()
+        self.syntheses = 0
+        self.uncached = 0
+        self.errors = 0
+        self.characters = 0
+        self.synthesis_seconds = 0.0
+
+    @property
+    def available(self):
+        """False while backing off after an engine failure."""
+        return time.monotonic() >= self._retry_at
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(text.split())
+
+    def register_phrases(self, phrases):
+        """Mark fixed phrases whose audio should be cached."""
+        with self._lock:
+            self._phrases.update(self.normalize(phrase) for phrase in phrases)
+
+    def key(self, text):
+        if self._voice_tag is None:
+            self._voice_tag = self.synthesizer.voice_tag()
+        content = f"{self._voice_tag}\n{self.audio_format}\n{self.normalize(text)}"
+        return f"{hashlib.sha256(content.encode('utf-8')).hexdigest()}.{self.audio_format}"
+
+    def _render(self, text):
+        start = time.perf_counter()
+        audio = encode_audio(self.synthesizer.synthesize_wav(text), self.audio_format)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._failures = 0
+            self.syntheses += 1
+            self.characters += len(text)
+            self.synthesis_seconds += elapsed
+        return audio
+
+    def synthesize(self, text):
+        """
+        Render text to audio, from the cache if it is a registered phrase.
+
+        Args:
+            text (str): The reply to speak
+
+        Returns:
+            bytes: Audio in self.audio_format, or None if synthesis is unavailable
+        """
+        if not self.available or not text:
+            return None
+        try:
+            if self.normalize(text) not in self._phrases:
+                with self._lock:
+                    self.uncached += 1
+                return self._render(text)
+            key = self.key(text)
+            audio = self.cache.get(key)
+            if audio is None:
+                audio = self._render(text)
+                self.cache.set(key, audio)
+            return audio
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self._failures += 1
+                delay = min(self.retry_seconds * 2 ** (self._failures - 1), self.max_retry_seconds)
+                self._retry_at = time.monotonic() + delay
+            print(f"Error in speech synthesis, replies will be text only for {delay:g} s: {str(e)}")
+            return None
+
+    def cached(self, text):
+        """
+        Return the audio of a registered phrase if it is already cached, without synthesizing.
+
+        Returns:
+            bytes: Audio in self.audio_format, or None
+        """
+        # Before the first synthesis the voice tag is unknown, and asking the
+        # engine for it would wait behind any synthesis in progress
+        if not text or self._voice_tag is None or self.normalize(text) not in self._phrases:
+            return None
+        return self.cache.get(self.key(text))
+
+    def warm(self):
+        """Synthesize every registered phrase that is not cached yet."""
+        for phrase in sorted(self._phrases):
+            if self.synthesize(phrase) is None:
+                break
+
+    def stats(self):
+        """Return cache hit rate and synthesis cost for a metrics endpoint."""
+        with self._lock:
+            return {
+                'available': self.available,
+                'format': self.audio_format,
+                'phrases': len(self._phrases),
+                'syntheses': self.syntheses,
+                'uncached': self.uncached,
+                'errors': self.errors,
+                'ms_per_char': self.synthesis_seconds / self.characters * 1000 if self.characters else None,
+                'cache': self.cache.stats()
+            }
+
+def create_speech_synthesis(engine_factory=None):
+    """
+    Create the server-side SpeechSynthesis configured from the environment.
+
+    TTS_BACKEND is pyttsx3 (default), stub or none; TTS_AUDIO_FORMAT is mp3
+    (default), ogg or wav; TTS_CACHE_SIZE, TTS_CACHE_DIR and
+    TTS_CACHE_MAX_FILES size the memory and disk tiers; TTS_RETRY_SECONDS
+    and TTS_MAX_RETRY_SECONDS bound the backoff after engine failures.
+
+    Returns:
+        SpeechSynthesis: The service, or None if server-side speech is disabled
+    """
+    backend = os.getenv('TTS_BACKEND', 'pyttsx3')
+    if backend == 'none':
+        return None
+    if backend == 'stub':
+        synthesizer = StubSynthesizer()
+    elif backend == 'pyttsx3':
+        synthesizer = Pyttsx3Synthesizer(engine_factory)
+    else:
+        raise ValueError(f"Unknown text-to-speech backend: {backend}")
+    cache = AudioCache(
+        maxsize=int(os.getenv('TTS_CACHE_SIZE', '256')),
+        directory=os.getenv('TTS_CACHE_DIR', '.ttscache') or None,
+        max_files=int(os.getenv('TTS_CACHE_MAX_FILES', '2000'))
+    )
+    return SpeechSynthesis(
+        synthesizer, cache, os.getenv('TTS_AUDIO_FORMAT', 'mp3'),
+        retry_seconds=float(os.getenv('TTS_RETRY_SECONDS', '5')),
+        max_retry_seconds=float(os.getenv('TTS_MAX_RETRY_SECONDS', '300'))
+    )
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+KEY_COLUMN = 'Registration_Number'
+
+def sort_by_registration(df):
+    """Return df with rows grouped by registration number (stable, original order kept within a student)."""
+    if df is None or KEY_COLUMN not in df.columns or df[KEY_COLUMN].is_monotonic_increasing:
+        return df
+    return df.sort_values(KEY_COLUMN, kind='stable').reset_index(drop=True)
+
+def build_row_ranges(df):
+    """
+    Map every registration number in df to the (start, stop) row range it occupies.
+
+    df must already be grouped by registration number (see sort_by_registration).
+
+    Returns:
+        dict: Registration number -> (start, stop) positional slice bounds
+    """
+    if df is None or KEY_COLUMN not in df.columns or df.empty:
+        return {}
+    keys = df[KEY_COLUMN].to_numpy()
+    # Row positions where a new registration number starts
+    starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+    stops = np.append(starts[1:], len(keys))
+    return {
+        keys[start]: (int(start), int(stop))
+        for start, stop in zip(starts, stops)
+        if not pd.isna(keys[start])
+    }
+
+class StudentIndex:
+    """Hash index from registration number to row slices of each per-student dataset.
+
+    Lookups are a dict probe plus a positional slice, so their cost does not
+    grow with the number of students, unlike a boolean mask over the column.
+    """
+
+    def __init__(self, datasets):
+        self._frames = {}
+        self._ranges = {}
+        for name, df in datasets.items():
+            if df is None or KEY_COLUMN not in df.columns:
+                continue
+            self._frames[name] = df
+            self._ranges[name] = build_row_ranges(df)
+
+    def lookup(self, name, registration_number):
+        """
+        Return the rows of a dataset belonging to one student.
+
+        Args:
+            name (str): Dataset name (e.g. 'students', 'marks', 'courses')
+            registration_number (str): Student registration number
+
+        Returns:
+            pd.DataFrame: The student's rows (empty if none), or None if the dataset is not indexed
+        """
+        df = self._frames.get(name)
+        if df is None:
+            return None
+        start, stop = self._ranges[name].get(registration_number, (0, 0))
+        return df.iloc[start:stop]
+
+    def contains(self, name, registration_number):
+        """Return True if the dataset has rows for the student."""
+        return registration_number in self._ranges.get(name, {})
@@ -0,0 +1,32 @@
+import json
+import os
+from data_store import AcademicDataStore
+from dashboard_view import DashboardViews
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def test_dashboard_view():
+    store = AcademicDataStore(data_dir=DATA_DIR)
+    views = DashboardViews(store)
+    view = views.rebuild()
+    assert view.stats()['entries'] == len(store.get_student_data())
+
+    entry = view.get('REG2023001')
+    payload = json.loads(entry.api_json)
+    marks = store.get_student_marks('REG2023001')
+    latest = marks[marks['Semester'] == marks['Semester'].max()]
+
+    assert payload['profile']['name'] == 'John Doe'
+    assert len(payload['marks']) == len(marks)
+    assert payload['latest_semester']['semester'] == marks['Semester'].max()
+    assert abs(payload['latest_semester']['average_marks'] - latest['Marks'].mean()) < 1e-9
+    for subject in entry.template_context['academic_data']:
+        assert subject['status'] == ('Pass' if subject['grade'] >= 60 else 'Fail')
+
+    # Unknown students have no dashboard, and the view is reused within a generation
+    assert view.get('UNKNOWN') is None
+    assert views.current() is view
+    print(f"Dashboard view stats: {view.stats()}")
+
+if __name__ == "__main__":
+    test_dashboard_view()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from columnar_cache import load_csv_cached
+from data_store import AcademicDataStore, DATASET_FILES
+from data_watcher import DataWatcher
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def test_data_store():
+    store = AcademicDataStore(data_dir=DATA_DIR)
+
+    # Every dataset is parsed once and shared between accessors
+    students = store.get_student_data()
+    assert students is not None
+    assert store.get_student_data() is students
+    print(f"Loaded {len(students)} student profiles")
+
+    files = store.as_file_dict()
+    assert set(files) == set(DATASET_FILES.values())
+
+    usage = store.memory_usage()
+    for name, size in usage.items():
+        print(f"{name}: {size / 1024:.1f} KB")
+        assert size > 0
+
+def test_student_index_matches_mask():
+    store = AcademicDataStore(data_dir=DATA_DIR)
+    marks = store.get_marks_data()
+
+    # Index slices must return the same rows as a boolean-mask scan
+    for registration_number in marks['Registration_Number'].unique()[:25]:
+        expected = marks[marks['Registration_Number'] == registration_number]
+        assert store.get_student_marks(registration_number).equals(expected)
+
+    assert store.get_student_profile('REG2023001').iloc[0]['Name'] == 'John Doe'
+    assert store.get_student_marks('UNKNOWN').empty
+    assert store.get_student_courses('UNKNOWN').empty
+
+def test_watcher_reloads_changed_csv():
+    data_dir = tempfile.mkdtemp()
+    try:
+        for file in DATASET_FILES.values():
+            shutil.copy(os.path.join(DATA_DIR, file), data_dir)
+        store = AcademicDataStore(data_dir=data_dir)
+        watcher = DataWatcher(store)
+        old_snapshot = store.snapshot()
+        assert not watcher.check()
+
+        with open(store.path_for('students'), 'a') as f:
+            f.write("REG2099999,New Student,Physics,2025,3.5\n")
+
+        # The first check only notices the change, the second one reloads
+        assert not watcher.check()
+        assert watcher.check()
+        assert store.generation == old_snapshot.generation + 1
+        assert not store.get_student_profile('REG2099999').empty
+
+        # Snapshots held by in-flight requests are left untouched
+        assert old_snapshot.get_student_profile('REG2099999').empty
+        print(f"Reloaded in {store.last_reload_seconds * 1000:.1f} ms")
+    finally:
+        shutil.rmtree(data_dir)
+
+def test_columnar_cache_keeps_value_types():
+    data_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(data_dir, 'mixed.csv')
+        pd.DataFrame({
+            'name': ['a', None, 'c'],
+            'passed': [True, np.nan, False],
+            'marks': [81, 64, 90]
+        }).to_csv(path, index=False)
+        parsed = load_csv_cached(path)
+        cached = load_csv_cached(path)
+        assert cached.equals(parsed)
+        assert cached['passed'].tolist()[0] is True and cached['passed'].tolist()[2] is False
+        assert cached['name'].isna().tolist() == [False, True, False]
+        # No temp files are left behind
+        cache_dir = os.path.join(data_dir, '.mixed.csv.npycache')
+        assert not [file for file in os.listdir(cache_dir) if file.endswith('.tmp')]
+    finally:
+        shutil.rmtree(data_dir)
+
+if __name__ == "__main__":
+    test_data_store()
+    test_student_index_matches_mask()
+    test_watcher_reloads_changed_csv()
+    test_columnar_cache_keeps_value_types()
@@ -0,0 +1,127 @@
+from html_extract import extract_sentences, iter_sentences
+
+PAGE = """<html><head><title>Python</title><style>p { color: red; }</style>
+<script>var text = "This script text must never be part of the answer.";</script></head>
+<body><header><p>Site header with a long line of words that should be skipped.</p></header>
+<nav><ul><li>Home page link with enough words to count here</li></ul></nav>
+<div class="mw-body"><h1>Python</h1>
+<p>Python is a programming language that lets you work quickly. It was created by Guido van Rossum in 1991.</p>
+<p>Python&#39;s design philosophy emphasizes code readability with <b>significant indentation</b> and clear syntax.</p>
+<div class="navbox"><p>Navigation box text that has more than five words inside.</p></div>
+<p>Short one.</p></div>
+<aside>Sidebar content with many words that are not part of the article.</aside>
+<footer>Footer text with many words that are not part of the article.</footer></body></html>"""
+
+EXPECTED = [
+    "Python is a programming language that lets you work quickly.",
+    "It was created by Guido van Rossum in 1991.",
+    "Python's design philosophy emphasizes code readability with significant indentation and clear syntax.",
+]
+
+def test_extracts_content_sentences_only():
+    assert extract_sentences(PAGE) == EXPECTED
+
+def test_same_result_for_bytes_and_small_chunks():
+    data = PAGE.encode('utf-8')
+    chunks = [data[start:start + 7] for start in range(0, len(data), 7)]
+    assert extract_sentences(data) == EXPECTED
+    assert list(iter_sentences(chunks)) == EXPECTED
+
+def test_stops_early():
+    consumed = []
+
+    def chunks():
+        for start in range(0, len(PAGE), 50):
+            consumed.append(start)
+            yield PAGE[start:start + 50]
+
+    assert extract_sentences(chunks(), max_sentences=1) == EXPECTED[:1]
+    # The rest of the page was never fed to the parser
+    assert len(consumed) < len(range(0, len(PAGE), 50))
+
+def test_void_tag_with_boilerplate_class_does_not_hide_content():
+    page = '<p>Before the image there is a sentence of words.</p><img class="banner" src="x.png">' \
+           '<p>After the image there is another sentence of words.</p>'
+    assert len(extract_sentences(page)) == 2
+
+# Skeleton of a Wikipedia article page (Vector 2022 skin), with the real classes and ids
+WIKIPEDIA_PAGE = """<!DOCTYPE html>
+<html class="client-nojs vector-feature-language-in-header-enabled vector-feature-sticky-header-disabled vector-feature-page-tools-pinned-disabled vector-feature-toc-pinned-clientpref-1 vector-feature-main-menu-pinned-disabled vector-feature-limited-width-clientpref-1 vector-feature-night-mode-enabled skin-theme-clientpref-day vector-toc-available" lang="en" dir="ltr">
+<head><meta charset="UTF-8"><title>Python (programming language) - Wikipedia</title>
+<script>document.documentElement.className = "client-js";</script>
+<link rel="stylesheet" href="/w/load.php?lang=en&amp;modules=skins.vector.styles&amp;only=styles&amp;skin=vector-2022"></head>
+<body class="skin--responsive skin-vector skin-vector-search-vue mediawiki ltr sitedir-ltr mw-hide-empty-elt ns-0 ns-subject mw-editable page-Python_programming_language rootpage-Python_programming_language skin-vector-2022 action-view">
+<a class="mw-jump-link" href="#bodyContent">Jump to content</a>
+<div class="vector-header-container"><header class="vector-header mw-header">
+<div class="vector-header-start"><nav class="vector-main-menu-landmark" aria-label="Site">
+<div id="vector-main-menu-dropdown" class="vector-dropdown vector-main-menu-dropdown vector-button-flush-left vector-button-flush-right">
+<ul class="vector-menu-content-list"><li id="n-mainpage-description" class="mw-list-item"><a href="/wiki/Main_Page"><span>Main page of the free online encyclopedia</span></a></li></ul>
+</div></nav></div></header></div>
+<div class="mw-page-container"><div class="mw-page-container-inner">
+<div class="vector-sitenotice-container"><div id="siteNotice"><!-- CentralNotice --></div></div>
+<div class="vector-column-start"><div class="vector-main-menu-container"></div>
+<nav id="mw-panel-toc" aria-label="Contents" class="mw-table-of-contents-container vector-toc-landmark">
+<div id="vector-toc-pinned-container" class="vector-pinned-container"><div id="vector-toc" class="vector-toc vector-pinnable-element">
+<ul class="vector-toc-contents" id="mw-panel-toc-list"><li id="toc-History" class="vector-toc-list-item vector-toc-level-1">
+<a class="vector-toc-link" href="#History"><div class="vector-toc-text"><span class="vector-toc-numb">1</span>
+<span>History of the language and its many design decisions</span></div></a></li></ul></div></div></nav></div>
+<div class="mw-content-container"><main id="content" class="mw-body">
+<header class="mw-body-header vector-page-titlebar"><h1 id="firstHeading" class="firstHeading mw-first-heading"><span class="mw-page-title-main">Python (programming language)</span></h1></header>
+<div id="bodyContent" class="vector-body" aria-labelledby="firstHeading" data-mw-ve-target-container>
+<div class="vector-body-before-content"><div class="mw-indicators"></div><div id="siteSub" class="noprint">From Wikipedia, the free encyclopedia</div></div>
+<div id="contentSub"><div id="mw-content-subtitle"></div></div>
+<div id="mw-content-text" class="mw-body-content"><div class="mw-content-ltr mw-parser-output" lang="en" dir="ltr">
+<div class="shortdescription nomobile noexcerpt noprint searchaux" style="display:none">General-purpose programming language</div>
+<table class="infobox vevent"><tbody><tr><th colspan="2" class="infobox-title summary">Python</th></tr></tbody></table>
+<p><b>Python</b> is a <a href="/wiki/High-level_programming_language" title="High-level programming language">high-level</a>, <a href="/wiki/General-purpose_programming_language">general-purpose programming language</a>.<sup id="cite_ref-1" class="reference"><a href="#cite_note-1">[1]</a></sup> Its design philosophy emphasizes <a href="/wiki/Code_readability">code readability</a> with the use of <a href="/wiki/Off-side_rule">significant indentation</a>.</p>
+<meta property="mw:PageProp/toc" />
+<div class="mw-heading mw-heading2"><h2 id="History">History</h2><span class="mw-editsection"><span class="mw-editsection-bracket">[</span><a href="/w/index.php?title=Python&amp;action=edit&amp;section=1">edit</a><span class="mw-editsection-bracket">]</span></span></div>
+<p>Python was conceived in the late 1980s by Guido van Rossum at Centrum Wiskunde &amp; Informatica in the Netherlands.</p>
+<div class="navbox-styles"><style>.mw-parser-output .navbox{box-sizing:border-box}</style></div>
+<div role="navigation" class="navbox" aria-labelledby="Python"><table class="nowraplinks"><tbody><tr><th>Python programming language implementations and related software packages</th></tr></tbody></table></div>
+<div class="reflist"><div class="mw-references-wrap"><ol class="references"><li id="cite_note-1"><span class="reference-text">A reference with a long title that is more than five words.</span></li></ol></div></div>
+</div></div>
+<div class="printfooter" data-nosnippet="">Retrieved from "https://en.wikipedia.org/w/index.php?title=Python_(programming_language)"</div>
+<div id="catlinks" class="catlinks" data-mw="interface"><div id="mw-normal-catlinks" class="mw-normal-catlinks"><a href="/wiki/Help:Category">Categories</a>:
+<ul><li><a href="/wiki/Category:Programming_languages">Programming languages created in 1991 by Dutch programmers</a></li></ul></div></div>
+</div></main></div>
+<div class="mw-footer-container"><footer id="footer" class="mw-footer"><ul id="footer-info"><li id="footer-info-lastmod"> This page was last edited on 1 January 2025, at 00:00.</li></ul></footer></div>
+</div></div>
+</body></html>"""
+
+def test_wikipedia_page_skeleton():
+    assert extract_sentences(WIKIPEDIA_PAGE) == [
+        "Python is a high-level, general-purpose programming language.",
+        "Its design philosophy emphasizes code readability with the use of significant indentation.",
+        "Python was conceived in the late 1980s by Guido van Rossum at Centrum Wiskunde & Informatica in the Netherlands.",
+    ]
+
+def test_page_state_classes_do_not_hide_the_page():
+    wordpress = '<html><body class="post-template-default single single-post has-sidebar">' \
+                '<div id="content" class="site-content has-sidebar"><article class="post">' \
+                '<p>The hostel gates close at ten in the evening every day.</p></article></div>' \
+                '<aside id="secondary" class="widget-area sidebar"><p>Recent posts with many words in them.</p></aside>' \
+                '</body></html>'
+    assert extract_sentences(wordpress) == ["The hostel gates close at ten in the evening every day."]
+
+def test_elements_with_implicit_end_tags_are_never_skipped():
+    page = '<ul><li class="share-buttons">Share this page on every social network<li>x</ul>' \
+           '<p>The library opens at eight in the morning on weekdays.</p>'
+    assert extract_sentences(page) == [
+        "Share this page on every social network",
+        "The library opens at eight in the morning on weekdays.",
+    ]
+    # A skipped container that is never closed ends with the body
+    page = '<html><body><div class="sidebar"><p>Sidebar words that are never closed here.</p>' \
+           '</body></html><p>Text after the body with more than five words.</p>'
+    assert extract_sentences(page) == ["Text after the body with more than five words."]
+
+if __name__ == "__main__":
+    test_extracts_content_sentences_only()
+    test_same_result_for_bytes_and_small_chunks()
+    test_stops_early()
+    test_void_tag_with_boilerplate_class_does_not_hide_content()
+    test_wikipedia_page_skeleton()
+    test_page_state_classes_do_not_hide_the_page()
+    test_elements_with_implicit_end_tags_are_never_skipped()
+    print("All HTML extraction tests passed")
@@ -0,0 +1,48 @@
+from http_clients import WikipediaClient, create_http_session
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+class FakeSession:
+    def __init__(self, data):
+        self.data = data
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append((url, params, timeout))
+        return FakeResponse(self.data)
+
+def test_summary_in_one_request():
+    session = FakeSession({'query': {'pages': [
+        {'index': 2, 'title': 'Python (genus)', 'extract': "Python is a genus of snakes."},
+        {'index': 1, 'title': 'Python (disambiguation)', 'pageprops': {'disambiguation': ''}, 'extract': "Python may refer to:"},
+        {'index': 3, 'title': 'Monty Python', 'extract': "Monty Python were a comedy troupe."},
+    ]}})
+    client = WikipediaClient(session, timeout=(1, 2))
+    # The disambiguation page ranks first but is skipped for the next article
+    assert client.summary("python") == "Python is a genus of snakes."
+    assert len(session.requests) == 1
+    url, params, timeout = session.requests[0]
+    assert params['generator'] == 'search' and params['exsentences'] == 2
+    assert timeout == (1, 2)
+
+def test_summary_without_results():
+    assert WikipediaClient(FakeSession({'batchcomplete': True})).summary("qwertyuiop") is None
+
+def test_session_pool_size():
+    session = create_http_session(pool_size=3, retries=0)
+    adapter = session.get_adapter('https://en.wikipedia.org/w/api.php')
+    assert adapter._pool_maxsize == 3
+
+if __name__ == "__main__":
+    test_summary_in_one_request()
+    test_summary_without_results()
+    test_session_pool_size()
+    print("All HTTP client tests passed")
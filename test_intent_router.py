@@ -0,0 +1,39 @@
+from intent_router import IntentRouter
+
+def make_router():
+    router = IntentRouter()
+    router.register('marks', ['marks', 'grades', 'result'], lambda match: 'marks')
+    router.register('courses', ['courses', 'subjects'], lambda match: 'courses')
+    router.register('search', ['what is', 'what'], lambda match: match.text_after(match.keyword_for('search')))
+    return router
+
+def test_priority_and_case():
+    router = make_router()
+    match = router.classify("Show my COURSES and Marks")
+    # Registration order decides, not position in the message
+    assert match.intents == ['marks', 'courses']
+    assert router.dispatch("Show my COURSES and Marks") == 'marks'
+    assert router.dispatch("hello there") is None
+
+def test_overlapping_keywords():
+    router = make_router()
+    match = router.classify("What is Machine Learning")
+    # 'what' is a prefix of the longer 'what is' and must still be reported
+    assert match.keywords == {'what is', 'what'}
+    assert match.keyword_for('search') == 'what is'
+    assert router.dispatch(match) == 'Machine Learning'
+    # Substring semantics: 'results' contains 'result'
+    assert router.classify("exam results").has('marks')
+
+def test_fallthrough():
+    router = IntentRouter()
+    router.register('first', ['hi'], lambda match: None)
+    router.register('second', ['hi'], lambda match: 'second')
+    assert router.dispatch("hi") == 'second'
+    assert router.dispatch("hi", fallthrough=False) is None
+
+if __name__ == "__main__":
+    test_priority_and_case()
+    test_overlapping_keywords()
+    test_fallthrough()
+    print("All intent router tests passed")
@@ -0,0 +1,141 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from knowledge_base import KnowledgeBase, main, split_passages
+
+def make_knowledge_base(directory):
+    knowledge_base = KnowledgeBase(os.path.join(directory, 'kb.sqlite'))
+    knowledge_base.add('python', "Python is a high-level, general-purpose programming language.", source='wikipedia')
+    knowledge_base.add('Library hours', ["The central library opens at 8 am on weekdays.",
+                                         "During exams the library stays open until midnight."])
+    return knowledge_base
+
+def test_search_requires_every_content_word():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = make_knowledge_base(directory)
+        assert knowledge_base.answer("what is python") == \
+            "According to Wikipedia, Python is a high-level, general-purpose programming language."
+        assert knowledge_base.answer("when is the library open during exams") == \
+            "During exams the library stays open until midnight."
+        assert knowledge_base.answer("python library") is None
+        assert knowledge_base.answer("what is it") is None
+        # Porter stemming matches other word forms
+        assert knowledge_base.search("programming languages")
+        knowledge_base.close()
+
+def test_title_only_and_replace_and_remove():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = make_knowledge_base(directory)
+        assert knowledge_base.answer("midnight", title_only=True) is None
+        assert knowledge_base.answer("python", title_only=True) is not None
+        knowledge_base.add('python', "Python is a genus of constricting snakes.", source='wikipedia')
+        assert knowledge_base.counts() == (2, 3)
+        assert "snakes" in knowledge_base.answer("python")
+        assert knowledge_base.remove('Library hours')
+        assert not knowledge_base.remove('Library hours')
+        assert knowledge_base.answer("library") is None
+        stats = knowledge_base.stats()
+        assert stats['documents'] == 1 and stats['lookups'] == 4 and stats['hits'] == 2
+        knowledge_base.close()
+
+def test_learned_summaries_only_answer_their_topic():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = KnowledgeBase(os.path.join(directory, 'kb.sqlite'))
+        topic = knowledge_base.topic("what is the president of france")
+        assert topic == 'president france'
+        knowledge_base.add(topic, "The president of France is the head of state of France.", source='wikipedia')
+        assert knowledge_base.answer("what is france") is None
+        assert knowledge_base.answer("France president") is None
+        assert knowledge_base.answer("who is the president of France?") == \
+            "According to Wikipedia, The president of France is the head of state of France."
+        # Admin documents still match on every content word
+        knowledge_base.add('Exchange programmes', "Students can spend a semester in France through the exchange programme.")
+        assert knowledge_base.answer("semester in france") == \
+            "Students can spend a semester in France through the exchange programme."
+        knowledge_base.close()
+
+def test_learned_summaries_expire():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = KnowledgeBase(os.path.join(directory, 'kb.sqlite'))
+        knowledge_base.add('python', "Python is a programming language.", source='wikipedia', ttl=0.05)
+        knowledge_base.add('Lab rules', "Python notebooks must be saved on the lab server.")
+        assert knowledge_base.answer("what is python") == "According to Wikipedia, Python is a programming language."
+        time.sleep(0.06)
+        # The admin passage only mentions python: the question falls through to the internet search
+        assert knowledge_base.answer("what is python") is None
+        assert knowledge_base.search("python") == [('Lab rules', "Python notebooks must be saved on the lab server.", 'admin')]
+        assert knowledge_base.purge_expired() == 1
+        assert knowledge_base.counts() == (1, 1)
+        knowledge_base.close()
+
+def test_one_word_topics_need_a_title_match():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = KnowledgeBase(os.path.join(directory, 'kb.sqlite'))
+        knowledge_base.add('Lab rules', "Python notebooks must be saved on the lab server.")
+        assert knowledge_base.answer("what is python") is None
+        knowledge_base.add('Python workshop', "The Python workshop runs every Friday in room 4.")
+        assert knowledge_base.answer("what is python") == "The Python workshop runs every Friday in room 4."
+        # Two content words in one passage are specific enough without the title
+        assert knowledge_base.answer("where are python notebooks saved") == "Python notebooks must be saved on the lab server."
+        knowledge_base.close()
+
+def test_topic_fallback_uses_admin_documents_only():
+    with tempfile.TemporaryDirectory() as directory:
+        knowledge_base = make_knowledge_base(directory)
+        assert knowledge_base.answer("python", title_only=True, learned=False) is None
+        assert "library" in knowledge_base.answer("library hours", title_only=True, learned=False)
+        knowledge_base.close()
+
+def test_older_database_gains_expiry_column():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'kb.sqlite')
+        db = sqlite3.connect(path)
+        db.execute('CREATE TABLE documents (id INTEGER PRIMARY KEY, title TEXT NOT NULL, source TEXT NOT NULL, '
+                   'path TEXT, added_at REAL NOT NULL, UNIQUE (source, title))')
+        db.commit()
+        db.close()
+        knowledge_base = KnowledgeBase(path)
+        knowledge_base.add('python', "Python is a language.", source='wikipedia', ttl=60)
+        assert knowledge_base.answer("python") is not None
+        knowledge_base.close()
+
+def test_split_passages():
+    assert split_passages(["one two", "", "three"], max_chars=100) == ["one two three"]
+    assert split_passages(["a" * 60, "b" * 60], max_chars=100) == ["a" * 60, "b" * 60]
+
+def test_cli_import_reindex_and_search():
+    with tempfile.TemporaryDirectory() as directory:
+        docs = os.path.join(directory, 'docs')
+        os.makedirs(docs)
+        with open(os.path.join(docs, 'hostel.md'), 'w') as f:
+            f.write("# Hostel rules\n\nVisitors must leave the hostel by nine in the evening.\n\nNo cooking in rooms.\n")
+        with open(os.path.join(docs, 'labs.html'), 'w') as f:
+            f.write("<html><body><nav>Home Labs Contact page links here</nav>"
+                    "<p>The computer lab on the second floor is open to every student.</p></body></html>")
+        with open(os.path.join(docs, 'faq.jsonl'), 'w') as f:
+            f.write(json.dumps({'title': 'Fees', 'body': "Tuition fees are due before the semester starts."}) + "\n")
+        db = os.path.join(directory, 'kb.sqlite')
+        assert main(['--db', db, 'import', docs]) == 0
+        assert main(['--db', db, 'reindex']) == 0
+        assert main(['--db', db, 'remove', 'Fees']) == 0
+        assert main(['--db', db, 'remove', 'Fees']) == 1
+        knowledge_base = KnowledgeBase(db)
+        assert knowledge_base.counts() == (2, 2)
+        assert knowledge_base.search("when must visitors leave") == [
+            ('Hostel rules', "Visitors must leave the hostel by nine in the evening. No cooking in rooms.", 'admin')]
+        assert knowledge_base.answer("computer lab") == "The computer lab on the second floor is open to every student."
+        knowledge_base.close()
+
+if __name__ == "__main__":
+    test_search_requires_every_content_word()
+    test_title_only_and_replace_and_remove()
+    test_learned_summaries_only_answer_their_topic()
+    test_learned_summaries_expire()
+    test_one_word_topics_need_a_title_match()
+    test_topic_fallback_uses_admin_documents_only()
+    test_older_database_gains_expiry_column()
+    test_split_passages()
+    test_cli_import_reindex_and_search()
+    print("All knowledge base tests passed")
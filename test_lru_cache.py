@@ -0,0 +1,33 @@
+import time
+from lru_cache import LRUCache
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    # 'b' was least recently used, so it is the one evicted
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+    print(f"Cache stats: {cache.stats()}")
+
+def test_ttl_expiry():
+    cache = LRUCache(maxsize=10, ttl=0.05)
+    cache.set('a', 1)
+    assert cache.get('a') == 1
+    time.sleep(0.06)
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+    # A value that already lived elsewhere only gets the rest of its ttl
+    cache.set('b', 2, age=0.04)
+    assert cache.get('b') == 2
+    time.sleep(0.02)
+    assert cache.get('b') is None
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_ttl_expiry()
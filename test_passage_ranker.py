@@ -0,0 +1,36 @@
+from passage_ranker import ENGLISH_STOP_WORDS, PassageIndex, tokenize
+
+SENTENCES = [
+    "Python is a programming language that lets you work quickly.",
+    "The python is a large snake found in Africa and Asia.",
+    "Python language features include dynamic typing and garbage collection.",
+    "Many universities teach introductory programming courses.",
+]
+
+def test_tokenize_drops_stop_words():
+    assert tokenize("What is the Python language?", ENGLISH_STOP_WORDS) == ['python', 'language']
+
+def test_top_k_ranks_by_bm25():
+    index = PassageIndex(SENTENCES, ENGLISH_STOP_WORDS)
+    results = index.top_k("python programming language", k=2)
+    assert [passage for _, passage in results] == [SENTENCES[0], SENTENCES[2]]
+    assert results[0][0] >= results[1][0] > 0
+
+def test_rare_terms_weigh_more():
+    index = PassageIndex(SENTENCES, ENGLISH_STOP_WORDS)
+    # "snake" appears once, "python" in three passages
+    score, passage = index.top_k("python snake", k=1)[0]
+    assert passage == SENTENCES[1]
+
+def test_no_match_and_empty_index():
+    index = PassageIndex(SENTENCES, ENGLISH_STOP_WORDS)
+    assert index.top_k("quantum chromodynamics") == []
+    assert index.top_k("the and of") == []
+    assert PassageIndex([]).top_k("python") == []
+
+if __name__ == "__main__":
+    test_tokenize_drops_stop_words()
+    test_top_k_ranks_by_bm25()
+    test_rare_terms_weigh_more()
+    test_no_match_and_empty_index()
+    print("All passage ranker tests passed")
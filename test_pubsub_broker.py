@@ -0,0 +1,89 @@
+import json
+import socket
+import threading
+import time
+from pubsub_broker import PubSubBroker, LocalPubSubManager, SUBSCRIBE
+
+def test_broker_fans_out_to_other_workers():
+    broker = PubSubBroker().start()
+    publisher = LocalPubSubManager(broker.url, json=json)
+    subscriber = LocalPubSubManager(broker.url, json=json)
+    received = []
+    ready = threading.Event()
+
+    def listen():
+        for message in subscriber._listen():
+            received.append(json.loads(message))
+            ready.set()
+            return
+
+    threading.Thread(target=listen, daemon=True).start()
+    # Publish until the subscriber's connection is registered with the broker
+    for _ in range(50):
+        publisher._publish({'method': 'emit', 'event': 'response', 'room': 'sid-1'})
+        if ready.wait(0.1):
+            break
+
+    assert received[0] == {'method': 'emit', 'event': 'response', 'room': 'sid-1'}
+    assert broker.messages >= 1
+    broker.stop()
+
+def test_other_channels_are_ignored():
+    broker = PubSubBroker().start()
+    publisher = LocalPubSubManager(broker.url, channel='other', json=json)
+    subscriber = LocalPubSubManager(broker.url, json=json)
+    received = []
+
+    def listen():
+        for message in subscriber._listen():
+            received.append(message)
+
+    threading.Thread(target=listen, daemon=True).start()
+    for _ in range(5):
+        publisher._publish({'method': 'emit'})
+    threading.Event().wait(0.3)
+    assert received == []
+    broker.stop()
+
+def test_sustained_traffic_with_a_stalled_subscriber():
+    broker = PubSubBroker(max_pending=200).start()
+    publisher = LocalPubSubManager(broker.url, json=json)
+    subscriber = LocalPubSubManager(broker.url, json=json)
+    # A subscriber that never reads its socket
+    stalled = socket.create_connection((broker.host, broker.port))
+    stalled.sendall(SUBSCRIBE)
+    received = []
+
+    def listen():
+        for message in subscriber._listen():
+            received.append(json.loads(message)['n'])
+
+    threading.Thread(target=listen, daemon=True).start()
+    deadline = time.monotonic() + 5
+    while broker.stats()['subscribers'] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # ~20 MB, far beyond the socket buffers, as voice replies with audio would send
+    payload = 'x' * 10000
+    done = threading.Event()
+
+    def publish():
+        for n in range(2000):
+            publisher._publish({'n': n, 'audio': payload})
+        done.set()
+
+    threading.Thread(target=publish, daemon=True).start()
+    assert done.wait(30), "publisher blocked"
+    deadline = time.monotonic() + 10
+    while len(received) < 2000 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert received == list(range(2000))
+    assert broker.stats()['dropped_subscribers'] == 1
+    stalled.close()
+    broker.stop()
+
+if __name__ == "__main__":
+    test_broker_fans_out_to_other_workers()
+    test_other_channels_are_ignored()
+    test_sustained_traffic_with_a_stalled_subscriber()
+    print("All pub/sub broker tests passed")
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+from search_cache import SearchCache, normalize_query
+
+def test_normalize_query():
+    assert normalize_query("What is  Python?") == normalize_query("what is python")
+    assert normalize_query("Who is Alan-Turing!") == "who is alan turing"
+
+def test_answers_and_misses_are_cached():
+    cache = SearchCache(maxsize=8, ttl=60, negative_ttl=60)
+    assert cache.get("what is python") == (False, None)
+    cache.set("what is python", "According to Wikipedia, Python is a language.", 'wikipedia')
+    cache.set("what is qwertyuiop", None)
+    assert cache.get("what is python") == (True, "According to Wikipedia, Python is a language.")
+    # A cached miss is found, with no answer
+    assert cache.get("what is qwertyuiop") == (True, None)
+    stats = cache.stats()
+    assert stats['lookups'] == 3 and stats['hits'] == 2
+
+def test_negative_entries_expire_sooner():
+    cache = SearchCache(maxsize=8, ttl=60, negative_ttl=0.05)
+    cache.set("unknown thing", None)
+    cache.set("known thing", "answer")
+    time.sleep(0.1)
+    assert cache.get("unknown thing") == (False, None)
+    assert cache.get("known thing") == (True, "answer")
+
+def test_disk_tier_survives_restart():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'search.sqlite')
+        cache = SearchCache(db_path=path)
+        cache.set("what is python", "Python is a language.", 'wikipedia')
+        cache.set("what is qwertyuiop", None)
+
+        restarted = SearchCache(db_path=path)
+        assert restarted.get("what is python") == (True, "Python is a language.")
+        assert restarted.get("what is qwertyuiop") == (True, None)
+        assert restarted.get("what is java") == (False, None)
+        assert restarted.stats()['disk'] == {'hits': 2, 'misses': 1, 'writes': 0}
+        # The second lookup is served from memory
+        restarted.get("what is python")
+        assert restarted.stats()['disk']['hits'] == 2
+
+def test_promoted_disk_hit_keeps_its_age():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'search.sqlite')
+        SearchCache(db_path=path, ttl=0.2).set("what is python", "Python is a language.", 'wikipedia')
+        time.sleep(0.15)
+        restarted = SearchCache(db_path=path, ttl=0.2)
+        assert restarted.get("what is python") == (True, "Python is a language.")
+        time.sleep(0.1)
+        # Expired in memory along with the row, not a full ttl after the promotion
+        assert restarted.get("what is python") == (False, None)
+        assert restarted.stats()['answers']['expirations'] == 1
+
+def test_source_stats():
+    cache = SearchCache()
+    cache.record_source('wikipedia', 0.2, True)
+    cache.record_source('wikipedia', 0.4, False)
+    cache.record_source('google', 0.1, False, error=True)
+    sources = cache.stats()['sources']
+    assert sources['wikipedia']['answers'] == 1 and sources['wikipedia']['misses'] == 1
+    assert abs(sources['wikipedia']['avg_ms'] - 300) < 1e-6
+    assert sources['google']['errors'] == 1
+
+if __name__ == "__main__":
+    test_normalize_query()
+    test_answers_and_misses_are_cached()
+    test_negative_entries_expire_sooner()
+    test_disk_tier_survives_restart()
+    test_promoted_disk_hit_keeps_its_age()
+    test_source_stats()
+    print("All search cache tests passed")
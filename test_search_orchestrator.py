@@ -0,0 +1,93 @@
+import threading
+import time
+from search_orchestrator import SearchOrchestrator, StubProvider
+
+def test_priority_answer_wins():
+    wikipedia = StubProvider('wikipedia', "Python is a language.", delay=0.1)
+    google = StubProvider('google', "Python is a snake.", delay=0.01)
+    orchestrator = SearchOrchestrator([wikipedia, google])
+    answer, provider, complete = orchestrator.search("what is python")
+    # Google answers first, but Wikipedia is preferred and still answers in time
+    assert answer == "Python is a language." and provider is wikipedia
+    assert complete
+    assert orchestrator.stats()['wins'] == {'wikipedia': 1, 'google': 0}
+
+def test_miss_falls_through_concurrently():
+    wikipedia = StubProvider('wikipedia', None, delay=0.2)
+    google = StubProvider('google', "From Google.", delay=0.2)
+    orchestrator = SearchOrchestrator([wikipedia, google])
+    start = time.perf_counter()
+    answer, provider, complete = orchestrator.search("what is raizel")
+    elapsed = time.perf_counter() - start
+    # Both ran at once: the fallback costs max(0.2, 0.2), not the sum
+    assert answer == "From Google." and provider is google
+    assert elapsed < 0.35
+
+def test_timeout_and_error_skip_to_next_source():
+    slow = StubProvider('wikipedia', "Too late.", delay=0.5, timeout=0.1)
+    google = StubProvider('google', "From Google.")
+    answer, provider, complete = SearchOrchestrator([slow, google]).search("query")
+    assert provider is google and not complete
+
+    broken = StubProvider('wikipedia', error=ConnectionError("offline"))
+    recorded = []
+    orchestrator = SearchOrchestrator([broken, StubProvider('google')],
+                                      record=lambda *args: recorded.append(args))
+    answer, provider, complete = orchestrator.search("query")
+    # Nobody answered and one source failed: the miss must not be cached
+    assert answer is None and provider is None and not complete
+    assert recorded[0][0] == 'wikipedia' and recorded[0][3] is True
+    assert orchestrator.stats()['timeouts'] == {'wikipedia': 0, 'google': 0}
+
+def test_lower_priority_sources_are_cancelled():
+    wikipedia = StubProvider('wikipedia', "Answer.")
+    google = StubProvider('google', "Unused.", delay=0.2)
+    orchestrator = SearchOrchestrator([wikipedia, google], max_workers=1)
+    orchestrator.search("first query")
+    orchestrator.search("second query")
+    time.sleep(0.5)
+    # Google's only thread was busy with the first call, so the second was still queued when Wikipedia answered
+    assert google.calls == 1
+
+def test_timeout_starts_when_the_call_runs():
+    google = StubProvider('google', "From Google.", delay=0.15, timeout=0.25)
+    orchestrator = SearchOrchestrator([google], max_workers=1)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(orchestrator.search("query")[0])) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The second call waited 0.15 s for the thread, then ran within its own timeout
+    assert results == ["From Google.", "From Google."]
+    assert orchestrator.stats()['timeouts'] == {'google': 0}
+
+def test_errors_are_timed_from_the_call_start():
+    broken = StubProvider('google', delay=0.1, error=ConnectionError("offline"))
+    recorded = []
+    orchestrator = SearchOrchestrator([broken], max_workers=1, record=lambda *args: recorded.append(args))
+    threads = [threading.Thread(target=orchestrator.search, args=("query",)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The second call waited 0.1 s for the thread, which is not part of its time
+    assert len(recorded) == 2 and all(args[3] and args[1] < 0.18 for args in recorded)
+
+def test_providers_do_not_share_threads():
+    orchestrator = SearchOrchestrator([StubProvider('wikipedia', "Fast."), StubProvider('google', "Slow.")], max_workers=1)
+    # Google's only thread is busy, but Wikipedia still starts at once
+    orchestrator._executors['google'].submit(time.sleep, 0.3)
+    start = time.perf_counter()
+    assert orchestrator.search("query")[0] == "Fast."
+    assert time.perf_counter() - start < 0.1
+
+if __name__ == "__main__":
+    test_priority_answer_wins()
+    test_miss_falls_through_concurrently()
+    test_timeout_and_error_skip_to_next_source()
+    test_lower_priority_sources_are_cancelled()
+    test_timeout_starts_when_the_call_runs()
+    test_errors_are_timed_from_the_call_start()
+    test_providers_do_not_share_threads()
+    print("All search orchestrator tests passed")
@@ -0,0 +1,122 @@
+import time
+import numpy as np
+from semantic_cache import SemanticCache, SemanticIndex, embed, normalize_words
+
+def test_normalize_words_maps_synonyms():
+    assert normalize_words("What are my grades?") == ['grade']
+    assert normalize_words("Show my marks") == ['grade']
+    assert normalize_words("Which classes am I taking") == normalize_words("list my courses") == ['course']
+    assert normalize_words("what is it") == []
+
+def test_paraphrases_hit_within_scope_only():
+    cache = SemanticCache(threshold=0.9)
+    cache.set("what are my grades", "A in Algorithms", scope=('search', 'REG1'))
+    assert cache.get("show my marks", scope=('search', 'REG1')) == "A in Algorithms"
+    assert cache.get("Show me my scores!", scope=('search', 'REG1')) == "A in Algorithms"
+    # Another student, another kind of request, another topic
+    assert cache.get("show my marks", scope=('search', 'REG2')) is None
+    assert cache.get("show my marks", scope=('answer', 'REG1')) is None
+    assert cache.get("what are my grades in algorithms", scope=('search', 'REG1')) is None
+    stats = cache.stats()
+    assert stats['lookups'] == 5 and stats['hits'] == 2 and stats['llm_calls_saved'] == 2
+
+def test_related_but_different_words_do_not_hit():
+    cache = SemanticCache(threshold=0.9)
+    cache.set("what is my cgpa", "Your CGPA is 8.4")
+    cache.set("when is the midterm", "The midterm is on 12 March")
+    cache.set("show my exam schedule", "Exams start on 2 May")
+    assert cache.get("what are my marks") is None
+    assert cache.get("what is my gpa") is None
+    assert cache.get("what is my performance") is None
+    assert cache.get("when is the test") is None
+    assert cache.get("when is the exam") is None
+    assert cache.get("show my exam dates") is None
+    assert cache.get("show my exam calendar") is None
+    # True paraphrases still hit
+    assert cache.get("show my examination timetable") == "Exams start on 2 May"
+
+def test_numbers_must_match():
+    cache = SemanticCache()
+    cache.set("marks for semester 2", "Semester 2 marks")
+    assert cache.get("grades for semester 2") == "Semester 2 marks"
+    assert cache.get("grades for semester 3") is None
+
+def test_negations_and_comparisons_must_match():
+    assert normalize_words("which courses did I not pass") == ['course', 'not', 'pass']
+    assert normalize_words("which courses didn't I pass") == ['course', 'not', 'pass']
+    cache = SemanticCache()
+    cache.set("which courses did I not pass", "You did not pass Physics")
+    cache.set("courses with grades above 80", "Algorithms and Databases")
+    cache.set("grades before the midterm", "Quiz 1: 9/10")
+    assert cache.get("which courses did I pass") is None
+    assert cache.get("which courses didn't I pass") == "You did not pass Physics"
+    assert cache.get("courses with grades below 80") is None
+    assert cache.get("courses with marks over 80") == "Algorithms and Databases"
+    assert cache.get("grades after the midterm") is None
+    assert cache.get("marks before the midterm") == "Quiz 1: 9/10"
+
+def test_ttl_and_clear():
+    cache = SemanticCache(ttl=0.05)
+    cache.set("exam schedule", "Exams start in May")
+    assert cache.get("exam timetable") == "Exams start in May"
+    time.sleep(0.06)
+    assert cache.get("exam timetable") is None
+    cache = SemanticCache()
+    cache.set("exam schedule", "Exams start in May")
+    cache.clear()
+    assert cache.get("exam timetable") is None
+
+def test_lsh_index_finds_near_duplicates_and_evicts():
+    rng = np.random.default_rng(1)
+    index = SemanticIndex(maxsize=400, brute_force_limit=50)
+    words = [f"topic{i}" for i in range(500)]
+    for i, word in enumerate(words):
+        index.add(embed([word, 'lecture']), i)
+    # The oldest entries were evicted, the newest are found through the LSH tables
+    assert len(index) <= 400
+    found = sum(index.nearest(embed([word, 'lecture']), minimum=0.99)[1] == i for i, word in enumerate(words[-100:], 400))
+    assert found >= 95
+    assert index.nearest(embed(['topic0', 'lecture']), minimum=0.99) == (0.0, None)
+    noise = rng.standard_normal(512).astype(np.float32)
+    assert index.nearest(noise / np.linalg.norm(noise), minimum=0.9) == (0.0, None)
+
+def test_google_ai_helper_saves_model_calls():
+    from google_ai_integration import GoogleAIHelper
+
+    class FakeResponse:
+        def __init__(self, text):
+            self.text = text
+
+    class FakeModel:
+        def __init__(self):
+            self.prompts = []
+
+        def generate_content(self, prompt):
+            self.prompts.append(prompt)
+            return FakeResponse(f"answer {len(self.prompts)}")
+
+    helper = GoogleAIHelper.__new__(GoogleAIHelper)
+    helper.semantic_cache = SemanticCache()
+    helper.model = FakeModel()
+    helper.csv_data = {}
+    assert helper.search("what are my grades") == "answer 1"
+    assert helper.search("show my marks") == "answer 1"
+    assert helper.answer_question("show my marks") == "answer 2"
+    assert helper.answer_question("What are my grades?") == "answer 2"
+    assert len(helper.model.prompts) == 2
+    stats = helper.stats()
+    assert stats['llm_calls'] == 2 and stats['llm_calls_saved'] == 2 and stats['hit_rate'] == 0.5
+    # Summaries never go through the cache, so they are not counted as model calls
+    assert helper.generate_summary("a long text") == "answer 3"
+    assert helper.stats()['llm_calls'] == 2
+
+if __name__ == "__main__":
+    test_normalize_words_maps_synonyms()
+    test_paraphrases_hit_within_scope_only()
+    test_related_but_different_words_do_not_hit()
+    test_numbers_must_match()
+    test_negations_and_comparisons_must_match()
+    test_ttl_and_clear()
+    test_lsh_index_finds_near_duplicates_and_evicts()
+    test_google_ai_helper_saves_model_calls()
+    print("All semantic cache tests passed")
@@ -0,0 +1,57 @@
+import threading
+import speech_recognition as sr
+from speech_backends import SpeechBackend, SpeechService, StubBackend
+
+def make_audio(raw):
+    return sr.AudioData(raw, 16000, 2)
+
+class FailingBackend(SpeechBackend):
+    name = 'failing'
+
+    def transcribe(self, model, audio):
+        raise sr.RequestError("offline")
+
+def test_stub_is_deterministic():
+    speech = make_audio(b'\x01\x02' * 1600)
+    backend = StubBackend(transcripts={StubBackend.key(speech): 'show my courses'})
+    service = SpeechService([backend], pool_size=1)
+    assert service.recognize(speech) == 'show my courses'
+    assert service.recognize(make_audio(b'\x03\x04' * 1600)) == 'what are my marks'
+    try:
+        service.recognize(make_audio(b'\x00' * 3200))
+        assert False, "silence should not be recognized"
+    except sr.UnknownValueError:
+        pass
+    stats = service.stats()['stub']
+    assert stats['calls'] == 3
+    assert stats['recognized'] == 2
+    assert stats['no_speech'] == 1
+
+def test_models_are_loaded_once():
+    loads = []
+
+    class CountingBackend(StubBackend):
+        def load_model(self):
+            loads.append(1)
+            return object()
+
+    service = SpeechService([CountingBackend(delay=0.01)], pool_size=2)
+    threads = [threading.Thread(target=service.recognize, args=(make_audio(b'\x01' * 3200),)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Eight concurrent recognitions share the two warm models
+    assert len(loads) == 2
+    assert service.stats()['stub']['pool']['available'] == 2
+
+def test_falls_back_to_next_backend():
+    service = SpeechService([FailingBackend(), StubBackend()])
+    assert service.recognize(make_audio(b'\x01' * 3200)) == 'what are my marks'
+    assert service.stats()['failing']['errors'] == 1
+
+if __name__ == "__main__":
+    test_stub_is_deterministic()
+    test_models_are_loaded_once()
+    test_falls_back_to_next_backend()
+    print("All speech backend tests passed")
@@ -0,0 +1,98 @@
+import tempfile
+import time
+from speech_synthesis import AudioCache, SpeechSynthesis, StubSynthesizer
+
+class CountingSynthesizer(StubSynthesizer):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def synthesize_wav(self, text):
+        self.calls += 1
+        return super().synthesize_wav(text)
+
+def test_fixed_phrases_are_cached():
+    synthesizer = CountingSynthesizer()
+    synthesis = SpeechSynthesis(synthesizer, AudioCache(maxsize=8), audio_format='wav')
+    synthesis.register_phrases(["Hi there! How can I assist you?"])
+    first = synthesis.synthesize("Hi there! How can I assist you?")
+    # Whitespace differences map to the same cached audio
+    second = synthesis.synthesize("Hi there!  How can I assist you?")
+    assert first[:4] == b'RIFF' and first == second
+    assert synthesizer.calls == 1
+    # Dynamic replies are rendered every time and never cached
+    synthesis.synthesize("Your CGPA is 8.4")
+    synthesis.synthesize("Your CGPA is 8.4")
+    assert synthesizer.calls == 3
+    stats = synthesis.stats()
+    assert stats['uncached'] == 2
+    assert stats['cache']['hit_rate'] == 0.5
+    assert stats['ms_per_char'] is not None
+
+def test_disk_tier_survives_restart():
+    with tempfile.TemporaryDirectory() as directory:
+        phrase = "Goodbye! Have a great day!"
+        synthesis = SpeechSynthesis(CountingSynthesizer(), AudioCache(directory=directory), audio_format='wav')
+        synthesis.register_phrases([phrase])
+        audio = synthesis.synthesize(phrase)
+
+        # A new process starts with an empty memory tier but reads the file
+        synthesizer = CountingSynthesizer()
+        restarted = SpeechSynthesis(synthesizer, AudioCache(directory=directory), audio_format='wav')
+        restarted.register_phrases([phrase])
+        assert restarted.synthesize(phrase) == audio
+        assert synthesizer.calls == 0
+        assert restarted.stats()['cache']['disk_hits'] == 1
+
+def test_disk_tier_is_bounded():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AudioCache(maxsize=1, directory=directory, max_files=2)
+        for i in range(4):
+            cache.set(f"key{i}.wav", b'audio')
+        assert cache.stats()['disk_evictions'] == 2
+
+def test_failing_engine_backs_off_and_retries():
+    class FlakySynthesizer(StubSynthesizer):
+        def __init__(self):
+            super().__init__()
+            self.failures = 2
+
+        def synthesize_wav(self, text):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("no audio driver")
+            return super().synthesize_wav(text)
+
+    synthesis = SpeechSynthesis(FlakySynthesizer(), audio_format='wav', retry_seconds=0.05)
+    assert synthesis.synthesize("Hello") is None
+    assert not synthesis.available
+    # Not retried during the backoff
+    assert synthesis.synthesize("Hello") is None
+    assert synthesis.stats()['errors'] == 1
+    time.sleep(0.06)
+    assert synthesis.available
+    # Failed again: the backoff doubles
+    assert synthesis.synthesize("Hello") is None
+    time.sleep(0.06)
+    assert not synthesis.available
+    time.sleep(0.05)
+    assert synthesis.synthesize("Hello")[:4] == b'RIFF'
+    assert synthesis.stats()['errors'] == 2
+
+def test_cached_never_synthesizes():
+    synthesizer = CountingSynthesizer()
+    synthesis = SpeechSynthesis(synthesizer, AudioCache(maxsize=8), audio_format='wav')
+    synthesis.register_phrases(["Goodbye!"])
+    assert synthesis.cached("Goodbye!") is None
+    audio = synthesis.synthesize("Goodbye!")
+    assert synthesis.cached("Goodbye!") == audio
+    assert synthesis.cached("Your CGPA is 8.4") is None
+    assert synthesizer.calls == 1
+
+if __name__ == "__main__":
+    test_fixed_phrases_are_cached()
+    test_disk_tier_survives_restart()
+    test_disk_tier_is_bounded()
+    test_failing_engine_backs_off_and_retries()
+    test_cached_never_synthesizes()
+    print("All speech synthesis tests passed")
@@ -0,0 +1,105 @@
+import threading
+import time
+from tts_queue import SpeechQueue, split_sentences
+
+class FakeEngine:
+    """pyttsx3 stand-in that speaks a sentence as ten words over 20 ms and can be stopped from a callback."""
+
+    def __init__(self, seconds_per_sentence=0.02):
+        self.seconds_per_sentence = seconds_per_sentence
+        self.spoken = []
+        self.interrupted = []
+        self.thread = None
+        self.stop_threads = []
+        self._callbacks = {}
+        self._text = None
+        self._stopping = False
+
+    def connect(self, topic, callback):
+        self._callbacks.setdefault(topic, []).append(callback)
+
+    def say(self, text):
+        self._text = text
+
+    def runAndWait(self):
+        self.thread = threading.current_thread()
+        self._stopping = False
+        for callback in self._callbacks.get('started-utterance', []):
+            callback(self._text)
+        for word in range(10):
+            for callback in self._callbacks.get('started-word', []):
+                callback(self._text, word, 1)
+            if self._stopping:
+                self.interrupted.append(self._text)
+                return
+            time.sleep(self.seconds_per_sentence / 10)
+        self.spoken.append(self._text)
+
+    def stop(self):
+        self.stop_threads.append(threading.current_thread())
+        self._stopping = True
+
+def test_split_sentences():
+    assert split_sentences("Hello! How are you? I am fine.") == ["Hello!", "How are you?", "I am fine."]
+    assert split_sentences("Version 2.5 is out") == ["Version 2.5 is out"]
+    assert split_sentences("   ") == []
+
+def test_say_does_not_block():
+    engine = FakeEngine()
+    speech = SpeechQueue(lambda: engine)
+    start = time.perf_counter()
+    speech.say("One. Two. Three. Four. Five.")
+    assert time.perf_counter() - start < 0.02
+    assert speech.wait(2)
+    # Sentences are spoken in order on the worker thread that created the engine
+    assert engine.spoken == ["One.", "Two.", "Three.", "Four.", "Five."]
+    assert engine.thread is speech._thread
+    stats = speech.stats()
+    assert stats['chunks_spoken'] == 5
+    assert stats['avg_first_audio_ms'] < 20
+    speech.shutdown()
+
+def test_cancel_drops_queued_sentences():
+    engine = FakeEngine(seconds_per_sentence=0.2)
+    speech = SpeechQueue(lambda: engine)
+    speech.say("First sentence. Second sentence. Third sentence.")
+    time.sleep(0.05)
+    speech.cancel()
+    # New speech right after a barge-in is played in full
+    speech.say("After.")
+    assert speech.wait(1)
+    assert engine.interrupted == ["First sentence."]
+    assert engine.spoken == ["After."]
+    # The engine was stopped by the worker thread that drives it
+    assert engine.stop_threads == [speech._thread]
+    assert speech.stats()['chunks_dropped'] == 2
+    assert speech.stats()['barge_ins'] == 1
+    speech.shutdown()
+
+def test_wait_ready_waits_for_the_engine():
+    def slow_factory():
+        time.sleep(0.05)
+        return FakeEngine()
+
+    speech = SpeechQueue(slow_factory)
+    assert not speech.wait_ready(0.01)
+    start = time.perf_counter()
+    assert speech.start().wait_ready(1)
+    assert time.perf_counter() - start >= 0.04
+    assert speech.engine is not None
+    speech.shutdown()
+
+def test_without_engine_prints():
+    speech = SpeechQueue(lambda: None)
+    speech.say("Nothing to play. Still counted.")
+    assert speech.wait(1)
+    assert speech.stats()['chunks_spoken'] == 2
+    speech.shutdown()
+
+if __name__ == "__main__":
+    test_split_sentences()
+    test_say_does_not_block()
+    test_cancel_drops_queued_sentences()
+    test_wait_ready_waits_for_the_engine()
+    test_without_engine_prints()
+    print("All text-to-speech queue tests passed")
@@ -0,0 +1,48 @@
+import threading
+import time
+from voice_chatbot import locked_cached_property
+
+class Service:
+    def __init__(self):
+        self.builds = 0
+
+    @locked_cached_property
+    def client(self):
+        """A slow client"""
+        self.builds += 1
+        time.sleep(0.05)
+        return object()
+
+    @locked_cached_property
+    def wrapper(self):
+        # Reads another lazy property while it is being built
+        return (self.client,)
+
+def test_racing_threads_share_one_value():
+    service = Service()
+    barrier = threading.Barrier(8)
+    values = []
+
+    def read():
+        barrier.wait()
+        values.append(service.client)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert service.builds == 1
+    assert all(value is values[0] for value in values)
+    assert Service.client.__doc__ == "A slow client"
+
+def test_nested_properties_do_not_deadlock():
+    service = Service()
+    assert service.wrapper[0] is service.client
+    # Cached per instance
+    assert Service().client is not service.client
+
+if __name__ == "__main__":
+    test_racing_threads_share_one_value()
+    test_nested_properties_do_not_deadlock()
+    print("All voice chatbot tests passed")
@@ -0,0 +1,104 @@
+import base64
+import io
+import wave
+import numpy as np
+import speech_recognition as sr
+from voice_pipeline import decode_data_url, read_audio, NoiseProfiles, VoiceActivityDetector, transcribe_segments
+
+def make_wav(seconds=1, rate=16000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b'\x10\x00' * int(rate * seconds))
+    return buffer.getvalue()
+
+def test_decode_data_url():
+    wav_bytes = make_wav()
+    encoded = base64.b64encode(wav_bytes).decode('ascii')
+    assert decode_data_url("data:audio/wav;base64," + encoded) == wav_bytes
+    assert decode_data_url(encoded) == wav_bytes
+
+def test_read_audio_from_memory():
+    audio = read_audio(make_wav(seconds=2), sr.Recognizer())
+    assert isinstance(audio, sr.AudioData)
+    assert audio.sample_rate == 16000
+    # Nothing is consumed for calibration
+    assert len(audio.get_raw_data()) == 16000 * 2 * 2
+
+def make_noisy_wav(noise_level, seconds=1, rate=16000):
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, noise_level, int(rate * seconds))
+    # A louder "speech" burst in the middle must not raise the noise floor
+    samples[rate // 4:rate // 2] += 8000 * np.sin(np.arange(rate // 4) / 5)
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.clip(samples, -32768, 32767).astype(np.int16).tobytes())
+    return buffer.getvalue()
+
+def test_noise_profile_is_reused_per_session():
+    profiles = NoiseProfiles()
+    clip = make_noisy_wav(200)
+    audio = profiles.record('sid-1', clip)
+    # The whole clip is kept: nothing is swallowed by calibration
+    assert len(audio.get_raw_data()) == 16000 * 2
+    threshold = profiles.for_session('sid-1').recognizer.energy_threshold
+    assert 150 < threshold < 600
+
+    profiles.record('sid-1', clip)
+    assert profiles.for_session('sid-1').recognizer.energy_threshold == threshold
+    # A much noisier room triggers a recalibration
+    profiles.record('sid-1', make_noisy_wav(2000))
+    assert profiles.for_session('sid-1').recognizer.energy_threshold > threshold * 4
+    assert profiles.stats() == {
+        'sessions': 1, 'utterances': 3, 'calibrations': 1, 'drift_recalibrations': 1, 'reuses': 1
+    }
+
+def make_speech_audio(layout, rate=16000):
+    """Build a clip from (seconds, is_speech) parts: quiet noise or a loud tone."""
+    rng = np.random.default_rng(1)
+    parts = []
+    for seconds, is_speech in layout:
+        t = np.arange(int(rate * seconds)) / rate
+        part = rng.normal(0, 100, t.size)
+        if is_speech:
+            part += 6000 * np.sin(2 * np.pi * 200 * t)
+        parts.append(part)
+    return sr.AudioData(np.concatenate(parts).astype(np.int16).tobytes(), rate, 2)
+
+def test_vad_trims_rejects_and_splits():
+    vad = VoiceActivityDetector(max_segment_seconds=5)
+
+    segments = vad.split(make_speech_audio([(2, False), (1.5, True), (3, False)]), threshold=500)
+    # One segment: the speech plus 0.3s padding either side
+    assert len(segments) == 1
+    assert abs(len(segments[0].frame_data) / 32000 - 2.1) < 0.05
+
+    assert vad.split(make_speech_audio([(3, False)]), threshold=500) == []
+
+    long_clip = make_speech_audio([(4, True), (1.5, False), (4, True)])
+    assert len(vad.split(long_clip, threshold=500)) == 2
+
+    stats = vad.stats()
+    assert stats['rejected_clips'] == 1
+    assert stats['split_clips'] == 1
+    assert abs(stats['trimmed_seconds'] - (6.5 - 2.1 + 3 + 0.9)) < 0.1
+
+def test_transcribe_segments_skips_unintelligible():
+    def recognize(segment):
+        if segment == 'noise':
+            raise sr.UnknownValueError()
+        return segment
+    assert transcribe_segments(['what are', 'noise', 'my marks'], recognize) == 'what are my marks'
+
+if __name__ == "__main__":
+    test_decode_data_url()
+    test_read_audio_from_memory()
+    test_noise_profile_is_reused_per_session()
+    test_vad_trims_rejects_and_splits()
+    test_transcribe_segments_skips_unintelligible()
+    print("All voice pipeline tests passed")
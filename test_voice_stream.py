@@ -0,0 +1,138 @@
+import threading
+import speech_recognition as sr
+from voice_stream import RingBuffer, VoiceStream, VoiceStreams
+
+def test_ring_buffer_keeps_latest_bytes():
+    buffer = RingBuffer(8)
+    buffer.write(b'abcde')
+    assert buffer.getvalue() == b'abcde'
+    buffer.write(b'fghij')
+    # Wrapped around: the two oldest bytes were overwritten
+    assert buffer.getvalue() == b'cdefghij'
+    assert buffer.dropped == 2
+    buffer.write(b'0123456789')
+    assert buffer.getvalue() == b'23456789'
+    assert buffer.dropped == 12
+    assert buffer.tail(3) == b'789' and buffer.tail(20) == b'23456789'
+
+def fake_recognize(audio):
+    # One "word" per 0.5s of audio
+    words = len(audio.get_raw_data()) // (16000 * 2 // 2)
+    if not words:
+        raise sr.UnknownValueError()
+    return ' '.join(['word'] * words)
+
+def test_interim_then_final_reuse():
+    stream = VoiceStream(fake_recognize, interim_seconds=1.0)
+    half_second = b'\x00\x01' * 8000
+
+    assert not stream.append(half_second)
+    assert stream.append(half_second)
+    assert stream.interim_transcript() == 'word word'
+    # The next interim is due after another full second
+    assert not stream.append(half_second)
+    assert stream.append(half_second)
+    assert stream.interim_transcript() == 'word word word word'
+    # Nothing new since the interim: reuse it
+    assert stream.final_transcript() == ('word word word word', True)
+    # Closed: later chunks are ignored
+    assert not stream.append(half_second)
+
+def test_final_recognizes_only_the_audio_after_the_interim():
+    lengths = []
+
+    def recognize(audio):
+        lengths.append(len(audio.get_raw_data()))
+        return fake_recognize(audio)
+
+    stream = VoiceStream(recognize, interim_seconds=1.0)
+    second = b'\x00\x01' * 16000
+    for _ in range(4):
+        if stream.append(second):
+            stream.interim_transcript()
+    stream.append(second[:16000])
+    assert stream.final_transcript() == (' '.join(['word'] * 9), False)
+    # Every byte was recognized exactly once, so the work grows linearly
+    assert lengths == [32000] * 4 + [16000]
+
+def test_interim_cuts_at_a_pause():
+    stream = VoiceStream(lambda audio: str(len(audio.get_raw_data())), interim_seconds=1.0)
+    speech = b'\x00\x10' * 15040
+    pause = b'\x00\x00' * 640  # two 20 ms frames
+    stream.append(speech + pause + b'\x00\x10' * 360)
+    # Recognized up to the end of the pause; the last word waits for the next pass
+    assert stream.interim_transcript() == str(len(speech + pause))
+    assert stream.final_transcript() == (f'{len(speech + pause)} 720', False)
+
+def test_chunks_are_put_back_in_order():
+    stream = VoiceStream(lambda audio: audio.get_raw_data().decode('ascii'), interim_seconds=10)
+    assert not stream.append(b'cd', seq=1)
+    assert not stream.append(b'ef', seq=2)
+    assert stream.buffer.getvalue() == b''
+    stream.append(b'ab', seq=0)
+    # Duplicates and chunks that were already written are dropped
+    stream.append(b'cd', seq=1)
+    stream.append(b'zz', seq=0)
+    assert stream.buffer.getvalue() == b'abcdef'
+    assert (stream.reordered_chunks, stream.duplicate_chunks) == (2, 2)
+    assert stream.final_transcript() == ('abcdef', False)
+
+def test_rejects_text_and_partial_samples():
+    stream = VoiceStream(fake_recognize)
+    for chunk, error in (('\x00\x01', TypeError), (b'\x00\x01\x02', ValueError)):
+        try:
+            stream.append(chunk)
+        except error:
+            pass
+        else:
+            raise AssertionError(f"{chunk!r} was accepted")
+    assert stream.bytes_received == 0
+
+def test_final_waits_for_chunks_in_flight():
+    stream = VoiceStream(lambda audio: audio.get_raw_data().decode('ascii'), interim_seconds=10)
+    stream.append(b'ab', seq=0)
+    stream.append(b'ef', seq=2)
+    late = threading.Timer(0.05, stream.append, args=(b'cd', 1))
+    late.start()
+    assert stream.final_transcript(expected_chunks=3, timeout=2) == ('abcdef', False)
+    late.join()
+
+    # A chunk that never arrives is given up after the timeout
+    stream = VoiceStream(lambda audio: audio.get_raw_data().decode('ascii'), interim_seconds=10)
+    stream.append(b'ab', seq=0)
+    stream.append(b'ef', seq=2)
+    assert stream.final_transcript(expected_chunks=3, timeout=0.05) == ('abef', False)
+    assert stream.missing_chunks == 1
+
+def test_finished_stream_still_takes_late_chunks():
+    streams = VoiceStreams(lambda audio: audio.get_raw_data().decode('ascii'))
+    stream = streams.start('sid')
+    stream.append(b'ab', seq=0)
+    assert streams.finish('sid') is stream
+    assert streams.finish('sid') is None
+    streams.get('sid').append(b'cd', seq=1)
+    assert stream.final_transcript(expected_chunks=2) == ('abcd', False)
+    # A new stream started meanwhile is not discarded with the old one
+    newer = streams.start('sid')
+    streams.discard('sid', stream)
+    assert streams.get('sid') is newer
+
+def test_cancelled_interim_does_not_block_final():
+    stream = VoiceStream(fake_recognize, interim_seconds=0.5)
+    assert stream.append(b'\x00\x01' * 8000)
+    # Only one interim at a time
+    assert not stream.append(b'')
+    stream.cancel_interim()
+    assert stream.final_transcript() == ('word', False)
+
+if __name__ == "__main__":
+    test_ring_buffer_keeps_latest_bytes()
+    test_interim_then_final_reuse()
+    test_final_recognizes_only_the_audio_after_the_interim()
+    test_interim_cuts_at_a_pause()
+    test_chunks_are_put_back_in_order()
+    test_rejects_text_and_partial_samples()
+    test_final_waits_for_chunks_in_flight()
+    test_finished_stream_still_takes_late_chunks()
+    test_cancelled_interim_does_not_block_final()
+    print("All voice stream tests passed")
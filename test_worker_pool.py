@@ -0,0 +1,53 @@
+import threading
+import time
+from worker_pool import WorkerPool
+
+def test_jobs_run_concurrently():
+    pool = WorkerPool('test-pool', max_workers=4, queue_limit=10)
+    results = []
+    done = threading.Event()
+
+    def collect(result):
+        results.append(result)
+        if len(results) == 4:
+            done.set()
+
+    start = time.perf_counter()
+    for i in range(4):
+        assert pool.submit(lambda n: time.sleep(0.2) or n, i, on_result=collect)
+    assert done.wait(2)
+    elapsed = time.perf_counter() - start
+
+    # Four 0.2s jobs on four workers finish together, not one after another
+    assert sorted(results) == [0, 1, 2, 3]
+    assert elapsed < 0.6
+    pool.shutdown()
+    assert pool.stats()['completed'] == 4
+    print(f"Pool stats: {pool.stats()}")
+
+def test_full_queue_rejects():
+    pool = WorkerPool('test-pool', max_workers=1, queue_limit=1)
+    release = threading.Event()
+    assert pool.submit(release.wait)
+    time.sleep(0.05)
+    assert pool.submit(release.wait)
+    # One running, one waiting: the next job is refused
+    assert not pool.submit(release.wait)
+    assert pool.stats()['rejected'] == 1
+    assert pool.stats()['queue_depth'] == 1
+    release.set()
+    pool.shutdown()
+
+def test_inline_mode_and_failures():
+    pool = WorkerPool('test-pool', max_workers=0)
+    results = []
+    assert pool.submit(lambda: 'done', on_result=results.append)
+    assert results == ['done']
+    assert pool.submit(lambda: 1 / 0)
+    assert pool.stats()['failed'] == 1
+
+if __name__ == "__main__":
+    test_jobs_run_concurrently()
+    test_full_queue_rejects()
+    test_inline_mode_and_failures()
+    print("All worker pool tests passed")
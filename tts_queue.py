@@ -0,0 +1,178 @@
+import queue
+import re
+import threading
+import time
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+
+def split_sentences(text):
+    """Split text into sentence-sized chunks for incremental synthesis."""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+class SpeechQueue:
+    """Text-to-speech on a dedicated worker thread.
+
+    say() returns immediately: the text is split into sentences and queued,
+    and the worker speaks them one at a time, so playback of a long answer
+    starts as soon as its first sentence is synthesized and the caller can
+    keep listening meanwhile. cancel() implements barge-in: it stops the
+    current sentence and drops everything still queued.
+
+    The engine is created by engine_factory on the worker thread on first
+    use, because pyttsx3 drivers (SAPI5 in particular) must be driven from
+    the thread that created them. For the same reason cancel() only moves
+    to a new generation; the worker stops the engine itself from its
+    'started-word' callback when the sentence being spoken belongs to an
+    older generation, so a late stop can never cut off the next utterance.
+    A factory returning None disables audio and the sentences are printed
+    instead.
+    """
+
+    def __init__(self, engine_factory, name='raizel-tts'):
+        self.engine_factory = engine_factory
+        self.name = name
+        self.engine = None
+        self._queue = queue.Queue()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._ready = threading.Event()
+        self._generation = 0
+        self._speaking = None
+        self._pending = 0
+        self._first_audio_due = None
+        self.utterances = 0
+        self.chunks_spoken = 0
+        self.chunks_dropped = 0
+        self.barge_ins = 0
+        self.first_audio_count = 0
+        self.total_first_audio_seconds = 0.0
+        self.max_first_audio_seconds = 0.0
+
+    def start(self):
+        """Start the worker thread (no-op if already running)."""
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        return self
+
+    def wait_ready(self, timeout=None):
+        """Block until the worker has created the engine (or failed to); returns False on timeout."""
+        return self._ready.wait(timeout)
+
+    def say(self, text):
+        """Queue text to be spoken and return without waiting for playback."""
+        chunks = split_sentences(text)
+        if not chunks:
+            return
+        self.start()
+        enqueued_at = time.perf_counter()
+        with self._condition:
+            self.utterances += 1
+            self._pending += len(chunks)
+            generation = self._generation
+        for index, chunk in enumerate(chunks):
+            self._queue.put((generation, index, chunk, enqueued_at))
+
+    @property
+    def speaking(self):
+        return self._pending > 0
+
+    def cancel(self):
+        """Barge-in: stop the current sentence (at its next word) and drop the queued ones."""
+        with self._condition:
+            if self._pending:
+                self.barge_ins += 1
+            self._generation += 1
+            self._first_audio_due = None
+
+    def _stop_if_cancelled(self, name=None, *args):
+        # Called on the engine's 'started-word' event, i.e. on the worker thread inside runAndWait()
+        with self._condition:
+            cancelled = self._speaking is not None and self._speaking != self._generation
+        if cancelled:
+            try:
+                self.engine.stop()
+            except Exception as e:
+                print(f"Error stopping text-to-speech: {str(e)}")
+
+    def wait(self, timeout=None):
+        """Block until everything queued has been spoken or dropped."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def _record_first_audio(self, name=None, *args):
+        # Called on the engine's 'started-utterance' event, or directly without an engine
+        with self._condition:
+            enqueued_at, self._first_audio_due = self._first_audio_due, None
+            if enqueued_at is None:
+                return
+            latency = time.perf_counter() - enqueued_at
+            self.first_audio_count += 1
+            self.total_first_audio_seconds += latency
+            self.max_first_audio_seconds = max(self.max_first_audio_seconds, latency)
+
+    def _run(self):
+        try:
+            self.engine = self.engine_factory()
+        except Exception as e:
+            print(f"Error initializing text-to-speech: {str(e)}")
+            self.engine = None
+        if self.engine is not None:
+            self.engine.connect('started-utterance', self._record_first_audio)
+            self.engine.connect('started-word', self._stop_if_cancelled)
+        self._ready.set()
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            generation, index, chunk, enqueued_at = item
+            with self._condition:
+                current = generation == self._generation
+                if current:
+                    self._speaking = generation
+                    if index == 0:
+                        self._first_audio_due = enqueued_at
+            if current:
+                self._speak(chunk)
+            with self._condition:
+                self._speaking = None
+                if current:
+                    self.chunks_spoken += 1
+                else:
+                    self.chunks_dropped += 1
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _speak(self, chunk):
+        if self.engine is None:
+            self._record_first_audio()
+            print(f"Text-to-speech disabled. Would say: {chunk}")
+            return
+        try:
+            self.engine.say(chunk)
+            self.engine.runAndWait()
+        except Exception as e:
+            print(f"Error in text-to-speech: {str(e)}")
+            print(f"Would have said: {chunk}")
+
+    def shutdown(self):
+        """Stop the worker after the queued speech."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+
+    def stats(self):
+        """Return queue counters and time-to-first-audio latency."""
+        with self._condition:
+            return {
+                'utterances': self.utterances,
+                'pending_chunks': self._pending,
+                'chunks_spoken': self.chunks_spoken,
+                'chunks_dropped': self.chunks_dropped,
+                'barge_ins': self.barge_ins,
+                'avg_first_audio_ms': (self.total_first_audio_seconds / self.first_audio_count * 1000
+                                       if self.first_audio_count else None),
+                'max_first_audio_ms': self.max_first_audio_seconds * 1000
+            }
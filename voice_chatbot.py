@@ -1,402 +1,570 @@
-import speech_recognition as sr
-import pyttsx3 as tts
-import time
-import os
-from dotenv import load_dotenv
-import requests as req
-from bs4 import BeautifulSoup as bs
-import re
-import sys
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
-import nltk
-import urllib.parse
-import wikipedia
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import pandas as pd
-import glob
-
-# Try to import distutils, but don't fail if it's not available
-try:
-    import distutils
-except ImportError:
-    print("Warning: distutils module not found. Some functionality may be limited.")
-    # Create a dummy distutils module to prevent errors
-    class DummyDistutils:
-        def __getattr__(self, name):
-            return lambda *args, **kwargs: None
-    sys.modules['distutils'] = DummyDistutils()
-
-class Raizel:
-    def __init__(self):
-        try:
-            # Download required NLTK data
-            try:
-                nltk.data.find('tokenizers/punkt')
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('punkt')
-                nltk.download('stopwords')
-
-            # Initialize speech recognizer with optimized settings
-            self.recognizer = sr.Recognizer()
-            self.recognizer.energy_threshold = 3000
-            self.recognizer.dynamic_energy_threshold = True
-            self.recognizer.pause_threshold = 0.8  # Reduced for faster response
-            
-            # Initialize text-to-speech engine
-            try:
-                self.engine = tts.init()
-                
-                # Set voice properties for Hugh Jackman-like voice
-                voices = self.engine.getProperty('voices')
-                male_voice = None
-                for voice in voices:
-                    if "male" in voice.name.lower():
-                        male_voice = voice
-                        break
-                
-                if male_voice:
-                    self.engine.setProperty('voice', male_voice.id)
-                    self.engine.setProperty('rate', 145)
-                    self.engine.setProperty('volume', 0.9)
-                    print("Voice set to male voice successfully!")
-                else:
-                    print("No male voice found, using default voice")
-                    self.engine.setProperty('voice', voices[0].id)
-                    self.engine.setProperty('rate', 145)
-                    self.engine.setProperty('volume', 0.9)
-            except Exception as e:
-                print(f"Error initializing text-to-speech: {str(e)}")
-                print("Text-to-speech functionality will be disabled.")
-                self.engine = None
-            
-            # Load environment variables if any
-            load_dotenv()
-            
-            # Load CSV files
-            self.load_csv_files()
-            
-            # Dictionary of responses with more natural language
-            self.responses = {
-                "hello": "Hello! I'm Raizel, your AI assistant. How can I help you today?",
-                "hi": "Hi there! How can I assist you?",
-                "hey": "Hey! What can I do for you?",
-                "how are you": "I'm functioning perfectly, thank you for asking!",
-                "what's your name": "I'm Raizel, your AI assistant. I can help you search the internet and answer your questions!",
-                "goodbye": "Goodbye! Have a great day!",
-                "bye": "See you later!",
-                "search": "Let me search that for you.",
-                "default": "I'm not sure about that. Would you like me to search the internet for more information?"
-            }
-            
-            # Search keywords for better command recognition
-            self.search_keywords = [
-                "search", "find", "look up", "what is", "who is", 
-                "tell me about", "explain", "define", "meaning of"
-            ]
-            
-            # CSV-related keywords
-            self.csv_keywords = [
-                "student", "academic", "marks", "grades", "course",
-                "subject", "calendar", "record", "performance"
-            ]
-            
-            print("Raizel initialized successfully!")
-            
-        except Exception as e:
-            print(f"Error initializing Raizel: {str(e)}")
-            sys.exit(1)
-
-    def load_csv_files(self):
-        """Load all CSV files in the workspace"""
-        try:
-            self.csv_data = {}
-            csv_files = glob.glob("*.csv")
-            
-            for file in csv_files:
-                try:
-                    df = pd.read_csv(file)
-                    self.csv_data[file] = df
-                    print(f"Successfully loaded {file}")
-                except Exception as e:
-                    print(f"Error loading {file}: {str(e)}")
-            
-            if not self.csv_data:
-                print("Warning: No CSV files were loaded successfully")
-        except Exception as e:
-            print(f"Error loading CSV files: {str(e)}")
-
-    def query_csv_data(self, query):
-        """Query the loaded CSV data based on user input"""
-        try:
-            query = query.lower()
-            results = []
-            
-            # Check each CSV file for relevant information
-            for file_name, df in self.csv_data.items():
-                # Convert column names to lowercase for case-insensitive matching
-                columns = [col.lower() for col in df.columns]
-                
-                # Check if query matches any column names
-                matching_columns = [col for col in columns if query in col]
-                
-                if matching_columns:
-                    # Get the first few rows of matching columns
-                    for col in matching_columns:
-                        original_col = df.columns[columns.index(col)]
-                        sample_data = df[original_col].head(3).to_string()
-                        results.append(f"In {file_name}, {col} data: {sample_data}")
-            
-            if results:
-                return "\n".join(results)
-            else:
-                return None
-        except Exception as e:
-            print(f"Error querying CSV data: {str(e)}")
-            return None
-
-    def clean_text(self, text):
-        """Clean and normalize text"""
-        # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
-    def extract_relevant_content(self, soup):
-        """Extract relevant content from webpage"""
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'iframe', 'aside']):
-            element.decompose()
-        
-        # Get text content
-        text = soup.get_text()
-        text = self.clean_text(text)
-        
-        # Split into sentences
-        sentences = sent_tokenize(text)
-        
-        # Remove short sentences and clean them
-        sentences = [s.strip() for s in sentences if len(s.split()) > 5]
-        
-        return sentences
-
-    def find_best_answer(self, query, sentences):
-        """Find the most relevant sentence based on the query"""
-        # Clean the query
-        query = self.clean_text(query.lower())
-        query_words = set(query.split())
-        
-        # Remove stopwords from query
-        stop_words = set(stopwords.words('english'))
-        query_words = query_words - stop_words
-        
-        best_score = 0
-        best_sentence = None
-        
-        for sentence in sentences:
-            sentence = sentence.lower()
-            # Count matching words
-            score = sum(1 for word in query_words if word in sentence)
-            if score > best_score:
-                best_score = score
-                best_sentence = sentence
-        
-        return best_sentence
-
-    def search_wikipedia(self, query):
-        """Search Wikipedia for information"""
-        try:
-            # Search Wikipedia
-            wikipedia.set_lang("en")
-            result = wikipedia.summary(query, sentences=2)
-            return result
-        except wikipedia.exceptions.DisambiguationError as e:
-            # If there are multiple matches, use the first option
-            return wikipedia.summary(e.options[0], sentences=2)
-        except wikipedia.exceptions.PageError:
-            return None
-        except Exception as e:
-            print(f"Wikipedia search error: {str(e)}")
-            return None
-
-    def search_google(self, query):
-        """Search using Google Custom Search API"""
-        try:
-            # Get API key and CSE ID from environment variables
-            api_key = os.getenv('GOOGLE_API_KEY')
-            cse_id = os.getenv('GOOGLE_CSE_ID')
-            
-            if not api_key or not cse_id:
-                return "Google search is not configured. Please set up API credentials in the .env file."
-                
-            # Build the service
-            service = build('customsearch', 'v1', developerKey=api_key)
-            
-            # Execute the search
-            result = service.cse().list(q=query, cx=cse_id, num=3).execute()
-            
-            if 'items' in result:
-                # Get the snippet from the first result
-                return result['items'][0]['snippet']
-            
-            return None
-            
-        except HttpError as e:
-            print(f"Google search error: {str(e)}")
-            return None
-        except Exception as e:
-            print(f"Google search error: {str(e)}")
-            return None
-
-    def search_internet(self, query):
-        """Search the internet using multiple sources"""
-        try:
-            # Format the search query
-            search_query = query
-            if not any(word in query.lower() for word in ["what", "who", "how", "when", "where", "why"]):
-                search_query = f"what is {query}"
-            
-            # Try Wikipedia first
-            wiki_result = self.search_wikipedia(search_query)
-            if wiki_result:
-                return f"According to Wikipedia, {wiki_result}"
-            
-            # If Wikipedia fails, try Google
-            google_result = self.search_google(search_query)
-            if google_result:
-                return f"According to Google, {google_result}"
-            
-            return "I couldn't find any information about that. Would you like to try a different search?"
-            
-        except Exception as e:
-            print(f"Search error: {str(e)}")
-            return "I encountered an error while searching. Please try again."
-
-    def process_voice_input(self, audio_file_path):
-        """Process voice input from a file and return the response"""
-        try:
-            print(f"Opening audio file: {audio_file_path}")
-            with sr.AudioFile(audio_file_path) as source:
-                print("Adjusting for ambient noise...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                print("Recording audio...")
-                audio = self.recognizer.record(source)
-                print("Sending to Google Speech Recognition...")
-                text = self.recognizer.recognize_google(audio)
-                print(f"Recognized text: {text}")
-                return self.get_response(text)
-        except sr.UnknownValueError:
-            print("Google Speech Recognition could not understand audio")
-            return "I couldn't understand the audio. Could you please try again?"
-        except sr.RequestError as e:
-            print(f"Could not request results from Google Speech Recognition service: {str(e)}")
-            return f"Could not request results from Google Speech Recognition service; {str(e)}"
-        except Exception as e:
-            print(f"Error processing voice input: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return "Sorry, I encountered an error processing your voice input. Please try again."
-
-    def listen(self):
-        """Listen for voice input and convert to text"""
-        try:
-            with sr.Microphone() as source:
-                print("Listening...")
-                try:
-                    # Adjust for ambient noise
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                    # Listen for audio input
-                    audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
-                    print("Processing speech...")
-                    try:
-                        # Try to recognize the speech
-                        text = self.recognizer.recognize_google(audio)
-                        print(f"You said: {text}")
-                        return text.lower()
-                    except sr.UnknownValueError:
-                        print("Could not understand audio")
-                        return None
-                    except sr.RequestError as e:
-                        print(f"Error with the speech recognition service: {e}")
-                        return None
-                except Exception as e:
-                    print(f"Error during listening: {str(e)}")
-                    return None
-        except Exception as e:
-            print(f"Error accessing microphone: {str(e)}")
-            return None
-
-    def speak(self, text):
-        """Convert text to speech"""
-        try:
-            if self.engine is None:
-                print(f"Text-to-speech disabled. Would say: {text}")
-                return
-            
-            self.engine.say(text)
-            self.engine.runAndWait()
-        except Exception as e:
-            print(f"Error in text-to-speech: {str(e)}")
-            print(f"Would have said: {text}")
-
-    def get_response(self, text):
-        """Get appropriate response based on input text"""
-        if not text:
-            return self.responses["default"]
-            
-        # Check for CSV-related queries
-        if any(keyword in text.lower() for keyword in self.csv_keywords):
-            csv_result = self.query_csv_data(text)
-            if csv_result:
-                return csv_result
-            
-        # Check for search-related keywords
-        for keyword in self.search_keywords:
-            if keyword in text:
-                query = text.split(keyword)[-1].strip()
-                return self.search_internet(query)
-            
-        # Check for other predefined responses
-        for key in self.responses:
-            if key in text:
-                return self.responses[key]
-                
-        return self.responses["default"]
-
-    def run(self):
-        """Main loop for the chatbot with improved error handling"""
-        try:
-            self.speak("Hello! I'm Raizel, your AI assistant. I can help you search the internet and answer your questions. How can I assist you today?")
-            
-            while True:
-                # Wait for user input
-                text = self.listen()
-                
-                if text:
-                    if any(word in text for word in ["goodbye", "bye", "exit", "quit"]):
-                        self.speak(self.responses["goodbye"])
-                        break
-                        
-                    response = self.get_response(text)
-                    self.speak(response)
-                
-                # Add a small delay between iterations
-                time.sleep(0.2)
-                
-        except KeyboardInterrupt:
-            print("\nGoodbye!")
-            self.speak("Goodbye! Have a great day!")
-        except Exception as e:
-            print(f"An error occurred: {str(e)}")
-            self.speak("I encountered an error. Please restart me.")
-
-if __name__ == "__main__":
-    try:
-        raizel = Raizel()
-        raizel.run()
-    except Exception as e:
-        print(f"Fatal error: {str(e)}")
-        sys.exit(1) 
+import speech_recognition as sr
+import time
+import os
+from dotenv import load_dotenv
+import re
+import sys
+import threading
+from data_store import data_store
+from intent_router import IntentRouter
+from voice_pipeline import NoiseProfile, read_audio, create_voice_activity_detector, transcribe_segments
+from speech_backends import get_speech_service
+from tts_queue import SpeechQueue
+from search_cache import normalize_query, create_search_cache
+from search_orchestrator import create_search_orchestrator
+from passage_ranker import PassageIndex, ENGLISH_STOP_WORDS
+from html_extract import extract_sentences
+from knowledge_base import create_knowledge_base
+
+GOOGLE_NOT_CONFIGURED = "Google search is not configured. Please set up API credentials in the .env file."
+
+def google_configured():
+    return bool(os.getenv('GOOGLE_API_KEY') and os.getenv('GOOGLE_CSE_ID'))
+
+# NLTK, the search clients and pyttsx3 are imported on first use, so a
+# process that only answers text chat never loads them
+_nltk_ready = False
+_nltk_lock = threading.Lock()
+
+def ensure_distutils():
+    """Import distutils, or install a dummy module if it's not available (needed by some engines)"""
+    if 'distutils' in sys.modules:
+        return
+    try:
+        import distutils
+    except ImportError:
+        print("Warning: distutils module not found. Some functionality may be limited.")
+        # Create a dummy distutils module to prevent errors
+        class DummyDistutils:
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: None
+        sys.modules['distutils'] = DummyDistutils()
+
+def ensure_nltk_data():
+    """Download the NLTK tokenizer and stopwords on first use if they are missing"""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _nltk_lock:
+        if _nltk_ready:
+            return
+        import nltk
+        try:
+            nltk.data.find('tokenizers/punkt')
+            nltk.data.find('corpora/stopwords')
+        except LookupError:
+            nltk.download('punkt')
+            nltk.download('stopwords')
+        _nltk_ready = True
+
+class locked_cached_property:
+    """Like functools.cached_property, but the value is computed once even when threads race for it.
+
+    cached_property stopped locking in Python 3.12, so two request threads
+    could each build a search cache, knowledge base connection or TTS
+    worker and keep using different ones. The lock is re-entrant because
+    some of these properties read others while they are built.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance.__dict__
+        if self.name in values:
+            return values[self.name]
+        with self._lock:
+            if self.name not in values:
+                values[self.name] = self.func(instance)
+            return values[self.name]
+
+class Raizel:
+    def __init__(self):
+        try:
+            # Speech recognition, text-to-speech, NLTK, the search clients and the
+            # CSV data are all set up on first use (see warm_up to do it early)
+            
+            # Load environment variables if any
+            load_dotenv()
+            
+            # Pick up hot reloads of the data store (the CSVs load on first query)
+            self._csv_data = None
+            data_store.add_reload_listener(self.load_csv_files)
+            
+            # Dictionary of responses with more natural language
+            self.responses = {
+                "hello": "Hello! I'm Raizel, your AI assistant. How can I help you today?",
+                "hi": "Hi there! How can I assist you?",
+                "hey": "Hey! What can I do for you?",
+                "how are you": "I'm functioning perfectly, thank you for asking!",
+                "what's your name": "I'm Raizel, your AI assistant. I can help you search the internet and answer your questions!",
+                "goodbye": "Goodbye! Have a great day!",
+                "bye": "See you later!",
+                "search": "Let me search that for you.",
+                "default": "I'm not sure about that. Would you like me to search the internet for more information?"
+            }
+            
+            # Search keywords for better command recognition
+            self.search_keywords = [
+                "search", "find", "look up", "what is", "who is", 
+                "tell me about", "explain", "define", "meaning of"
+            ]
+            
+            # CSV-related keywords
+            self.csv_keywords = [
+                "student", "academic", "marks", "grades", "course",
+                "subject", "calendar", "record", "performance"
+            ]
+            
+            # Intent router over all keyword sets, built once at startup
+            self.intent_router = self.build_intent_router()
+            
+            print("Raizel initialized successfully!")
+            
+        except Exception as e:
+            print(f"Error initializing Raizel: {str(e)}")
+            sys.exit(1)
+
+    @locked_cached_property
+    def recognizer(self):
+        """Speech recognizer with optimized settings"""
+        recognizer = sr.Recognizer()
+        recognizer.energy_threshold = 3000
+        recognizer.dynamic_energy_threshold = True
+        recognizer.pause_threshold = 0.8  # Reduced for faster response
+        return recognizer
+
+    @locked_cached_property
+    def noise_profile(self):
+        """Ambient-noise calibration kept for the whole microphone session"""
+        return NoiseProfile(
+            self.recognizer,
+            refresh_seconds=float(os.getenv('NOISE_PROFILE_REFRESH_SECONDS', '300')),
+            drift_ratio=float(os.getenv('NOISE_PROFILE_DRIFT_RATIO', '2.0'))
+        )
+
+    @locked_cached_property
+    def voice_activity(self):
+        return create_voice_activity_detector()
+
+    @locked_cached_property
+    def tts(self):
+        """Text-to-speech worker thread, which creates the engine on first use"""
+        return SpeechQueue(self.create_tts_engine)
+
+    @locked_cached_property
+    def search_cache(self):
+        """Search answers and misses keyed by normalized query"""
+        return create_search_cache()
+
+    @locked_cached_property
+    def knowledge_base(self):
+        """Offline full-text answers (None if KNOWLEDGE_BASE_DB is empty)"""
+        return create_knowledge_base(ENGLISH_STOP_WORDS)
+
+    @locked_cached_property
+    def wikipedia_client(self):
+        from http_clients import WikipediaClient
+        return WikipediaClient()
+
+    @locked_cached_property
+    def search_orchestrator(self):
+        """Wikipedia and Google queried concurrently, in priority order"""
+        return create_search_orchestrator({
+            'wikipedia': ('Wikipedia', self.search_wikipedia),
+            'google': ('Google', self.search_google)
+        }, record=self.search_cache.record_source)
+
+    @property
+    def csv_data(self):
+        if self._csv_data is None:
+            self.load_csv_files()
+        return self._csv_data
+
+    def warm_up(self, subsystems=('data', 'nltk', 'recognition', 'search', 'tts')):
+        """
+        Initialize subsystems ahead of their first use.
+
+        Args:
+            subsystems (iterable): Any of 'data', 'nltk', 'recognition', 'search' and 'tts'
+
+        Returns:
+            dict: Seconds spent on each subsystem
+        """
+        timings = {}
+        for name in subsystems:
+            start = time.perf_counter()
+            try:
+                if name == 'data':
+                    self.csv_data
+                elif name == 'nltk':
+                    self.stop_words
+                elif name == 'recognition':
+                    self.noise_profile
+                    self.voice_activity
+                    get_speech_service()
+                elif name == 'search':
+                    ensure_distutils()
+                    from http_clients import get_google_search_client
+                    self.knowledge_base
+                    self.wikipedia_client
+                    get_google_search_client()
+                    self.search_orchestrator
+                elif name == 'tts':
+                    # The engine is built on the worker thread; count it as part of the warm-up
+                    self.tts.start().wait_ready()
+                else:
+                    print(f"Unknown subsystem to warm up: {name}")
+                    continue
+            except Exception as e:
+                print(f"Error warming up {name}: {str(e)}")
+            timings[name] = time.perf_counter() - start
+        print("Warmed up: " + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in timings.items()))
+        return timings
+
+    def load_csv_files(self):
+        """Attach the academic datasets from the shared data store"""
+        try:
+            self._csv_data = data_store.as_file_dict()
+            
+            if not self._csv_data:
+                print("Warning: No CSV files were loaded successfully")
+        except Exception as e:
+            print(f"Error loading CSV files: {str(e)}")
+
+    def query_csv_data(self, query):
+        """Query the loaded CSV data based on user input"""
+        try:
+            query = query.lower()
+            results = []
+            
+            # Check each CSV file for relevant information
+            for file_name, df in self.csv_data.items():
+                # Convert column names to lowercase for case-insensitive matching
+                columns = [col.lower() for col in df.columns]
+                
+                # Check if query matches any column names
+                matching_columns = [col for col in columns if query in col]
+                
+                if matching_columns:
+                    # Get the first few rows of matching columns
+                    for col in matching_columns:
+                        original_col = df.columns[columns.index(col)]
+                        sample_data = df[original_col].head(3).to_string()
+                        results.append(f"In {file_name}, {col} data: {sample_data}")
+            
+            if results:
+                return "\n".join(results)
+            else:
+                return None
+        except Exception as e:
+            print(f"Error querying CSV data: {str(e)}")
+            return None
+
+    def clean_text(self, text):
+        """Clean and normalize text"""
+        # Remove special characters and extra whitespace
+        text = re.sub(r'[^\w\s]', ' ', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
+
+    def extract_relevant_content(self, page, max_sentences=None):
+        """
+        Extract the content sentences of a webpage.
+
+        Args:
+            page: HTML as str or bytes, an iterable of chunks (e.g. response.iter_content()) or a BeautifulSoup object
+            max_sentences (int): Stop parsing once this many candidate sentences were found
+                (default PAGE_MAX_SENTENCES, 0 for the whole page)
+
+        Returns:
+            list: Sentences with more than five words, in page order
+        """
+        if max_sentences is None:
+            max_sentences = int(os.getenv('PAGE_MAX_SENTENCES', '200'))
+        if hasattr(page, 'decode_contents'):
+            page = str(page)
+        # Streamed through html.parser: script/style/navigation subtrees are skipped without
+        # building a tree, sentences are split as each block ends and parsing stops early
+        return extract_sentences(page, max_sentences=max_sentences or None)
+
+    @locked_cached_property
+    def stop_words(self):
+        """English stopwords, loaded once"""
+        try:
+            ensure_nltk_data()
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words('english'))
+        except LookupError:
+            print("NLTK stopwords unavailable, using the built-in list")
+            return ENGLISH_STOP_WORDS
+
+    def build_passage_index(self, sentences):
+        """Tokenize a page's sentences once into a BM25 index that can answer many queries"""
+        return PassageIndex(sentences, self.stop_words)
+
+    def find_best_answers(self, query, sentences, k=3):
+        """Return the k sentences (or PassageIndex passages) most relevant to the query, best first"""
+        index = sentences if isinstance(sentences, PassageIndex) else self.build_passage_index(sentences)
+        return [passage for _, passage in index.top_k(query, k)]
+
+    def find_best_answer(self, query, sentences):
+        """Find the most relevant sentence based on the query"""
+        answers = self.find_best_answers(query, sentences, k=1)
+        return answers[0] if answers else None
+
+    def search_wikipedia(self, query):
+        """Search Wikipedia for information (network errors are raised to the search orchestrator)"""
+        # One request over the pooled keep-alive session; disambiguation pages are skipped
+        return self.wikipedia_client.summary(query, sentences=2)
+
+    def search_google(self, query):
+        """Search using Google Custom Search API (errors are raised to the search orchestrator)"""
+        ensure_distutils()
+        from http_clients import get_google_search_client
+        # The discovery client is built once per process (None without API credentials)
+        client = get_google_search_client()
+        if client is None:
+            return None
+        
+        # Snippet of the first result
+        return client.search(query, num=3)
+
+    def search_sources(self, search_query):
+        """Ask every search source at once; returns (answer or None, source name, complete)"""
+        answer, provider, complete = self.search_orchestrator.search(search_query)
+        if answer is None:
+            return None, None, complete
+        if provider.name == 'wikipedia':
+            self.learn(search_query, answer)
+        return f"According to {provider.label}, {answer}", provider.name, complete
+
+    def learn(self, search_query, summary):
+        """Keep a fetched Wikipedia summary in the knowledge base so the topic is answered offline next time"""
+        if self.knowledge_base is None or os.getenv('KNOWLEDGE_BASE_LEARN', '1') == '0':
+            return
+        topic = self.knowledge_base.topic(search_query)
+        if topic:
+            try:
+                # Kept as long as the search cache would keep it, and only for this exact topic
+                self.knowledge_base.add(topic, summary, source='wikipedia', ttl=self.search_cache.ttl)
+            except Exception as e:
+                print(f"Error saving to the knowledge base: {str(e)}")
+
+    def answer_from_knowledge_base(self, query, title_only=False, learned=True):
+        """Answer from the local knowledge base (learned Wikipedia summaries too, unless learned=False), or None"""
+        if self.knowledge_base is None:
+            return None
+        return self.knowledge_base.answer(query, title_only=title_only, learned=learned)
+
+    def search_internet(self, query):
+        """Search the internet using multiple sources"""
+        try:
+            # Format the search query
+            search_query = query
+            if not any(word in query.lower() for word in ["what", "who", "how", "when", "where", "why"]):
+                search_query = f"what is {query}"
+            
+            # The local knowledge base answers without any network call
+            answer = self.answer_from_knowledge_base(search_query)
+            if answer:
+                return answer
+            
+            # Answer repeated questions (and repeated misses) from the cache
+            key = normalize_query(search_query)
+            found, answer = self.search_cache.get(key)
+            if not found:
+                answer, source, complete = self.search_sources(search_query)
+                # Don't remember a miss caused by a timeout or an error
+                if answer or complete:
+                    self.search_cache.set(key, answer, source)
+            if answer:
+                return answer
+            if not google_configured():
+                return GOOGLE_NOT_CONFIGURED
+            
+            return "I couldn't find any information about that. Would you like to try a different search?"
+            
+        except Exception as e:
+            print(f"Search error: {str(e)}")
+            return "I encountered an error while searching. Please try again."
+
+    def process_voice_input(self, audio_input):
+        """Process voice input (a file path or the audio file's bytes) and return the response"""
+        try:
+            print("Recording audio...")
+            audio = read_audio(audio_input, self.recognizer)
+            self.noise_profile.observe(audio)
+            segments = self.voice_activity.split(audio, self.recognizer.energy_threshold)
+            if not segments:
+                print("No speech detected in the audio")
+                return "I didn't hear anything. Could you please try again?"
+            print("Sending to speech recognition...")
+            text = transcribe_segments(segments, get_speech_service().recognize)
+            print(f"Recognized text: {text}")
+            return self.get_response(text)
+        except sr.UnknownValueError:
+            print("Speech recognition could not understand audio")
+            return "I couldn't understand the audio. Could you please try again?"
+        except sr.RequestError as e:
+            print(f"Could not request results from the speech recognition service: {str(e)}")
+            return f"Could not request results from the speech recognition service; {str(e)}"
+        except Exception as e:
+            print(f"Error processing voice input: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return "Sorry, I encountered an error processing your voice input. Please try again."
+
+    def listen(self):
+        """Listen for voice input and convert to text"""
+        try:
+            with sr.Microphone() as source:
+                print("Listening...")
+                try:
+                    # Adjust for ambient noise only when the session's profile is stale;
+                    # listen() keeps adapting the threshold in between
+                    if self.noise_profile.needs_calibration():
+                        self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                        self.noise_profile.calibrate(self.recognizer.energy_threshold / self.recognizer.dynamic_energy_ratio)
+                    # Listen for audio input
+                    audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+                    print("Processing speech...")
+                    try:
+                        # Try to recognize the speech
+                        text = get_speech_service().recognize(audio)
+                        print(f"You said: {text}")
+                        return text.lower()
+                    except sr.UnknownValueError:
+                        print("Could not understand audio")
+                        return None
+                    except sr.RequestError as e:
+                        print(f"Error with the speech recognition service: {e}")
+                        return None
+                except Exception as e:
+                    print(f"Error during listening: {str(e)}")
+                    return None
+        except Exception as e:
+            print(f"Error accessing microphone: {str(e)}")
+            return None
+
+    def create_tts_engine(self):
+        """Initialize the text-to-speech engine (called on the speech worker thread)"""
+        try:
+            ensure_distutils()
+            import pyttsx3 as tts
+            engine = tts.init()
+            
+            # Set voice properties for Hugh Jackman-like voice
+            voices = engine.getProperty('voices')
+            male_voice = None
+            for voice in voices:
+                if "male" in voice.name.lower():
+                    male_voice = voice
+                    break
+            
+            if male_voice:
+                engine.setProperty('voice', male_voice.id)
+                engine.setProperty('rate', 145)
+                engine.setProperty('volume', 0.9)
+                print("Voice set to male voice successfully!")
+            else:
+                print("No male voice found, using default voice")
+                engine.setProperty('voice', voices[0].id)
+                engine.setProperty('rate', 145)
+                engine.setProperty('volume', 0.9)
+            return engine
+        except Exception as e:
+            print(f"Error initializing text-to-speech: {str(e)}")
+            print("Text-to-speech functionality will be disabled.")
+            return None
+
+    def speak(self, text):
+        """Queue text to be spoken sentence by sentence without blocking"""
+        self.tts.say(text)
+
+    def build_intent_router(self):
+        """Compile the CSV, search and small-talk keywords into one intent router"""
+        router = IntentRouter()
+        router.register('csv', self.csv_keywords, self.answer_from_csv)
+        router.register('search', self.search_keywords, self.answer_from_search)
+        router.register('small_talk', [key for key in self.responses if key != "default"], self.answer_small_talk)
+        return router.compile()
+
+    def answer_from_csv(self, match):
+        """Answer a CSV-related query, or pass if nothing matched"""
+        return self.query_csv_data(match.text) or None
+
+    def answer_from_search(self, match):
+        """Search the internet for the text following the search keyword"""
+        query = match.text_after(match.keyword_for('search'))
+        return self.search_internet(query)
+
+    def answer_small_talk(self, match):
+        """Return the predefined response for the matched phrase"""
+        return self.responses[match.keyword_for('small_talk')]
+
+    def get_response(self, text):
+        """Get appropriate response based on input text"""
+        if not text:
+            return self.responses["default"]
+        
+        # Classify the text once and let the highest-priority intent answer
+        response = self.intent_router.dispatch(text)
+        if response is not None:
+            return response
+        
+        # A question naming the topic of an admin document gets an offline answer
+        response = self.answer_from_knowledge_base(text, title_only=True, learned=False)
+        if response is not None:
+            return response
+                
+        return self.responses["default"]
+
+    def run(self):
+        """Main loop for the chatbot with improved error handling"""
+        try:
+            self.speak("Hello! I'm Raizel, your AI assistant. I can help you search the internet and answer your questions. How can I assist you today?")
+            
+            while True:
+                # Wait for user input
+                text = self.listen()
+                
+                if text:
+                    # The student talked over Raizel: stop the rest of the previous answer
+                    self.tts.cancel()
+                    if any(word in text for word in ["goodbye", "bye", "exit", "quit"]):
+                        self.speak(self.responses["goodbye"])
+                        self.tts.wait()
+                        break
+                        
+                    response = self.get_response(text)
+                    self.speak(response)
+                
+                # Add a small delay between iterations
+                time.sleep(0.2)
+                
+        except KeyboardInterrupt:
+            print("\nGoodbye!")
+            self.tts.cancel()
+            self.speak("Goodbye! Have a great day!")
+            self.tts.wait()
+        except Exception as e:
+            print(f"An error occurred: {str(e)}")
+            self.speak("I encountered an error. Please restart me.")
+            self.tts.wait()
+
+if __name__ == "__main__":
+    try:
+        raizel = Raizel()
+        raizel.run()
+    except Exception as e:
+        print(f"Fatal error: {str(e)}")
+        sys.exit(1) 
         
\ No newline at end of file
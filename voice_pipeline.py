@@ -0,0 +1,287 @@
+import base64
+import io
+import os
+import threading
+import time
+import numpy as np
+import speech_recognition as sr
+from lru_cache import LRUCache
+
+FRAME_SECONDS = 0.02
+# The noise floor is the energy of the frame at this percentile (quietest first),
+# estimated from at most NOISE_SAMPLE_FRAMES frames spread over the clip
+NOISE_FLOOR_PERCENTILE = 10
+NOISE_SAMPLE_FRAMES = 100
+
+def decode_data_url(data_url):
+    """
+    Decode a base64 audio data URL (or bare base64 string) from the browser.
+
+    Args:
+        data_url (str): e.g. "data:audio/wav;base64,UklGR..."
+
+    Returns:
+        bytes: The raw audio file contents
+    """
+    # Decode from the character after the header instead of splitting the whole payload
+    return base64.b64decode(data_url[data_url.find(',') + 1:])
+
+def audio_source(audio):
+    """Wrap audio bytes in an in-memory file for sr.AudioFile; paths and file objects pass through."""
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return io.BytesIO(audio)
+    return audio
+
+def read_audio(audio, recognizer):
+    """Read a whole WAV/AIFF/FLAC clip into an sr.AudioData (nothing is consumed for calibration)."""
+    with sr.AudioFile(audio_source(audio)) as source:
+        return recognizer.record(source)
+
+def frame_energies(audio, frame_seconds=FRAME_SECONDS, max_frames=None):
+    """
+    Compute the RMS energy of each short frame of a clip.
+
+    Args:
+        audio (sr.AudioData): The clip (measured as 16-bit samples)
+        frame_seconds (float): Frame length
+        max_frames (int, optional): Only measure this many evenly spaced frames
+
+    Returns:
+        np.ndarray: One energy value per measured frame
+    """
+    samples = np.frombuffer(audio.get_raw_data(convert_width=2), dtype=np.int16)
+    frame = max(int(audio.sample_rate * frame_seconds), 1)
+    frames = samples[:len(samples) // frame * frame].reshape(-1, frame)
+    if max_frames is not None and len(frames) > max_frames:
+        frames = frames[np.linspace(0, len(frames) - 1, max_frames).astype(int)]
+    frames = frames.astype(np.float32)
+    return np.sqrt((frames * frames).mean(axis=1))
+
+class NoiseProfile:
+    """Ambient-noise calibration for one session, reused across its utterances.
+
+    The noise floor is estimated from the quietest frames of a clip after it
+    has been read in full, so calibrating no longer swallows the first half
+    second of speech. The profile (and the Recognizer that carries its
+    energy threshold) is kept for the session and only recalibrated when it
+    is older than refresh_seconds or a clip's noise floor drifts by more
+    than drift_ratio from it.
+    """
+
+    def __init__(self, recognizer=None, refresh_seconds=300, drift_ratio=2.0):
+        self.recognizer = recognizer or sr.Recognizer()
+        self.refresh_seconds = refresh_seconds
+        self.drift_ratio = drift_ratio
+        self.noise_energy = None
+        self.calibrated_at = None
+
+    def needs_calibration(self):
+        return self.noise_energy is None or time.monotonic() - self.calibrated_at > self.refresh_seconds
+
+    def calibrate(self, noise_energy):
+        """Adopt a new noise floor and derive the energy threshold from it like sr.Recognizer does."""
+        self.noise_energy = max(float(noise_energy), 1.0)
+        self.recognizer.energy_threshold = self.noise_energy * self.recognizer.dynamic_energy_ratio
+        self.calibrated_at = time.monotonic()
+
+    def observe(self, audio):
+        """
+        Update the profile from a clip if it is stale or has drifted.
+
+        Returns:
+            str: 'calibrated', 'drift' or 'reused'
+        """
+        energies = frame_energies(audio, max_frames=NOISE_SAMPLE_FRAMES)
+        if not len(energies):
+            return 'reused'
+        quiet = len(energies) * NOISE_FLOOR_PERCENTILE // 100
+        noise_energy = max(float(np.partition(energies, quiet)[quiet]), 1.0)
+        if self.needs_calibration():
+            self.calibrate(noise_energy)
+            return 'calibrated'
+        if not self.noise_energy / self.drift_ratio <= noise_energy <= self.noise_energy * self.drift_ratio:
+            self.calibrate(noise_energy)
+            return 'drift'
+        return 'reused'
+
+class NoiseProfiles:
+    """Noise profiles keyed by session (Socket.IO sid), with calibration counters."""
+
+    def __init__(self, maxsize=1024, idle_seconds=3600, refresh_seconds=300, drift_ratio=2.0):
+        self.refresh_seconds = refresh_seconds
+        self.drift_ratio = drift_ratio
+        self._profiles = LRUCache(maxsize=maxsize, ttl=idle_seconds)
+        self._lock = threading.Lock()
+        self.utterances = 0
+        self.calibrations = 0
+        self.drift_recalibrations = 0
+        self.reuses = 0
+
+    def for_session(self, session_id):
+        """Return the session's profile, creating it on first use."""
+        profile = self._profiles.get(session_id)
+        if profile is None:
+            with self._lock:
+                profile = self._profiles.get(session_id)
+                if profile is None:
+                    profile = NoiseProfile(refresh_seconds=self.refresh_seconds, drift_ratio=self.drift_ratio)
+                    self._profiles.set(session_id, profile)
+        return profile
+
+    def discard(self, session_id):
+        self._profiles.invalidate(session_id)
+
+    def record(self, session_id, audio):
+        """
+        Read a clip with the session's Recognizer and keep its noise profile current.
+
+        Args:
+            session_id (str): The Socket.IO sid (or any session key)
+            audio (bytes, str or file object): The clip
+
+        Returns:
+            sr.AudioData: The whole clip
+        """
+        profile = self.for_session(session_id)
+        audio_data = read_audio(audio, profile.recognizer)
+        outcome = profile.observe(audio_data)
+        with self._lock:
+            self.utterances += 1
+            if outcome == 'calibrated':
+                self.calibrations += 1
+            elif outcome == 'drift':
+                self.drift_recalibrations += 1
+            else:
+                self.reuses += 1
+        return audio_data
+
+    def stats(self):
+        """Return calibration counters suitable for a metrics endpoint."""
+        with self._lock:
+            return {
+                'sessions': len(self._profiles),
+                'utterances': self.utterances,
+                'calibrations': self.calibrations,
+                'drift_recalibrations': self.drift_recalibrations,
+                'reuses': self.reuses
+            }
+
+class VoiceActivityDetector:
+    """Energy-based voice activity detection run before speech recognition.
+
+    Frames louder than the session's energy threshold count as speech. Runs
+    of speech separated by less than pause_seconds are merged, runs shorter
+    than min_speech_seconds (clicks, pops) are ignored, and the result is
+    padded by padding_seconds on both sides. Clips with no speech are
+    rejected without a recognizer call; recordings whose speech spans more
+    than max_segment_seconds are split at pauses into separate segments.
+    """
+
+    def __init__(self, min_speech_seconds=0.25, pause_seconds=0.8, padding_seconds=0.3, max_segment_seconds=15):
+        self.min_speech_seconds = min_speech_seconds
+        self.pause_seconds = pause_seconds
+        self.padding_seconds = padding_seconds
+        self.max_segment_seconds = max_segment_seconds
+        self._lock = threading.Lock()
+        self.clips = 0
+        self.rejected_clips = 0
+        self.split_clips = 0
+        self.segments = 0
+        self.input_seconds = 0.0
+        self.trimmed_seconds = 0.0
+
+    def speech_runs(self, energies, threshold):
+        """Return (start, stop) frame ranges of speech, merged across short pauses."""
+        speech = np.flatnonzero(energies > threshold)
+        if not len(speech):
+            return []
+        gap = int(self.pause_seconds / FRAME_SECONDS)
+        breaks = np.flatnonzero(np.diff(speech) > gap)
+        starts = np.concatenate(([speech[0]], speech[breaks + 1]))
+        stops = np.concatenate((speech[breaks], [speech[-1]])) + 1
+        shortest = int(self.min_speech_seconds / FRAME_SECONDS)
+        return [(start, stop) for start, stop in zip(starts.tolist(), stops.tolist()) if stop - start >= shortest]
+
+    def segment_ranges(self, runs, frame_count):
+        """Group speech runs into padded segments no longer than max_segment_seconds where possible."""
+        longest = int(self.max_segment_seconds / FRAME_SECONDS)
+        padding = int(self.padding_seconds / FRAME_SECONDS)
+        groups = []
+        for start, stop in runs:
+            if groups and stop - groups[-1][0] <= longest:
+                groups[-1][1] = stop
+            else:
+                groups.append([start, stop])
+        return [(max(start - padding, 0), min(stop + padding, frame_count)) for start, stop in groups]
+
+    def split(self, audio, threshold):
+        """
+        Trim silence from a clip and split it into speech segments.
+
+        Args:
+            audio (sr.AudioData): The clip
+            threshold (float): Energy threshold (16-bit RMS) separating speech from noise
+
+        Returns:
+            list: sr.AudioData segments, empty if the clip has no speech
+        """
+        energies = frame_energies(audio)
+        ranges = self.segment_ranges(self.speech_runs(energies, threshold), len(energies))
+        frame_bytes = max(int(audio.sample_rate * FRAME_SECONDS), 1) * audio.sample_width
+        segments = [
+            sr.AudioData(audio.frame_data[start * frame_bytes:stop * frame_bytes], audio.sample_rate, audio.sample_width)
+            for start, stop in ranges
+        ]
+
+        clip_seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        kept_seconds = sum(stop - start for start, stop in ranges) * FRAME_SECONDS
+        with self._lock:
+            self.clips += 1
+            self.input_seconds += clip_seconds
+            self.trimmed_seconds += max(clip_seconds - kept_seconds, 0.0)
+            self.segments += len(segments)
+            if not segments:
+                self.rejected_clips += 1
+            elif len(segments) > 1:
+                self.split_clips += 1
+        return segments
+
+    def stats(self):
+        """Return VAD counters suitable for a metrics endpoint."""
+        with self._lock:
+            return {
+                'clips': self.clips,
+                'rejected_clips': self.rejected_clips,
+                'split_clips': self.split_clips,
+                'segments': self.segments,
+                'input_seconds': self.input_seconds,
+                'trimmed_seconds': self.trimmed_seconds
+            }
+
+def transcribe_segments(segments, recognize):
+    """
+    Recognize each speech segment and join the transcripts.
+
+    Segments without intelligible speech are skipped; sr.UnknownValueError is
+    raised only if none of them could be understood.
+    """
+    texts = []
+    for segment in segments:
+        try:
+            texts.append(recognize(segment))
+        except sr.UnknownValueError:
+            continue
+    if not texts:
+        raise sr.UnknownValueError()
+    return ' '.join(texts)
+
+def create_voice_activity_detector():
+    """Create a VoiceActivityDetector configured by VAD_MAX_SEGMENT_SECONDS."""
+    return VoiceActivityDetector(max_segment_seconds=float(os.getenv('VAD_MAX_SEGMENT_SECONDS', '15')))
+
+def create_noise_profiles():
+    """Create NoiseProfiles configured by NOISE_PROFILE_REFRESH_SECONDS and NOISE_PROFILE_DRIFT_RATIO."""
+    return NoiseProfiles(
+        refresh_seconds=float(os.getenv('NOISE_PROFILE_REFRESH_SECONDS', '300')),
+        drift_ratio=float(os.getenv('NOISE_PROFILE_DRIFT_RATIO', '2.0'))
+    )
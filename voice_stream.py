@@ -0,0 +1,356 @@
+import os
+import threading
+import time
+import numpy as np
+import speech_recognition as sr
+from voice_pipeline import FRAME_SECONDS, frame_energies
+
+class RingBuffer:
+    """Fixed-capacity byte buffer that keeps the most recent bytes written to it."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._data = bytearray(capacity)
+        self._start = 0
+        self.size = 0
+        self.dropped = 0
+
+    def write(self, chunk):
+        """Append chunk, overwriting the oldest bytes once the buffer is full."""
+        chunk = memoryview(chunk)
+        if len(chunk) >= self.capacity:
+            self.dropped += self.size + len(chunk) - self.capacity
+            self._data[:] = chunk[len(chunk) - self.capacity:]
+            self._start = 0
+            self.size = self.capacity
+            return
+        end = (self._start + self.size) % self.capacity
+        first = min(len(chunk), self.capacity - end)
+        self._data[end:end + first] = chunk[:first]
+        self._data[:len(chunk) - first] = chunk[first:]
+        overflow = max(self.size + len(chunk) - self.capacity, 0)
+        self.dropped += overflow
+        self._start = (self._start + overflow) % self.capacity
+        self.size = min(self.size + len(chunk), self.capacity)
+
+    def tail(self, count):
+        """Return the newest count bytes (or everything buffered, if less)."""
+        count = min(count, self.size)
+        start = (self._start + self.size - count) % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            return bytes(self._data[start:end])
+        return bytes(self._data[start:]) + bytes(self._data[:end - self.capacity])
+
+    def getvalue(self):
+        """Return the buffered bytes, oldest first."""
+        end = self._start + self.size
+        if end <= self.capacity:
+            return bytes(self._data[self._start:end])
+        return bytes(self._data[self._start:]) + bytes(self._data[:end - self.capacity])
+
+class VoiceStream:
+    """One student's in-progress utterance, received as raw PCM chunks.
+
+    Audio is mono signed 16-bit PCM (or another sample width given at start).
+    Socket.IO handlers run on separate threads, so chunks carry the client's
+    sequence number: early chunks wait until the gap before them is filled
+    (or, past max_pending_chunks, the gap is given up), and duplicates are
+    dropped.
+
+    Once at least interim_seconds of new audio has arrived, the stream asks
+    for an interim recognition. Each interim only recognizes the audio after
+    the previous one, cut at the quietest frame near its end so words are not
+    split, and the pieces are joined; recognition cost therefore stays linear
+    in the length of the utterance. The final transcript only recognizes the
+    audio no interim covered, and none at all if the interims covered
+    everything.
+    """
+
+    def __init__(self, recognize, sample_rate=16000, sample_width=2, max_seconds=30, interim_seconds=1.0,
+                 max_pending_chunks=64, cut_seconds=0.3):
+        self.recognize = recognize
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        capacity = int(sample_rate * sample_width * max_seconds)
+        # Whole samples only, so overwriting the oldest bytes keeps the samples aligned
+        self.buffer = RingBuffer(capacity - capacity % sample_width)
+        self.interim_bytes = int(sample_rate * sample_width * interim_seconds)
+        self.max_pending_chunks = max_pending_chunks
+        self.cut_seconds = cut_seconds
+        self.started_at = time.perf_counter()
+        self.first_interim_at = None
+        self.chunks = 0
+        self.bytes_received = 0
+        self.reordered_chunks = 0
+        self.duplicate_chunks = 0
+        self.missing_chunks = 0
+        self.interim_recognitions = 0
+        self.ending = False
+        self.closed = False
+        self._next_seq = 0
+        self._pending = {}
+        self._next_interim = self.interim_bytes
+        self._interim_running = False
+        self._texts = []
+        self._covered = 0
+        self._condition = threading.Condition()
+
+    def append(self, chunk, seq=None):
+        """
+        Add an audio chunk.
+
+        Args:
+            chunk (bytes): Whole samples of PCM audio
+            seq (int, optional): The client's 0-based chunk number (arrival order if omitted)
+
+        Returns:
+            bool: True if an interim recognition should be started now
+
+        Raises:
+            TypeError: chunk is not binary
+            ValueError: chunk does not hold whole samples
+        """
+        if not isinstance(chunk, (bytes, bytearray, memoryview)):
+            raise TypeError(f"audio chunk must be binary, not {type(chunk).__name__}")
+        if len(chunk) % self.sample_width:
+            raise ValueError(f"audio chunk of {len(chunk)} bytes is not a whole number of {self.sample_width}-byte samples")
+        with self._condition:
+            if self.closed:
+                return False
+            if seq is None:
+                seq = self._next_seq + len(self._pending)
+            if seq < self._next_seq or seq in self._pending:
+                self.duplicate_chunks += 1
+                return False
+            if seq > self._next_seq:
+                self.reordered_chunks += 1
+            self._pending[seq] = bytes(chunk)
+            self._write_pending()
+            if len(self._pending) > self.max_pending_chunks:
+                self._write_pending(skip_gaps=True)
+            self._condition.notify_all()
+            if self.ending or self._interim_running or self.bytes_received < self._next_interim:
+                return False
+            self._interim_running = True
+            self._next_interim = self.bytes_received + self.interim_bytes
+            return True
+
+    def _write_pending(self, skip_gaps=False):
+        while self._pending:
+            if self._next_seq not in self._pending:
+                if not skip_gaps:
+                    return
+                first = min(self._pending)
+                self.missing_chunks += first - self._next_seq
+                self._next_seq = first
+            chunk = self._pending.pop(self._next_seq)
+            self.buffer.write(chunk)
+            self.chunks += 1
+            self.bytes_received += len(chunk)
+            self._next_seq += 1
+
+    def _unrecognized(self):
+        """(start offset, bytes) of the audio after the last interim that is still buffered."""
+        data = self.buffer.tail(self.bytes_received - self._covered)
+        return self.bytes_received - len(data), data
+
+    def _quiet_cut(self, data):
+        """Length of data up to the end of its quietest frame within the last cut_seconds."""
+        frame_bytes = max(int(self.sample_rate * FRAME_SECONDS), 1) * self.sample_width
+        frames = len(data) // frame_bytes
+        window = min(frames, max(int(self.cut_seconds / FRAME_SECONDS), 1))
+        if window == 0:
+            return len(data)
+        start = (frames - window) * frame_bytes
+        audio = sr.AudioData(data[start:frames * frame_bytes], self.sample_rate, self.sample_width)
+        energies = frame_energies(audio)
+        if len(energies) == 0:
+            return len(data)
+        # The latest of equally quiet frames, so steady audio is cut at its end
+        quietest = len(energies) - 1 - int(np.argmin(energies[::-1]))
+        if quietest == len(energies) - 1:
+            return len(data)
+        return start + (quietest + 1) * frame_bytes
+
+    def interim_transcript(self):
+        """
+        Recognize the audio that arrived since the previous interim (run on a worker thread).
+
+        Returns:
+            str: The transcript of the utterance so far, or None if nothing was understood yet
+        """
+        with self._condition:
+            start, data = self._unrecognized()
+        cut = self._quiet_cut(data)
+        text = None
+        recognized = False
+        try:
+            if cut:
+                text = self.recognize(sr.AudioData(data[:cut], self.sample_rate, self.sample_width))
+            recognized = True
+        except sr.UnknownValueError:
+            # Silence: covered, but nothing to add
+            recognized = True
+        except sr.RequestError:
+            pass
+        finally:
+            with self._condition:
+                self.interim_recognitions += 1
+                self._interim_running = False
+                if recognized:
+                    self._covered = start + cut
+                if text:
+                    self._texts.append(text)
+                    if self.first_interim_at is None:
+                        self.first_interim_at = time.perf_counter()
+                self._condition.notify_all()
+                transcript = ' '.join(self._texts)
+        return transcript or None
+
+    def cancel_interim(self):
+        """Release an interim recognition that append() requested but could not be scheduled."""
+        with self._condition:
+            self._interim_running = False
+            self._condition.notify_all()
+
+    def final_transcript(self, expected_chunks=None, timeout=2.0):
+        """
+        Return the transcript of the whole utterance.
+
+        Waits for a running interim recognition and, if the client said how
+        many chunks it sent, for chunks still on their way (up to timeout
+        seconds). Only audio not covered by an interim is recognized.
+
+        Returns:
+            tuple: (text, reused_interim) - reused_interim is True if no new recognition was needed
+        """
+        with self._condition:
+            self.ending = True
+            deadline = time.monotonic() + timeout
+            while self._interim_running or (expected_chunks is not None and self._next_seq < expected_chunks):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 and not self._interim_running:
+                    break
+                self._condition.wait(max(remaining, 0.05))
+            self._write_pending(skip_gaps=True)
+            self.closed = True
+            _, data = self._unrecognized()
+            texts = list(self._texts)
+        if not data:
+            if texts:
+                return ' '.join(texts), True
+            raise sr.UnknownValueError()
+        try:
+            text = self.recognize(sr.AudioData(data, self.sample_rate, self.sample_width))
+        except sr.UnknownValueError:
+            if texts:
+                return ' '.join(texts), False
+            raise
+        return ' '.join(texts + [text]), False
+
+class VoiceStreams:
+    """Active voice streams keyed by Socket.IO session id, with streaming metrics."""
+
+    def __init__(self, recognize, max_seconds=30, interim_seconds=1.0, end_timeout=2.0):
+        self.recognize = recognize
+        self.max_seconds = max_seconds
+        self.interim_seconds = interim_seconds
+        self.end_timeout = end_timeout
+        self._streams = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.finished = 0
+        self.chunks = 0
+        self.bytes_received = 0
+        self.bytes_dropped = 0
+        self.reordered_chunks = 0
+        self.duplicate_chunks = 0
+        self.missing_chunks = 0
+        self.interim_recognitions = 0
+        self.final_recognitions = 0
+        self.reused_interim = 0
+        self.total_first_interim_seconds = 0.0
+        self.streams_with_interim = 0
+
+    def start(self, sid, sample_rate=16000, sample_width=2):
+        """Begin a new utterance for sid, replacing any unfinished one."""
+        stream = VoiceStream(self.recognize, sample_rate, sample_width, self.max_seconds, self.interim_seconds)
+        with self._lock:
+            self._streams[sid] = stream
+            self.started += 1
+        return stream
+
+    def get(self, sid):
+        return self._streams.get(sid)
+
+    def discard(self, sid, stream=None):
+        """Forget sid's stream (only if it is still stream, when given)."""
+        with self._lock:
+            if stream is None or self._streams.get(sid) is stream:
+                self._streams.pop(sid, None)
+
+    def finish(self, sid):
+        """
+        Mark sid's stream as ending and return it (None if it never started or already ended).
+
+        The stream stays registered so chunks still in flight reach it; call
+        discard(sid, stream) once its final transcript is taken.
+        """
+        with self._lock:
+            stream = self._streams.get(sid)
+            if stream is None or stream.ending:
+                return None
+            stream.ending = True
+            self.finished += 1
+        return stream
+
+    def record(self, stream, reused_interim):
+        """Fold a finished stream's counters into the totals."""
+        with self._lock:
+            self.chunks += stream.chunks
+            self.bytes_received += stream.bytes_received
+            self.bytes_dropped += stream.buffer.dropped
+            self.reordered_chunks += stream.reordered_chunks
+            self.duplicate_chunks += stream.duplicate_chunks
+            self.missing_chunks += stream.missing_chunks
+            self.interim_recognitions += stream.interim_recognitions
+            if reused_interim:
+                self.reused_interim += 1
+            else:
+                self.final_recognitions += 1
+            if stream.first_interim_at is not None:
+                self.streams_with_interim += 1
+                self.total_first_interim_seconds += stream.first_interim_at - stream.started_at
+
+    def stats(self):
+        """Return streaming counters suitable for a metrics endpoint."""
+        with self._lock:
+            return {
+                'active': len(self._streams),
+                'started': self.started,
+                'finished': self.finished,
+                'chunks': self.chunks,
+                'bytes_received': self.bytes_received,
+                'bytes_dropped': self.bytes_dropped,
+                'reordered_chunks': self.reordered_chunks,
+                'duplicate_chunks': self.duplicate_chunks,
+                'missing_chunks': self.missing_chunks,
+                'interim_recognitions': self.interim_recognitions,
+                'final_recognitions': self.final_recognitions,
+                'reused_interim': self.reused_interim,
+                'avg_first_interim_ms': (self.total_first_interim_seconds / self.streams_with_interim * 1000
+                                         if self.streams_with_interim else None)
+            }
+
+def create_voice_streams(recognize):
+    """
+    Create VoiceStreams configured by VOICE_STREAM_MAX_SECONDS, VOICE_INTERIM_SECONDS
+    and VOICE_STREAM_END_TIMEOUT (seconds to wait for chunks still in flight at the end).
+    """
+    return VoiceStreams(
+        recognize,
+        max_seconds=float(os.getenv('VOICE_STREAM_MAX_SECONDS', '30')),
+        interim_seconds=float(os.getenv('VOICE_INTERIM_SECONDS', '1.0')),
+        end_timeout=float(os.getenv('VOICE_STREAM_END_TIMEOUT', '2'))
+    )
@@ -0,0 +1,111 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class WorkerPool:
+    """Bounded thread pool for blocking work triggered by Socket.IO events.
+
+    Socket.IO handlers hand slow work (internet search, speech recognition,
+    LLM calls) to the pool and return immediately, so one student's slow
+    request no longer holds up every other connected client. At most
+    max_workers jobs run at once and at most queue_limit more wait for a
+    worker; beyond that submit() refuses the job so the caller can tell
+    the student to retry instead of letting the backlog grow without bound.
+    With max_workers=0 jobs run inline on the calling thread.
+    """
+
+    def __init__(self, name, max_workers=8, queue_limit=64):
+        self.name = name
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name) if max_workers > 0 else None
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def submit(self, job, *args, on_result=None):
+        """
+        Run job(*args) on a worker thread.
+
+        Args:
+            job (callable): The blocking work
+            *args: Arguments passed to job
+            on_result (callable, optional): Called with job's return value on the worker thread
+
+        Returns:
+            bool: True if the job was accepted, False if the queue is full
+        """
+        with self._lock:
+            if self._executor is not None and self.queued >= self.queue_limit + max(self.max_workers - self.active, 0):
+                self.rejected += 1
+                return False
+            self.submitted += 1
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        if self._executor is None:
+            self._run(time.perf_counter(), job, args, on_result)
+        else:
+            self._executor.submit(self._run, time.perf_counter(), job, args, on_result)
+        return True
+
+    def _run(self, submitted_at, job, args, on_result):
+        started_at = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.total_wait_seconds += started_at - submitted_at
+        try:
+            result = job(*args)
+            if on_result is not None:
+                on_result(result)
+            failed = False
+        except Exception as e:
+            print(f"Error in {self.name} worker: {str(e)}")
+            failed = True
+        with self._lock:
+            self.active -= 1
+            self.total_run_seconds += time.perf_counter() - started_at
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and optionally wait for running jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def stats(self):
+        """Return pool counters suitable for a metrics endpoint."""
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                'max_workers': self.max_workers,
+                'queue_limit': self.queue_limit,
+                'active': self.active,
+                'queue_depth': self.queued,
+                'peak_queue_depth': self.peak_queued,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'avg_wait_ms': self.total_wait_seconds / finished * 1000 if finished else 0.0,
+                'avg_run_ms': self.total_run_seconds / finished * 1000 if finished else 0.0
+            }
+
+def create_worker_pool(name):
+    """Create a WorkerPool sized by CHAT_WORKERS and CHAT_QUEUE_LIMIT."""
+    return WorkerPool(
+        name,
+        max_workers=int(os.getenv('CHAT_WORKERS', '8')),
+        queue_limit=int(os.getenv('CHAT_QUEUE_LIMIT', '64'))
+    )